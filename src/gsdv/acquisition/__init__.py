@@ -4,6 +4,7 @@ from gsdv.acquisition.acquisition_engine import (
     AcquisitionEngine,
     AcquisitionState,
     AcquisitionStats,
+    SampleBatchCallback,
     SampleCallback,
 )
 from gsdv.acquisition.ring_buffer import RingBuffer, RingBufferStats
@@ -14,5 +15,6 @@ __all__ = [
     "AcquisitionStats",
     "RingBuffer",
     "RingBufferStats",
+    "SampleBatchCallback",
     "SampleCallback",
 ]
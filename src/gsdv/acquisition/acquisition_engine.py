@@ -5,15 +5,18 @@ the ring buffer. It runs a dedicated receive thread that never blocks on
 UI or I/O operations, ensuring sustained 1000Hz throughput.
 """
 
-import queue
 import threading
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Callable, Optional
 
+import numpy as np
+
 from gsdv.acquisition.ring_buffer import RingBuffer, RingBufferStats
-from gsdv.models import SampleRecord
+from gsdv.acquisition.scheduling import apply_thread_scheduling
+from gsdv.acquisition.spsc_ring import SpscRing
+from gsdv.models import SAMPLE_DTYPE, SampleRecord
 from gsdv.protocols.rdt_udp import RdtClient
 
 
@@ -37,6 +40,7 @@ class AcquisitionStats:
     packets_lost: int
     receive_errors: int
     samples_per_second: float
+    callback_errors: int = 0
 
     @property
     def loss_ratio(self) -> float:
@@ -45,8 +49,9 @@ class AcquisitionStats:
         return self.packets_lost / total if total > 0 else 0.0
 
 
-# Callback type for sample notifications
+# Callback types for sample notifications
 SampleCallback = Callable[[SampleRecord], None]
+SampleBatchCallback = Callable[[list[SampleRecord]], None]
 
 
 class AcquisitionEngine:
@@ -78,6 +83,22 @@ class AcquisitionEngine:
     # Default buffer size: 60 seconds at 1000Hz
     DEFAULT_BUFFER_CAPACITY = 60_000
 
+    # Default kernel receive buffer: absorbs receive-thread stalls of several seconds
+    DEFAULT_RECV_BUFFER_BYTES = 4 * 1024 * 1024
+
+    # Sample rate is measured over windows of at least this length
+    RATE_WINDOW_NS = 2_000_000_000
+
+    # Interval between reads of the client's packet loss counter
+    CLIENT_STATS_INTERVAL_NS = 100_000_000
+
+    # Maximum samples pulled from the socket per ring buffer write
+    RECEIVE_BATCH_SIZE = 100
+
+    # Staged samples are written to the ring buffer once the oldest is this
+    # old, so readers see new data within a few ms rather than per full batch
+    RECEIVE_FLUSH_INTERVAL_NS = 5_000_000
+
     def __init__(
         self,
         ip: str,
@@ -85,6 +106,10 @@ class AcquisitionEngine:
         buffer_capacity: int = DEFAULT_BUFFER_CAPACITY,
         receive_timeout: float = 0.1,
         decimation_factor: int = 1,
+        recv_buffer_bytes: int = DEFAULT_RECV_BUFFER_BYTES,
+        cpu_affinity: Optional[int] = None,
+        callback_cpu_affinity: Optional[int] = None,
+        realtime_priority: Optional[int] = None,
     ) -> None:
         """Initialize the acquisition engine.
 
@@ -94,10 +119,25 @@ class AcquisitionEngine:
             buffer_capacity: Ring buffer capacity in samples (default 60000).
             receive_timeout: Socket timeout in seconds for clean shutdown.
             decimation_factor: Only store every Nth sample (1=all, 10=100Hz from 1000Hz).
+            recv_buffer_bytes: Requested UDP socket receive buffer size (default 4 MiB).
+                The kernel may clamp this to net.core.rmem_max; see
+                RdtClient.effective_receive_buffer_size for the granted size.
+            cpu_affinity: CPU to pin the receive thread to (Linux only). For
+                full benefit, reserve that CPU with the isolcpus=N (and
+                ideally nohz_full=N) kernel boot parameters.
+            callback_cpu_affinity: CPU to pin the callback thread to. Use a
+                different core from cpu_affinity, on the same socket.
+            realtime_priority: SCHED_FIFO priority (1-99) for the receive
+                thread, or None for normal scheduling. Requires CAP_SYS_NICE;
+                ignored if not permitted.
         """
         self._ip = ip
         self._port = port
         self._receive_timeout = receive_timeout
+        self._recv_buffer_bytes = recv_buffer_bytes
+        self._cpu_affinity = cpu_affinity
+        self._callback_cpu_affinity = callback_cpu_affinity
+        self._realtime_priority = realtime_priority
         self._decimation_factor = max(1, decimation_factor)
         self._decimation_counter = 0
 
@@ -116,12 +156,28 @@ class AcquisitionEngine:
         self._packets_received = 0
         self._packets_lost = 0
         self._receive_errors = 0
-        self._rate_samples: list[tuple[float, int]] = []
-        self._stats_lock = threading.Lock()
+        self._callback_errors = 0
+        # Rate window: (time, packet count) at the start of the current and
+        # previous window, plus the time of the newest packet. Plain ints only.
+        self._rate_window_start_ns = 0
+        self._rate_window_start_count = 0
+        self._rate_prev_start_ns = 0
+        self._rate_prev_start_count = 0
+        self._rate_last_ns = 0
+        # Counters above are written only by the receive thread, which
+        # publishes them here as one tuple; a single attribute store is atomic
+        # under the GIL, so stats() reads a consistent snapshot without a lock.
+        # (packets_received, packets_lost, receive_errors, samples_per_second,
+        #  callback_errors)
+        self._stats_snapshot: tuple[int, int, int, float, int] = (0, 0, 0, 0.0, 0)
 
         # Optional sample callback
         self._sample_callback: Optional[SampleCallback] = None
-        self._callback_queue: queue.Queue[SampleRecord] = queue.Queue(maxsize=1000)
+        self._callback_inline = False
+        self._sample_batch_callback: Optional[SampleBatchCallback] = None
+        # Created on first queued callback registration, so an engine with no
+        # callbacks never touches a queue from the receive thread
+        self._callback_queue: Optional[SpscRing[SampleRecord]] = None
         self._callback_thread: Optional[threading.Thread] = None
 
     @property
@@ -150,16 +206,67 @@ class AcquisitionEngine:
         """Direct access to the ring buffer."""
         return self._buffer
 
-    def set_sample_callback(self, callback: Optional[SampleCallback]) -> None:
+    def set_sample_callback(
+        self, callback: Optional[SampleCallback], inline: bool = False
+    ) -> None:
         """Set a callback to be invoked for each received sample.
 
-        The callback runs in a separate thread to avoid blocking the receive
-        thread. If the callback queue fills up, samples are dropped.
+        By default the callback runs in a separate thread to avoid blocking the
+        receive thread. If the callback queue fills up, samples are dropped.
 
         Args:
             callback: Function to call with each SampleRecord, or None to disable.
+            inline: Call the callback directly on the receive thread with no
+                queue. Only for callbacks that return in microseconds; anything
+                slower stalls the receive thread and causes packet loss. An
+                inline callback that raises is counted in
+                AcquisitionStats.callback_errors and unregistered, so it cannot
+                take down the receive thread.
         """
         self._sample_callback = callback
+        self._callback_inline = inline
+        self._configure_dispatch()
+
+    def set_sample_batch_callback(self, callback: Optional[SampleBatchCallback]) -> None:
+        """Set a callback to be invoked with batches of received samples.
+
+        Runs on the callback thread like set_sample_callback(), but receives
+        every sample queued since its last call as one list, so the thread
+        wakes and enters Python once per batch rather than once per sample.
+        Can be combined with a per-sample callback; both see every sample.
+
+        Args:
+            callback: Function to call with a list of SampleRecords, or None to disable.
+        """
+        self._sample_batch_callback = callback
+        self._configure_dispatch()
+
+    def _uses_callback_queue(self) -> bool:
+        """Whether samples must be queued for the callback thread."""
+        return self._sample_batch_callback is not None or (
+            self._sample_callback is not None and not self._callback_inline
+        )
+
+    def _configure_dispatch(self) -> None:
+        """Create the callback queue and thread on first queued callback."""
+        if not self._uses_callback_queue():
+            return
+        if self._callback_queue is None:
+            self._callback_queue = SpscRing(capacity=1024)
+        with self._state_lock:
+            if self._state == AcquisitionState.RUNNING:
+                self._start_callback_thread()
+
+    def _start_callback_thread(self) -> None:
+        """Start the callback dispatch thread if it is not already running."""
+        if self._callback_thread is not None and self._callback_thread.is_alive():
+            return
+        self._callback_thread = threading.Thread(
+            target=self._callback_loop,
+            name="AcquisitionCallback",
+            daemon=True,
+        )
+        self._callback_thread.start()
 
     def start(self) -> None:
         """Start data acquisition.
@@ -178,15 +285,20 @@ class AcquisitionEngine:
 
         # Reset state
         self._stop_event.clear()
-        with self._stats_lock:
-            self._packets_received = 0
-            self._packets_lost = 0
-            self._receive_errors = 0
-            self._rate_samples.clear()
+        self._packets_received = 0
+        self._packets_lost = 0
+        self._receive_errors = 0
+        self._callback_errors = 0
+        self._reset_rate()
+        self._publish_stats()
         self._buffer.clear()
+        if self._callback_queue is not None:
+            self._callback_queue.clear()
 
         # Create and start client
-        self._client = RdtClient(self._ip, self._port)
+        self._client = RdtClient(
+            self._ip, self._port, receive_buffer_size=self._recv_buffer_bytes
+        )
         self._client.start_streaming()
 
         # Start receive thread
@@ -197,16 +309,10 @@ class AcquisitionEngine:
         )
         self._receive_thread.start()
 
-        # Start callback thread if callback is set
-        if self._sample_callback is not None:
-            self._callback_thread = threading.Thread(
-                target=self._callback_loop,
-                name="AcquisitionCallback",
-                daemon=True,
-            )
-            self._callback_thread.start()
-
         with self._state_lock:
+            # Start callback thread if a queued callback is set
+            if self._uses_callback_queue():
+                self._start_callback_thread()
             self._state = AcquisitionState.RUNNING
 
     def stop(self) -> None:
@@ -259,15 +365,16 @@ class AcquisitionEngine:
         Returns:
             AcquisitionStats with state, buffer stats, and packet statistics.
         """
-        with self._stats_lock:
-            return AcquisitionStats(
-                state=self.state,
-                buffer_stats=self._buffer.stats(),
-                packets_received=self._packets_received,
-                packets_lost=self._packets_lost,
-                receive_errors=self._receive_errors,
-                samples_per_second=self._calculate_rate(),
-            )
+        received, lost, errors, rate, callback_errors = self._stats_snapshot
+        return AcquisitionStats(
+            state=self.state,
+            buffer_stats=self._buffer.stats(),
+            packets_received=received,
+            packets_lost=lost,
+            receive_errors=errors,
+            samples_per_second=rate,
+            callback_errors=callback_errors,
+        )
 
     def get_latest(self, n: int) -> Optional[dict]:
         """Get the n most recent samples from the buffer.
@@ -286,19 +393,35 @@ class AcquisitionEngine:
         if self._client is None:
             return
 
+        apply_thread_scheduling(self._cpu_affinity, self._realtime_priority)
+
+        client = self._client
+        flush_interval_ns = self.RECEIVE_FLUSH_INTERVAL_NS
+        last_client_stats_read_ns = 0
+        # Arrival time of the most recently staged sample
+        last_staged_ns = 0
         while not self._stop_event.is_set():
+            # Rows staged for one ring buffer write, in SAMPLE_DTYPE field order,
+            # and the samples they came from (kept only for callbacks)
+            rows: list[tuple[int, int, int, int, tuple[int, ...]]] = []
+            samples: list[SampleRecord] = []
+            batch_start_ns = 0
+            # Resolve callback targets once per batch so the per-sample path
+            # is a single local test when nothing is registered
+            inline_callback = self._sample_callback if self._callback_inline else None
+            queue = self._callback_queue if self._uses_callback_queue() else None
+            dispatch = inline_callback is not None or queue is not None
             try:
-                for sample in self._client.receive_samples(
+                for sample in client.receive_samples(
                     timeout=self._receive_timeout,
-                    max_samples=100,  # Process in batches for efficiency
+                    max_samples=self.RECEIVE_BATCH_SIZE,
                 ):
                     if self._stop_event.is_set():
                         break
 
                     # Update statistics for all received packets
-                    with self._stats_lock:
-                        self._packets_received += 1
-                        self._update_rate()
+                    self._packets_received += 1
+                    self._update_rate()
 
                     # Apply decimation - only process every Nth sample
                     self._decimation_counter += 1
@@ -306,67 +429,166 @@ class AcquisitionEngine:
                         continue
                     self._decimation_counter = 0
 
-                    # Write to ring buffer (never blocks)
-                    self._buffer.append(
-                        t_monotonic_ns=sample.t_monotonic_ns,
-                        rdt_sequence=sample.rdt_sequence,
-                        ft_sequence=sample.ft_sequence,
-                        status=sample.status,
-                        counts=sample.counts,
+                    # Stage for the batched ring buffer write
+                    t_ns = sample.t_monotonic_ns
+                    if not rows:
+                        batch_start_ns = t_ns
+                    rows.append(
+                        (
+                            t_ns,
+                            sample.rdt_sequence,
+                            sample.ft_sequence,
+                            sample.status,
+                            sample.counts,
+                        )
                     )
-
-                    # Queue for callback (non-blocking)
-                    if self._sample_callback is not None:
-                        try:
-                            self._callback_queue.put_nowait(sample)
-                        except queue.Full:
-                            pass  # Drop sample rather than block
-
-                # Update packet loss from client statistics
-                client_stats = self._client.statistics
-                with self._stats_lock:
-                    self._packets_lost = client_stats.packets_lost
+                    if dispatch:
+                        samples.append(sample)
+
+                    # Write once the oldest staged row is a flush interval old,
+                    # or straight away when samples arrive further apart than
+                    # that (a slow stream gains nothing from batching)
+                    if t_ns - batch_start_ns >= flush_interval_ns or (
+                        t_ns - last_staged_ns >= flush_interval_ns
+                    ):
+                        inline_callback = self._flush_rows(
+                            rows, samples, inline_callback, queue
+                        )
+                        rows = []
+                        samples = []
+                    last_staged_ns = t_ns
+
+                # Refresh packet loss from client statistics at most every 100ms
+                now_ns = time.monotonic_ns()
+                if now_ns - last_client_stats_read_ns > self.CLIENT_STATS_INTERVAL_NS:
+                    self._packets_lost = client.statistics.packets_lost
+                    last_client_stats_read_ns = now_ns
 
             except OSError:
-                with self._stats_lock:
-                    self._receive_errors += 1
+                self._receive_errors += 1
                 # Brief pause before retry on error
                 if not self._stop_event.is_set():
                     time.sleep(0.01)
+            finally:
+                # Write what is still staged (never blocks), including any
+                # samples received before an error interrupted the batch
+                if rows:
+                    self._flush_rows(rows, samples, inline_callback, queue)
+                self._publish_stats()
+
+        # Final loss count so stats() after stop() is exact
+        self._packets_lost = client.statistics.packets_lost
+        self._publish_stats()
+
+    def _flush_rows(
+        self,
+        rows: list[tuple[int, int, int, int, tuple[int, ...]]],
+        samples: list[SampleRecord],
+        inline_callback: Optional[SampleCallback],
+        queue: Optional[SpscRing[SampleRecord]],
+    ) -> Optional[SampleCallback]:
+        """Write staged rows to the ring buffer, then dispatch their samples.
+
+        Callbacks run after the write, so a callback that reads the buffer
+        always sees the sample it was given.
+
+        Returns:
+            The inline callback to keep using, or None if it raised and was dropped.
+        """
+        # One conversion per batch instead of five numpy scalar stores per sample
+        self._buffer.append_records(np.array(rows, dtype=SAMPLE_DTYPE))
+
+        # Dispatch to callbacks (queueing never blocks; drops when full)
+        for sample in samples:
+            if inline_callback is not None:
+                try:
+                    inline_callback(sample)
+                except Exception:  # noqa: BLE001
+                    # Left in place, it would escape and end the receive
+                    # thread while the engine still reports RUNNING
+                    self._callback_errors += 1
+                    self._drop_inline_callback(inline_callback)
+                    inline_callback = None
+            if queue is not None:
+                queue.push(sample)
+        return inline_callback
+
+    def _drop_inline_callback(self, callback: SampleCallback) -> None:
+        """Unregister a failed inline callback unless it was already replaced."""
+        if self._sample_callback is callback and self._callback_inline:
+            self._sample_callback = None
+            self._callback_inline = False
 
     def _callback_loop(self) -> None:
         """Callback dispatch loop running in dedicated thread."""
+        apply_thread_scheduling(self._callback_cpu_affinity, None)
+
+        ring = self._callback_queue
+        if ring is None:
+            return
         while not self._stop_event.is_set():
-            try:
-                sample = self._callback_queue.get(timeout=0.1)
-                if self._sample_callback is not None:
-                    self._sample_callback(sample)
-            except queue.Empty:
+            if not ring.wait(timeout=0.1):
+                continue
+            batch = ring.drain()
+            if not batch:
                 continue
 
-    def _update_rate(self) -> None:
-        """Update sample rate tracking (called with stats_lock held)."""
-        now = time.monotonic()
-        self._rate_samples.append((now, self._packets_received))
-
-        # Keep only last 2 seconds of samples
-        cutoff = now - 2.0
-        while self._rate_samples and self._rate_samples[0][0] < cutoff:
-            self._rate_samples.pop(0)
+            batch_callback = self._sample_batch_callback
+            if batch_callback is not None:
+                batch_callback(batch)
+
+            callback = self._sample_callback
+            if callback is not None and not self._callback_inline:
+                for sample in batch:
+                    callback(sample)
+
+    def _publish_stats(self) -> None:
+        """Publish a counter snapshot for stats() (receive thread only)."""
+        self._stats_snapshot = (
+            self._packets_received,
+            self._packets_lost,
+            self._receive_errors,
+            self._calculate_rate(),
+            self._callback_errors,
+        )
 
-    def _calculate_rate(self) -> float:
-        """Calculate current sample rate (called with stats_lock held)."""
-        if len(self._rate_samples) < 2:
-            return 0.0
+    def _reset_rate(self) -> None:
+        """Clear sample rate tracking."""
+        self._rate_window_start_ns = 0
+        self._rate_window_start_count = 0
+        self._rate_prev_start_ns = 0
+        self._rate_prev_start_count = 0
+        self._rate_last_ns = 0
 
-        oldest_time, oldest_count = self._rate_samples[0]
-        newest_time, newest_count = self._rate_samples[-1]
+    def _update_rate(self) -> None:
+        """Update sample rate tracking (receive thread only)."""
+        now_ns = time.monotonic_ns()
+        self._rate_last_ns = now_ns
+        if self._rate_window_start_ns == 0:
+            self._rate_window_start_ns = now_ns
+            self._rate_window_start_count = self._packets_received
+        elif now_ns - self._rate_window_start_ns > self.RATE_WINDOW_NS:
+            # Roll over, keeping the previous window start so the rate always
+            # spans 2-4s of history rather than restarting from a few packets
+            self._rate_prev_start_ns = self._rate_window_start_ns
+            self._rate_prev_start_count = self._rate_window_start_count
+            self._rate_window_start_ns = now_ns
+            self._rate_window_start_count = self._packets_received
 
-        elapsed = newest_time - oldest_time
-        if elapsed <= 0:
+    def _calculate_rate(self) -> float:
+        """Calculate current sample rate (receive thread only)."""
+        if self._rate_prev_start_ns:
+            start_ns = self._rate_prev_start_ns
+            start_count = self._rate_prev_start_count
+        else:
+            start_ns = self._rate_window_start_ns
+            start_count = self._rate_window_start_count
+
+        elapsed_ns = self._rate_last_ns - start_ns
+        if start_ns == 0 or elapsed_ns <= 0:
             return 0.0
 
-        return (newest_count - oldest_count) / elapsed
+        return (self._packets_received - start_count) * 1e9 / elapsed_ns
 
     def __enter__(self) -> "AcquisitionEngine":
         """Context manager entry."""
@@ -6,12 +6,18 @@ allocation overhead.
 """
 
 import threading
+import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional, Sequence, TypeVar
 
 import numpy as np
 from numpy.typing import NDArray
 
+_R = TypeVar("_R")
+
+# Per-channel keys returned by RingBuffer.get_latest(channels=...), in count order
+CHANNEL_KEYS = ("fx", "fy", "fz", "tx", "ty", "tz")
+
 
 @dataclass(frozen=True, slots=True)
 class RingBufferStats:
@@ -44,10 +50,21 @@ class RingBuffer:
     - rdt_sequence: uint32 packet sequence numbers
     - ft_sequence: uint32 sensor sample sequence numbers
     - status: uint32 sensor status codes
-    - counts: int32 array of shape (capacity, 6) for [Fx, Fy, Fz, Tx, Ty, Tz]
-
-    Thread safety: All public methods are thread-safe. The buffer uses a single
-    lock for simplicity and correctness over maximum throughput.
+    - counts: int32 [Fx, Fy, Fz, Tx, Ty, Tz], stored channel-major (one
+      contiguous row per axis) so single-channel reads touch only that axis
+
+    Each field is mirrored: the backing arrays hold 2 * capacity entries and
+    every write lands at both i and i + capacity. Any window of up to
+    `capacity` samples ending at the newest one is therefore a single
+    contiguous slice, so reads never need index arrays or to stitch the
+    wrap-around back together.
+
+    Thread safety: All public methods are thread-safe. Writers serialize on a
+    lock; readers never take it. Instead each write bumps a sequence counter
+    before and after mutating (odd while in progress), and readers retry if
+    the counter moved while they copied. Writes are short and rare relative
+    to the copy cost of a UI read, so retries are uncommon and a slow reader
+    can never hold up the receive thread.
 
     Example:
         >>> buffer = RingBuffer(capacity=60000)  # 60s at 1000Hz
@@ -77,14 +94,16 @@ class RingBuffer:
         self._capacity = capacity
         self._lock = threading.Lock()
 
-        # Pre-allocate arrays
-        self._timestamps = np.zeros(capacity, dtype=np.int64)
-        self._rdt_sequence = np.zeros(capacity, dtype=np.uint32)
-        self._ft_sequence = np.zeros(capacity, dtype=np.uint32)
-        self._status = np.zeros(capacity, dtype=np.uint32)
-        self._counts = np.zeros((capacity, 6), dtype=np.int32)
+        # Pre-allocate mirrored arrays uninitialized; _size tracks which entries are valid
+        mirrored = 2 * capacity
+        self._timestamps = np.empty(mirrored, dtype=np.int64)
+        self._rdt_sequence = np.empty(mirrored, dtype=np.uint32)
+        self._ft_sequence = np.empty(mirrored, dtype=np.uint32)
+        self._status = np.empty(mirrored, dtype=np.uint32)
+        self._counts = np.empty((6, mirrored), dtype=np.int32)
 
         # Buffer state
+        self._seq = 0  # Write sequence counter, odd while a write is in progress
         self._head = 0  # Next write position
         self._size = 0  # Current number of valid entries
         self._total_written = 0  # Total samples ever written
@@ -95,6 +114,20 @@ class RingBuffer:
         """Maximum number of samples the buffer can hold."""
         return self._capacity
 
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes allocated for sample storage (including the mirror)."""
+        return sum(
+            arr.nbytes
+            for arr in (
+                self._timestamps,
+                self._rdt_sequence,
+                self._ft_sequence,
+                self._status,
+                self._counts,
+            )
+        )
+
     def append(
         self,
         t_monotonic_ns: int,
@@ -115,21 +148,103 @@ class RingBuffer:
             counts: Raw force/torque counts [Fx, Fy, Fz, Tx, Ty, Tz].
         """
         with self._lock:
+            self._seq += 1
             idx = self._head
 
-            self._timestamps[idx] = t_monotonic_ns
-            self._rdt_sequence[idx] = rdt_sequence
-            self._ft_sequence[idx] = ft_sequence
-            self._status[idx] = status
-            self._counts[idx, :] = counts
+            for i in (idx, idx + self._capacity):
+                self._timestamps[i] = t_monotonic_ns
+                self._rdt_sequence[i] = rdt_sequence
+                self._ft_sequence[i] = ft_sequence
+                self._status[i] = status
+                self._counts[:, i] = counts
 
-            self._head = (self._head + 1) % self._capacity
+            head = idx + 1
+            self._head = 0 if head == self._capacity else head
             self._total_written += 1
 
             if self._size < self._capacity:
                 self._size += 1
             else:
                 self._overwrites += 1
+            self._seq += 1
+
+    def append_batch(
+        self,
+        t_monotonic_ns: NDArray[np.int64],
+        rdt_sequence: NDArray[np.uint32],
+        ft_sequence: NDArray[np.uint32],
+        status: NDArray[np.uint32],
+        counts: NDArray[np.int32],
+    ) -> None:
+        """Append a batch of samples to the buffer.
+
+        Equivalent to calling append() once per row, but takes the lock once
+        and writes each field as a few contiguous slices. If the batch
+        is larger than the buffer, only the newest `capacity` rows are kept.
+
+        Args:
+            t_monotonic_ns: Monotonic timestamps in nanoseconds, shape (N,).
+            rdt_sequence: RDT packet sequence numbers, shape (N,).
+            ft_sequence: Sensor sample sequence numbers, shape (N,).
+            status: Sensor status codes, shape (N,).
+            counts: Raw force/torque counts, shape (N, 6).
+        """
+        n = len(t_monotonic_ns)
+        if n == 0:
+            return
+
+        with self._lock:
+            self._seq += 1
+            # Rows that would be overwritten within this same batch are skipped
+            skip = max(0, n - self._capacity)
+            written = n - skip
+
+            cap = self._capacity
+            start = self._head
+            end = start + written
+            first = min(end, cap) - start
+            second = written - first
+
+            for dst, src in (
+                (self._timestamps, t_monotonic_ns),
+                (self._rdt_sequence, rdt_sequence),
+                (self._ft_sequence, ft_sequence),
+                (self._status, status),
+                (self._counts.T, counts),
+            ):
+                chunk = src[skip:skip + first]
+                dst[start:start + first] = chunk
+                dst[start + cap:start + cap + first] = chunk
+                if second:
+                    chunk = src[skip + first:n]
+                    dst[:second] = chunk
+                    dst[cap:cap + second] = chunk
+
+            # start < cap and written <= cap, so one conditional subtract wraps
+            self._head = end - cap if end >= cap else end
+            self._total_written += n
+
+            free = self._capacity - self._size
+            if n <= free:
+                self._size += n
+            else:
+                self._size = self._capacity
+                self._overwrites += n - free
+            self._seq += 1
+
+    def append_records(self, records: NDArray[np.void]) -> None:
+        """Append a structured array of samples to the buffer.
+
+        Args:
+            records: Samples with dtype SAMPLE_DTYPE, shape (N,).
+        """
+        self.append_batch(
+            t_monotonic_ns=records["t_monotonic_ns"],
+            rdt_sequence=records["rdt_sequence"],
+            ft_sequence=records["ft_sequence"],
+            status=records["status"],
+            counts=records["counts"],
+        )
 
     def stats(self) -> RingBufferStats:
         """Get current buffer statistics.
@@ -137,27 +252,33 @@ class RingBuffer:
         Returns:
             RingBufferStats with capacity, size, total_written, overwrites.
         """
-        with self._lock:
-            return RingBufferStats(
+        return self._read(
+            lambda: RingBufferStats(
                 capacity=self._capacity,
                 size=self._size,
                 total_written=self._total_written,
                 overwrites=self._overwrites,
             )
+        )
 
-    def get_latest(self, n: int) -> Optional[dict[str, NDArray]]:
+    def get_latest(
+        self, n: int, channels: Optional[Sequence[int]] = None
+    ) -> Optional[dict[str, NDArray]]:
         """Get the n most recent samples.
 
         Args:
             n: Number of samples to retrieve (clamped to available size).
+            channels: Channel indices (0=Fx .. 5=Tz) to return individually.
+                When given, "counts" is omitted and each requested channel is
+                returned as a 1-D array under its CHANNEL_KEYS name ("fx", ...),
+                so unrequested axes are never copied.
 
         Returns:
             Dictionary with arrays for timestamps, rdt_sequence, ft_sequence,
-            status, and counts. Returns None if buffer is empty.
-            Arrays are copies, safe to modify.
+            status, and counts (shape (n, 6)) or the requested channels.
+            Returns None if buffer is empty. Arrays are copies, safe to modify.
         """
-        with self._lock:
-            return self._get_latest_unlocked(n)
+        return self._read(lambda: self._get_latest_unlocked(n, channels))
 
     def get_all(self) -> Optional[dict[str, NDArray]]:
         """Get all samples in chronological order.
@@ -166,42 +287,52 @@ class RingBuffer:
             Dictionary with arrays for all fields. Returns None if buffer is empty.
             Arrays are copies, safe to modify.
         """
-        with self._lock:
-            return self._get_latest_unlocked(self._size)
-
-    def _get_latest_unlocked(self, n: int) -> Optional[dict[str, NDArray]]:
-        """Internal get_latest without locking (caller must hold lock)."""
-        if self._size == 0:
+        return self._read(lambda: self._get_latest_unlocked(self._capacity))
+
+    def _read(self, reader: Callable[[], _R]) -> _R:
+        """Run reader until it completes without overlapping a write."""
+        while True:
+            seq = self._seq
+            if seq & 1:
+                time.sleep(0)  # Writer mid-update; yield the GIL to it
+                continue
+            result = reader()
+            if self._seq == seq:
+                return result
+
+    def _get_latest_unlocked(
+        self, n: int, channels: Optional[Sequence[int]] = None
+    ) -> Optional[dict[str, NDArray]]:
+        """Internal get_latest without locking.
+
+        Caller must hold the lock or validate the result with the sequence
+        counter (see _read). Head and size are read once so that a concurrent
+        write can only produce a stale result, never out-of-range indices.
+        """
+        head = self._head
+        size = self._size
+        if size == 0:
             return None
 
-        n = min(n, self._size)
+        n = min(n, size)
 
-        # Calculate indices for most recent n samples
-        if self._size < self._capacity:
-            # Buffer not yet full, data starts at 0
-            start = self._size - n
-            indices = np.arange(start, self._size)
-        else:
-            # Buffer full, calculate wrapped indices
-            # Head points to next write position = oldest data
-            # Most recent is at head - 1
-            end = self._head
-            start = (end - n) % self._capacity
-            if start < end:
-                indices = np.arange(start, end)
-            else:
-                indices = np.concatenate([
-                    np.arange(start, self._capacity),
-                    np.arange(0, end),
-                ])
-
-        return {
-            "timestamps": self._timestamps[indices].copy(),
-            "rdt_sequence": self._rdt_sequence[indices].copy(),
-            "ft_sequence": self._ft_sequence[indices].copy(),
-            "status": self._status[indices].copy(),
-            "counts": self._counts[indices].copy(),
+        # The newest n samples end at head; if that would start before index
+        # 0, read the same samples from the mirror half instead
+        end = head if head >= n else head + self._capacity
+        start = end - n
+
+        result = {
+            "timestamps": self._timestamps[start:end].copy(),
+            "rdt_sequence": self._rdt_sequence[start:end].copy(),
+            "ft_sequence": self._ft_sequence[start:end].copy(),
+            "status": self._status[start:end].copy(),
         }
+        if channels is None:
+            result["counts"] = self._counts[:, start:end].T.copy()
+        else:
+            for ch in channels:
+                result[CHANNEL_KEYS[ch]] = self._counts[ch, start:end].copy()
+        return result
 
     def clear(self) -> None:
         """Clear all data from the buffer.
@@ -209,8 +340,10 @@ class RingBuffer:
         Statistics counters (total_written, overwrites) are reset.
         """
         with self._lock:
+            self._seq += 1
             self._head = 0
             self._size = 0
             self._total_written = 0
             self._overwrites = 0
+            self._seq += 1
             # Arrays are not zeroed for performance; size tracks validity
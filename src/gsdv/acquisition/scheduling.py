@@ -0,0 +1,23 @@
+"""Thread placement helpers for latency-sensitive loops."""
+
+import os
+from typing import Optional
+
+
+def apply_thread_scheduling(cpu: Optional[int], realtime_priority: Optional[int]) -> None:
+    """Pin the calling thread to a CPU and/or give it SCHED_FIFO priority.
+
+    Best effort: silently does nothing on platforms without the scheduler
+    APIs (Windows, macOS) or when the process lacks permission
+    (SCHED_FIFO needs CAP_SYS_NICE or a suitable RLIMIT_RTPRIO).
+    """
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError:
+            pass
+    if realtime_priority is not None and hasattr(os, "sched_setscheduler"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(realtime_priority))
+        except OSError:
+            pass
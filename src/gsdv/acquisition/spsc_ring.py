@@ -0,0 +1,131 @@
+"""Single-producer single-consumer ring for handing samples between threads.
+
+Replaces queue.Queue on the acquisition hot path. A queue.Queue put takes
+its mutex twice and notifies a condition variable per item; this ring only
+bumps an index into a pre-sized slot list and touches its wake event when
+the consumer may be waiting on an empty ring.
+"""
+
+import threading
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SpscRing(Generic[T]):
+    """Bounded lock-free ring with exactly one producer and one consumer thread.
+
+    The producer owns `_head` and the consumer owns `_tail`; each side only
+    reads the other's index. Correctness relies on the GIL making single
+    attribute stores and list item stores atomic, so this must not be shared
+    by more than one producer or more than one consumer.
+
+    Capacity is rounded up to a power of two so slot indexing is a mask.
+    Items must not be None (None marks an empty pop).
+
+    Example:
+        >>> ring: SpscRing[int] = SpscRing(capacity=1024)
+        >>> ring.push(1)
+        True
+        >>> ring.pop()
+        1
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the ring.
+
+        Args:
+            capacity: Minimum number of items the ring can hold.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        size = 1 << (capacity - 1).bit_length()
+        self._slots: list[Optional[T]] = [None] * size
+        self._mask = size - 1
+        self._head = 0  # Next write position (producer only)
+        self._tail = 0  # Next read position (consumer only)
+        self._not_empty = threading.Event()
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of items the ring can hold."""
+        return self._mask + 1
+
+    def __len__(self) -> int:
+        """Number of items currently queued (approximate while in use)."""
+        return self._head - self._tail
+
+    def push(self, item: T) -> bool:
+        """Append an item (producer thread only).
+
+        Returns:
+            True if queued, False if the ring was full and the item was dropped.
+        """
+        head = self._head
+        if head - self._tail > self._mask:
+            return False
+        self._slots[head & self._mask] = item
+        self._head = head + 1
+        # Only wake the consumer on the empty -> non-empty transition
+        if self._tail == head:
+            self._not_empty.set()
+        return True
+
+    def pop(self) -> Optional[T]:
+        """Remove and return the oldest item, or None if empty (consumer thread only)."""
+        tail = self._tail
+        if tail == self._head:
+            return None
+        idx = tail & self._mask
+        item = self._slots[idx]
+        self._slots[idx] = None
+        self._tail = tail + 1
+        return item
+
+    def drain(self, limit: Optional[int] = None) -> list[T]:
+        """Remove and return all queued items, oldest first (consumer thread only).
+
+        Args:
+            limit: Maximum number of items to remove (None = all available).
+        """
+        tail = self._tail
+        n = self._head - tail
+        if limit is not None:
+            n = min(n, limit)
+        mask = self._mask
+        slots = self._slots
+        items: list[T] = []
+        for i in range(tail, tail + n):
+            idx = i & mask
+            items.append(slots[idx])  # type: ignore[arg-type]
+            slots[idx] = None
+        self._tail = tail + n
+        return items
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the ring is non-empty (consumer thread only).
+
+        Args:
+            timeout: Maximum seconds to wait (None = forever).
+
+        Returns:
+            True if items are available, False on timeout.
+        """
+        if self._head != self._tail:
+            return True
+        self._not_empty.clear()
+        # Re-check after clearing so a push racing with clear() isn't missed
+        if self._head != self._tail:
+            return True
+        return self._not_empty.wait(timeout)
+
+    def clear(self) -> None:
+        """Drop all queued items. Only safe while neither side is running."""
+        self._slots = [None] * (self._mask + 1)
+        self._head = 0
+        self._tail = 0
+        self._not_empty.clear()
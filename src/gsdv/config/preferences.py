@@ -10,7 +10,9 @@ from __future__ import annotations
 import json
 import os
 import tempfile
-from dataclasses import dataclass, field, asdict
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
@@ -18,6 +20,11 @@ from typing import Any
 
 import platformdirs
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
 
 # Preference format version for migrations
 PREFERENCES_VERSION = 1
@@ -25,6 +32,9 @@ PREFERENCES_VERSION = 1
 # App name for platformdirs
 APP_NAME = "gsdv"
 
+# Quiet period before a debounced save is written (seconds)
+SAVE_DEBOUNCE_SECONDS = 0.5
+
 
 class ForceUnit(Enum):
     """Force unit options (FR-10)."""
@@ -123,6 +133,10 @@ class UserPreferences:
     theme: str = "dark"
 
 
+# Field names accepted when loading, computed once rather than per load
+_VALID_PREF_FIELDS: frozenset[str] = frozenset(f.name for f in fields(UserPreferences))
+
+
 def get_preferences_dir() -> Path:
     """Return the OS-specific user config directory for gsdv."""
     return Path(platformdirs.user_config_dir(APP_NAME))
@@ -152,6 +166,21 @@ class PreferencesStore:
         """
         self._path = preferences_path or get_preferences_path()
 
+        # Every write runs on one background writer thread, so writes land in
+        # the order they were queued. All state below is guarded by _pending_lock.
+        self._pending_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        # Serialized content waiting for the writer, and the future its callers share
+        self._async_payload: tuple[bytes, bool] | None = None
+        self._async_future: Future[None] | None = None
+        # First write failure not yet reported by save() or flush(); writes
+        # queued by save_async() or the debounce timer often have no waiter
+        self._write_error: BaseException | None = None
+
+        # Debounced save state: content waits here until the timer queues it
+        self._pending: bytes | None = None
+        self._pending_timer: threading.Timer | None = None
+
     @property
     def path(self) -> Path:
         """Return the preferences file path."""
@@ -174,30 +203,101 @@ class PreferencesStore:
         except (json.JSONDecodeError, OSError):
             return UserPreferences()
 
-    def save(self, preferences: UserPreferences) -> None:
+    def save(self, preferences: UserPreferences, durable: bool = False) -> None:
         """Save preferences to disk using atomic write.
 
         Writes to a temporary file in the same directory, then renames
         to the target path. This ensures the preferences file is never
-        left in a partially-written state.
+        left in a partially-written state, even if the process crashes.
 
         Args:
             preferences: The preferences to save.
+            durable: Also fsync the file and directory so the write survives
+                power loss. Each fsync can block for tens of milliseconds.
 
         Raises:
             OSError: If the directory cannot be created or write fails.
         """
-        # Update timestamp
+        future = self.save_async(preferences, durable)
+        try:
+            future.result()
+        except BaseException as e:
+            # Reported here, so flush() does not raise it again
+            with self._pending_lock:
+                if self._write_error is e:
+                    self._write_error = None
+            raise
+
+    def save_async(self, preferences: UserPreferences, durable: bool = False) -> Future[None]:
+        """Save preferences on the background writer thread.
+
+        The preferences are serialized immediately, so later mutations do
+        not affect this save. It supersedes any pending debounced save. If an
+        earlier queued write has not started yet, its content is replaced by
+        this one and both callers share a future.
+
+        Args:
+            preferences: The preferences to save.
+            durable: See save().
+
+        Returns:
+            Future that completes when the write finishes, or raises its OSError.
+        """
+        content = self._prepare(preferences)
+        with self._pending_lock:
+            self._cancel_pending_locked()
+            return self._queue_write_locked(content, durable)
+
+    def _queue_write_locked(self, content: bytes, durable: bool) -> Future[None]:
+        """Queue content for the writer thread (caller holds _pending_lock)."""
+        if self._async_payload is not None and self._async_future is not None:
+            # Coalesce into the queued write, keeping any durability request
+            durable = durable or self._async_payload[1]
+            self._async_payload = (content, durable)
+            return self._async_future
+
+        self._async_payload = (content, durable)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="PreferencesWriter"
+            )
+        self._async_future = self._executor.submit(self._write_async_payload)
+        return self._async_future
+
+    def _cancel_pending_locked(self) -> None:
+        """Drop any debounced save (caller holds _pending_lock)."""
+        if self._pending_timer is not None:
+            self._pending_timer.cancel()
+            self._pending_timer = None
+        self._pending = None
+
+    def _write_async_payload(self) -> None:
+        """Write the latest queued async payload (writer thread)."""
+        with self._pending_lock:
+            payload = self._async_payload
+            self._async_payload = None
+        if payload is None:
+            return
+        try:
+            self._write(*payload)
+        except BaseException as e:
+            # Recorded before the future completes, so a later flush() sees it
+            with self._pending_lock:
+                if self._write_error is None:
+                    self._write_error = e
+            raise
+
+    def _prepare(self, preferences: UserPreferences) -> bytes:
+        """Stamp preferences with the save time and version and serialize them."""
         preferences.last_updated_utc = datetime.now(timezone.utc).isoformat()
         preferences.preferences_version = PREFERENCES_VERSION
+        return self._serialize(preferences)
 
+    def _write(self, content: bytes, durable: bool) -> None:
+        """Atomically replace the preferences file with content."""
         # Ensure directory exists
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Serialize to JSON
-        data = self._to_dict(preferences)
-        content = json.dumps(data, indent=2, ensure_ascii=False)
-
         # Atomic write: temp file + rename
         dir_fd = None
         try:
@@ -207,8 +307,15 @@ class PreferencesStore:
                 dir=self._path.parent,
             )
             try:
-                os.write(fd, content.encode("utf-8"))
-                os.fsync(fd)
+                os.write(fd, content)
+                if durable:
+                    os.fsync(fd)
+                # Not read again until next startup; drop it from the page cache
+                if hasattr(os, "posix_fadvise"):
+                    try:
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    except OSError:
+                        pass
             finally:
                 os.close(fd)
 
@@ -216,7 +323,7 @@ class PreferencesStore:
             os.replace(tmp_path, self._path)
 
             # Sync directory to ensure rename is durable (Unix only)
-            if hasattr(os, "O_DIRECTORY"):
+            if durable and hasattr(os, "O_DIRECTORY"):
                 dir_fd = os.open(self._path.parent, os.O_RDONLY | os.O_DIRECTORY)
                 os.fsync(dir_fd)
         except BaseException:
@@ -231,6 +338,92 @@ class PreferencesStore:
             if dir_fd is not None:
                 os.close(dir_fd)
 
+    def save_debounced(
+        self, preferences: UserPreferences, delay: float = SAVE_DEBOUNCE_SECONDS
+    ) -> None:
+        """Schedule a save, coalescing calls that arrive within `delay` seconds.
+
+        Intended for UI-driven changes (e.g. a spinbox being typed into) so
+        that a burst of edits produces a single write. The preferences are
+        serialized on the calling thread; once no new call has arrived for
+        `delay` seconds the content is queued for the writer thread, behind
+        any earlier writes. Write errors are not raised to the caller; the
+        next flush() raises them. A pending save is lost at exit unless
+        flush() or close() is called.
+
+        Args:
+            preferences: The preferences to save.
+            delay: Quiet period in seconds before writing.
+        """
+        content = self._prepare(preferences)
+        with self._pending_lock:
+            self._cancel_pending_locked()
+            self._pending = content
+            self._pending_timer = threading.Timer(delay, self._queue_pending)
+            self._pending_timer.daemon = True
+            self._pending_timer.start()
+
+    def flush(self) -> None:
+        """Queue any save pending from save_debounced() and wait for all
+        queued writes to finish.
+
+        Raises:
+            OSError: If the directory cannot be created or a write failed.
+                This includes failures of earlier save_async() and debounced
+                writes since the last flush(), not only the latest write.
+        """
+        with self._pending_lock:
+            content = self._pending
+            self._cancel_pending_locked()
+            if content is not None:
+                self._queue_write_locked(content, False)
+            future = self._async_future
+        if future is not None:
+            wait([future])
+        with self._pending_lock:
+            error = self._write_error
+            self._write_error = None
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """Flush pending saves and shut down the writer thread.
+
+        Call at exit so the last writes do not depend on the executor's
+        atexit join. A later save starts a new writer thread.
+
+        Raises:
+            OSError: See flush().
+        """
+        try:
+            self.flush()
+        finally:
+            with self._pending_lock:
+                executor = self._executor
+                self._executor = None
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def _queue_pending(self) -> None:
+        """Queue the pending debounced content for the writer (timer thread)."""
+        with self._pending_lock:
+            content = self._pending
+            self._pending = None
+            self._pending_timer = None
+            if content is not None:
+                self._queue_write_locked(content, False)
+
+    def _serialize(self, preferences: UserPreferences) -> bytes:
+        """Serialize preferences to indented UTF-8 JSON.
+
+        Uses orjson when installed, which serializes the dataclass directly
+        without the intermediate asdict() copy.
+        """
+        if orjson is not None:
+            return orjson.dumps(preferences, option=orjson.OPT_INDENT_2)
+        data = self._to_dict(preferences)
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
     def _to_dict(self, preferences: UserPreferences) -> dict[str, Any]:
         """Convert preferences to a dictionary for JSON serialization."""
         return asdict(preferences)
@@ -240,12 +433,5 @@ class PreferencesStore:
 
         Unknown keys are ignored, missing keys use defaults.
         """
-        defaults = UserPreferences()
-        valid_fields = {f.name for f in defaults.__dataclass_fields__.values()}
-
-        kwargs = {}
-        for key, value in data.items():
-            if key in valid_fields:
-                kwargs[key] = value
-
+        kwargs = {k: v for k, v in data.items() if k in _VALID_PREF_FIELDS}
         return UserPreferences(**kwargs)
@@ -1,14 +1,15 @@
 """Sensor controller for managing connection and data flow."""
 
 import time
+from collections import deque
 from typing import Optional
 
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
 
-from gsdv.acquisition.acquisition_engine import AcquisitionEngine
+from gsdv.acquisition.acquisition_engine import AcquisitionEngine, AcquisitionState
 from gsdv.errors import BiasError
 from gsdv.models import CalibrationInfo, SampleRecord
-from gsdv.protocols import BiasService, RdtStatistics, get_calibration_with_fallback
+from gsdv.protocols import BiasService, get_calibration_with_fallback
 
 
 class ConnectionState:
@@ -33,17 +34,32 @@ class SensorController(QObject):
     Signals:
         connection_state_changed(str, str): (state, message) when state changes.
         calibration_loaded(CalibrationInfo): Emitted when calibration is fetched.
-        sample_received(SampleRecord): Forwarded from acquisition engine.
-        statistics_updated(int, int, float): (packets_received, packets_lost, rate_hz).
+        samples_available(int): Number of samples waiting in drain_samples(),
+            emitted at most ~60 times per second.
+        statistics_updated(int, int, float): (packets_received, packets_lost, rate_hz),
+            polled from the engine every STATS_EMIT_INTERVAL_MS while connected.
         error_occurred(str, str): (error_code, message) for user display.
     """
 
     connection_state_changed = Signal(str, str)  # state, message
     calibration_loaded = Signal(object)  # CalibrationInfo
-    sample_received = Signal(object)  # SampleRecord
+    samples_available = Signal(int)  # samples waiting in drain_samples()
     statistics_updated = Signal(int, int, float)  # packets_received, packets_lost, rate_hz
     error_occurred = Signal(str, str)  # error_code, message
 
+    # Interval between engine statistics polls (statistics_updated emissions)
+    STATS_EMIT_INTERVAL_MS = 100
+
+    # Weight of the newest interval in the displayed sample rate (EMA). The
+    # first interval seeds it, and ticks without new packets pull it toward 0.
+    RATE_SMOOTHING = 0.2
+
+    # Interval between samples_available emissions (~60 Hz)
+    SAMPLES_EMIT_INTERVAL_MS = 16
+
+    # Samples held for the UI between drains; the oldest are dropped beyond this
+    SAMPLE_QUEUE_CAPACITY = 8192
+
     def __init__(self, parent: Optional[QObject] = None) -> None:
         """Initialize the sensor controller."""
         super().__init__(parent)
@@ -53,9 +69,25 @@ class SensorController(QObject):
         self._current_ip: Optional[str] = None
         self._state = ConnectionState.DISCONNECTED
 
-        # For sample rate calculation
-        self._last_stats_time_ns: Optional[int] = None
-        self._last_packet_count: int = 0
+        # For sample rate calculation (seeded on connect)
+        self._last_stats_time_ns = 0
+        self._last_packet_count = 0
+        self._last_receive_errors = 0
+        self._rate_hz = 0.0
+        self._rate_seeded = False
+
+        # Engine statistics are polled (stats() is a lock-free snapshot) and
+        # emitted at most every 100ms
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(self.STATS_EMIT_INTERVAL_MS)
+        self._stats_timer.timeout.connect(self._poll_stats)
+
+        # Samples from the engine thread wait here until the UI drains them;
+        # deque appends and pops are atomic, so no lock is needed
+        self._samples: deque[SampleRecord] = deque(maxlen=self.SAMPLE_QUEUE_CAPACITY)
+        self._samples_timer = QTimer(self)
+        self._samples_timer.setInterval(self.SAMPLES_EMIT_INTERVAL_MS)
+        self._samples_timer.timeout.connect(self._flush_samples)
 
     @property
     def state(self) -> str:
@@ -109,17 +141,20 @@ class SensorController(QObject):
         # Create bias service for this sensor
         self._bias_service = BiasService(ip)
 
-        # Start acquisition engine
-        self._acquisition_engine = AcquisitionEngine(ip, self._calibration)
-        self._acquisition_engine.sample_received.connect(self._on_sample_received)
-        self._acquisition_engine.statistics_updated.connect(self._on_statistics_updated)
-        self._acquisition_engine.error_occurred.connect(self._on_acquisition_error)
-        self._acquisition_engine.streaming_stopped.connect(self._on_streaming_stopped)
+        # Start acquisition engine; samples arrive in batches on its callback thread
+        self._acquisition_engine = AcquisitionEngine(ip)
+        self._acquisition_engine.set_sample_batch_callback(self._on_samples_received)
 
-        self._last_stats_time_ns = None
+        self._last_stats_time_ns = time.monotonic_ns()
         self._last_packet_count = 0
+        self._last_receive_errors = 0
+        self._rate_hz = 0.0
+        self._rate_seeded = False
+        self._samples.clear()
 
         self._acquisition_engine.start()
+        self._stats_timer.start()
+        self._samples_timer.start()
         self._set_state(ConnectionState.CONNECTED, f"Connected to {ip}")
 
     @Slot()
@@ -129,12 +164,13 @@ class SensorController(QObject):
             return
 
         self._set_state(ConnectionState.DISCONNECTING, "Disconnecting...")
+        self._stats_timer.stop()
+        self._samples_timer.stop()
 
         if self._acquisition_engine is not None:
-            self._acquisition_engine.request_stop()
-            # Wait briefly for thread to finish
-            if not self._acquisition_engine.wait(2000):  # 2 second timeout
-                self._acquisition_engine.terminate()
+            # Cooperative shutdown: the receive loop polls its stop flag at
+            # least once per socket timeout, so stop() joins it cleanly
+            self._acquisition_engine.stop()
             self._acquisition_engine = None
 
         self._bias_service = None
@@ -160,22 +196,48 @@ class SensorController(QObject):
         except Exception as e:
             self.error_occurred.emit("BIAS-002", str(e))
 
-    def _on_sample_received(self, sample: SampleRecord) -> None:
-        """Handle sample from acquisition engine."""
-        self.sample_received.emit(sample)
+    def drain_samples(self) -> list[SampleRecord]:
+        """Remove and return all samples received since the last drain, oldest first."""
+        samples = self._samples
+        return [samples.popleft() for _ in range(len(samples))]
+
+    def _on_samples_received(self, samples: list[SampleRecord]) -> None:
+        """Queue a batch of samples from the acquisition engine's callback thread."""
+        self._samples.extend(samples)
+
+    def _flush_samples(self) -> None:
+        """Notify the UI that samples are waiting, if any arrived."""
+        count = len(self._samples)
+        if count:
+            self.samples_available.emit(count)
+
+    def _poll_stats(self) -> None:
+        """Read the engine statistics and emit them (one emission per timer tick)."""
+        engine = self._acquisition_engine
+        if engine is None:
+            return
+        stats = engine.stats()
+        if stats.state is not AcquisitionState.RUNNING:
+            self._on_streaming_stopped()
+            return
+
+        if stats.receive_errors > self._last_receive_errors:
+            new_errors = stats.receive_errors - self._last_receive_errors
+            self._last_receive_errors = stats.receive_errors
+            self._on_acquisition_error(f"{new_errors} receive error(s) from {self._current_ip}")
 
-    def _on_statistics_updated(self, stats: RdtStatistics) -> None:
-        """Handle statistics update from acquisition engine."""
         current_time_ns = time.monotonic_ns()
 
-        # Calculate sample rate
-        rate_hz = 0.0
-        if self._last_stats_time_ns is not None:
-            elapsed_ns = current_time_ns - self._last_stats_time_ns
-            elapsed_s = elapsed_ns / 1e9
-            if elapsed_s > 0:
-                new_packets = stats.packets_received - self._last_packet_count
-                rate_hz = new_packets / elapsed_s
+        # Sample rate since the last tick, smoothed for display. A tick with no
+        # new packets measures 0 Hz, so a stalled stream decays toward 0.
+        elapsed_ns = max(1, current_time_ns - self._last_stats_time_ns)
+        rate_hz = (stats.packets_received - self._last_packet_count) * 1e9 / elapsed_ns
+        if self._rate_seeded:
+            self._rate_hz += self.RATE_SMOOTHING * (rate_hz - self._rate_hz)
+        else:
+            # Start from the first measurement rather than ramping up from 0
+            self._rate_hz = rate_hz
+            self._rate_seeded = True
 
         self._last_stats_time_ns = current_time_ns
         self._last_packet_count = stats.packets_received
@@ -183,15 +245,17 @@ class SensorController(QObject):
         self.statistics_updated.emit(
             stats.packets_received,
             stats.packets_lost,
-            rate_hz,
+            self._rate_hz,
         )
 
     def _on_acquisition_error(self, error_message: str) -> None:
-        """Handle error from acquisition engine."""
+        """Report acquisition errors seen in the engine statistics."""
         self.error_occurred.emit("ACQ-001", error_message)
 
     def _on_streaming_stopped(self) -> None:
-        """Handle acquisition engine stopping."""
+        """Handle the acquisition engine leaving the running state."""
         if self._state == ConnectionState.CONNECTED:
             # Unexpected stop
+            self._stats_timer.stop()
+            self._samples_timer.stop()
             self._set_state(ConnectionState.ERROR, "Streaming stopped unexpectedly")
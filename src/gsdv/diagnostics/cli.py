@@ -7,26 +7,52 @@ This module provides CLI commands for:
 - Running the sensor simulator
 """
 
+from __future__ import annotations
+
 import argparse
-import csv
-import ipaddress
-import socket
 import sys
 import time
-from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+# Subcommand dependencies (numpy, the protocol clients, the file writer) are
+# imported inside each cmd_* function so that --help and unrelated
+# subcommands don't pay for loading them.
+if TYPE_CHECKING:
+    import ipaddress
+    import queue
+    import threading
+
+    from gsdv.models import CalibrationInfo, SampleRecord
+
+
+# Maximum simultaneous connections while probing hosts in cmd_discover
+DISCOVER_MAX_CONNECTIONS = 256
+
+# Default TCP connect timeout per host in cmd_discover, the same as
+# gsdv.protocols.discovery.PROBE_TIMEOUT (not imported here to keep --help fast)
+DISCOVER_CONNECT_TIMEOUT_S = 0.15
+
+# Samples converted to SI units per vectorized call in cmd_log
+LOG_CONVERT_BATCH_SIZE = 256
 
-from gsdv.logging.filename import sanitize_prefix
-from gsdv.logging.writer import AsyncFileWriter
-from gsdv.models import CalibrationInfo
-from gsdv.protocols.http_calibration import (
-    HttpCalibrationClient,
-    HttpCalibrationError,
-    get_calibration_with_fallback,
-)
-from gsdv.protocols.rdt_udp import RdtClient
-from gsdv.protocols.tcp_cmd import TcpCommandClient
+# User-space write buffer for cmd_log output files
+LOG_WRITE_BUFFER_BYTES = 1024 * 1024
+
+# Seconds between cmd_log progress lines
+LOG_PROGRESS_INTERVAL_S = 0.25
+
+# cmd_stream console row: Seq, Fx, Fy, Fz, Tx, Ty, Tz
+STREAM_ROW_FORMAT = "%8d  %10.3f  %10.3f  %10.3f  %10.6f  %10.6f  %10.6f\n"
+
+# cmd_stream shows the latest sample at most this often (~60 Hz)
+STREAM_DISPLAY_INTERVAL_S = 0.016
+
+# Samples queued for the cmd_stream display thread before dropping
+STREAM_DISPLAY_QUEUE_SIZE = 1024
+
+# UDP receive buffer for CLI streaming, sized to absorb bursts
+CLI_RECV_BUFFER_BYTES = 4 * 1024 * 1024
 
 
 def parse_size(s: str | None) -> int | None:
@@ -69,10 +95,76 @@ def parse_duration(s: str | None) -> float | None:
         return None
 
 
+def _host_addresses(network: ipaddress.IPv4Network | ipaddress.IPv6Network) -> list[str]:
+    """List usable host addresses of a network as strings.
+
+    Matches str() of each address from network.hosts(), but IPv4 addresses
+    are formatted straight from integers instead of via an IPv4Address
+    object per host.
+    """
+    if network.version != 4:
+        return [str(ip) for ip in network.hosts()]
+
+    base = int(network.network_address)
+    # /31 and /32 have no network/broadcast addresses to exclude
+    if network.prefixlen >= 31:
+        first, last = base, base + network.num_addresses
+    else:
+        first, last = base + 1, base + network.num_addresses - 1
+    return [
+        f"{a >> 24}.{(a >> 16) & 255}.{(a >> 8) & 255}.{a & 255}" for a in range(first, last)
+    ]
+
+
+async def _discover_calibrations(
+    hosts: list[str], http_port: int, timeout: float, connect_timeout: float
+) -> list[tuple[str, CalibrationInfo]]:
+    """Probe all hosts concurrently on one event loop, printing sensors as found."""
+    import asyncio
+
+    from gsdv.protocols.http_calibration import HttpCalibrationError, get_calibration_async
+
+    # Bounds open sockets (file descriptors), not threads
+    limiter = asyncio.Semaphore(DISCOVER_MAX_CONNECTIONS)
+    # A short connect timeout rules out dead hosts before the full HTTP
+    # timeout; the per-host timeout stays the upper bound
+    connect_timeout = min(timeout, connect_timeout)
+
+    async def probe(ip: str) -> Optional[tuple[str, CalibrationInfo]]:
+        async with limiter:
+            try:
+                cal = await get_calibration_async(
+                    ip, http_port, timeout, connect_timeout=connect_timeout
+                )
+            except (HttpCalibrationError, OSError):
+                return None
+            return ip, cal
+
+    found = []
+    for next_result in asyncio.as_completed([probe(ip) for ip in hosts]):
+        result = await next_result
+        if result is None:
+            continue
+        ip_str, cal = result
+        found.append(result)
+        print(f"  Found: {ip_str}")
+        if cal.serial_number:
+            print(f"    Serial: {cal.serial_number}")
+        if cal.firmware_version:
+            print(f"    Firmware: {cal.firmware_version}")
+        print(f"    CPF: {cal.counts_per_force}, CPT: {cal.counts_per_torque}")
+        print()
+    return found
+
+
 def cmd_discover(args: argparse.Namespace) -> int:
     """Discover sensors on the local network."""
+    import asyncio
+    import ipaddress
+
     subnet = args.subnet
     timeout = args.timeout
+    connect_timeout = getattr(args, "connect_timeout", DISCOVER_CONNECT_TIMEOUT_S)
     http_port = args.http_port
 
     print(f"Scanning {subnet} for ATI NETrs sensors...")
@@ -84,22 +176,8 @@ def cmd_discover(args: argparse.Namespace) -> int:
         print(f"Error: Invalid subnet: {e}", file=sys.stderr)
         return 1
 
-    found = []
-    for ip in network.hosts():
-        ip_str = str(ip)
-        try:
-            client = HttpCalibrationClient(ip_str, port=http_port, timeout=timeout)
-            cal = client.get_calibration()
-            found.append((ip_str, cal))
-            print(f"  Found: {ip_str}")
-            if cal.serial_number:
-                print(f"    Serial: {cal.serial_number}")
-            if cal.firmware_version:
-                print(f"    Firmware: {cal.firmware_version}")
-            print(f"    CPF: {cal.counts_per_force}, CPT: {cal.counts_per_torque}")
-            print()
-        except (HttpCalibrationError, OSError):
-            pass
+    hosts = _host_addresses(network)
+    found = asyncio.run(_discover_calibrations(hosts, http_port, timeout, connect_timeout))
 
     if not found:
         print("No sensors found.")
@@ -109,17 +187,52 @@ def cmd_discover(args: argparse.Namespace) -> int:
     return 0
 
 
+def _display_latest_samples(
+    samples: queue.Queue[SampleRecord], cal: CalibrationInfo, stop: threading.Event
+) -> None:
+    """Print the newest queued sample every display interval until stopped."""
+    import queue
+
+    write = sys.stdout.write
+    while True:
+        stopping = stop.wait(STREAM_DISPLAY_INTERVAL_S)
+        latest = None
+        while True:
+            try:
+                latest = samples.get_nowait()
+            except queue.Empty:
+                break
+        if latest is not None:
+            force_N, torque_Nm = cal.convert_counts_to_si(latest.counts)
+            write(
+                STREAM_ROW_FORMAT
+                % (latest.rdt_sequence, *force_N.tolist(), *torque_Nm.tolist())
+            )
+        if stopping:
+            break
+
+
 def cmd_stream(args: argparse.Namespace) -> int:
     """Stream data from a sensor and display to console."""
+    import queue
+    import threading
+
+    from gsdv.protocols.http_calibration import (
+        get_calibration_cache_dir,
+        get_calibration_with_fallback,
+    )
+    from gsdv.protocols.rdt_udp import RdtClient
+
     ip = args.ip
     seconds = args.seconds
     udp_port = args.udp_port
     http_port = args.http_port
+    cache_dir = None if getattr(args, "no_cache", False) else get_calibration_cache_dir()
 
     # Get calibration
     print(f"Connecting to {ip}...")
     try:
-        cal = get_calibration_with_fallback(ip, http_port=http_port)
+        cal = get_calibration_with_fallback(ip, http_port=http_port, cache_dir=cache_dir)
     except Exception as e:
         print(f"Error: Failed to get calibration: {e}", file=sys.stderr)
         return 1
@@ -138,18 +251,28 @@ def cmd_stream(args: argparse.Namespace) -> int:
     start_time = time.monotonic()
     sample_count = 0
 
-    with RdtClient(ip, port=udp_port) as client:
+    # Terminal output runs on its own thread so a slow or blocked stdout
+    # never stalls the receive loop and overflows the socket buffer
+    display_queue: queue.Queue[SampleRecord] = queue.Queue(maxsize=STREAM_DISPLAY_QUEUE_SIZE)
+    display_stop = threading.Event()
+    display_thread = threading.Thread(
+        target=_display_latest_samples,
+        args=(display_queue, cal, display_stop),
+        name="StreamDisplay",
+        daemon=True,
+    )
+    display_drops = 0
+
+    with RdtClient(ip, port=udp_port, receive_buffer_size=CLI_RECV_BUFFER_BYTES) as client:
         client.start_streaming()
+        display_thread.start()
 
         try:
             for sample in client.receive_samples(timeout=0.5):
-                force_N, torque_Nm = cal.convert_counts_to_si(sample.counts)
-
-                print(
-                    f"{sample.rdt_sequence:>8}  "
-                    f"{force_N[0]:>10.3f}  {force_N[1]:>10.3f}  {force_N[2]:>10.3f}  "
-                    f"{torque_Nm[0]:>10.6f}  {torque_Nm[1]:>10.6f}  {torque_Nm[2]:>10.6f}"
-                )
+                try:
+                    display_queue.put_nowait(sample)
+                except queue.Full:
+                    display_drops += 1
 
                 sample_count += 1
 
@@ -158,6 +281,10 @@ def cmd_stream(args: argparse.Namespace) -> int:
 
         except KeyboardInterrupt:
             print()
+        finally:
+            display_stop.set()
+            display_thread.join(timeout=1.0)
+            sys.stdout.flush()
 
     elapsed = time.monotonic() - start_time
     stats = client.statistics
@@ -168,12 +295,24 @@ def cmd_stream(args: argparse.Namespace) -> int:
     print(f"Duration: {elapsed:.2f}s")
     print(f"Sample rate: {sample_rate:.1f} Hz")
     print(f"Packets lost: {stats.packets_lost}")
+    if display_drops:
+        print(f"Display drops: {display_drops}")
 
     return 0
 
 
 def cmd_log(args: argparse.Namespace) -> int:
     """Log data to a file."""
+    import numpy as np
+
+    from gsdv.logging.filename import sanitize_prefix
+    from gsdv.logging.writer import AsyncFileWriter
+    from gsdv.protocols.http_calibration import (
+        get_calibration_cache_dir,
+        get_calibration_with_fallback,
+    )
+    from gsdv.protocols.rdt_udp import RdtClient
+
     ip = args.ip
     output_dir = Path(args.out)
     seconds = args.seconds
@@ -181,6 +320,7 @@ def cmd_log(args: argparse.Namespace) -> int:
     prefix = sanitize_prefix(args.prefix or "")
     udp_port = args.udp_port
     http_port = args.http_port
+    cache_dir = None if getattr(args, "no_cache", False) else get_calibration_cache_dir()
     
     rotate_size = parse_size(args.rotate_size)
     rotate_time = parse_duration(args.rotate_time)
@@ -196,7 +336,7 @@ def cmd_log(args: argparse.Namespace) -> int:
     # Get calibration
     print(f"Connecting to {ip}...")
     try:
-        cal = get_calibration_with_fallback(ip, http_port=http_port)
+        cal = get_calibration_with_fallback(ip, http_port=http_port, cache_dir=cache_dir)
     except Exception as e:
         print(f"Error: Failed to get calibration: {e}", file=sys.stderr)
         return 1
@@ -204,7 +344,8 @@ def cmd_log(args: argparse.Namespace) -> int:
     print(f"Calibration: CPF={cal.counts_per_force}, CPT={cal.counts_per_torque}")
 
     # Generate filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    start_local = time.localtime()
+    timestamp = time.strftime("%Y%m%d_%H%M%S", start_local)
     if format_type == "tsv":
         ext = "tsv"
         delimiter = "\t"
@@ -222,27 +363,45 @@ def cmd_log(args: argparse.Namespace) -> int:
         print(f"Rotation time: {args.rotate_time}")
     print()
 
-    # Define formatter closure
-    def log_formatter(record: tuple) -> str:
-        # record is (timestamp_iso, sample_obj)
-        ts_iso, sample = record
-        force_N, torque_Nm = cal.convert_counts_to_si(sample.counts)
-        
-        # Match previous format
-        row = [
-            ts_iso,
-            str(sample.t_monotonic_ns),
-            str(sample.rdt_sequence),
-            str(sample.ft_sequence),
-            str(sample.status),
-            f"{force_N[0]:.6f}",
-            f"{force_N[1]:.6f}",
-            f"{force_N[2]:.6f}",
-            f"{torque_Nm[0]:.9f}",
-            f"{torque_Nm[1]:.9f}",
-            f"{torque_Nm[2]:.9f}",
-        ]
-        return delimiter.join(row)
+    # Rows are converted and formatted in blocks on this thread, so the
+    # writer thread only joins and writes finished lines
+    row_format = delimiter.join(
+        ["%s.%06d", "%d", "%d", "%d", "%d"] + ["%.6f"] * 3 + ["%.9f"] * 3
+    )
+    pending: list[SampleRecord] = []
+    max_pending_age_ns = int(LOG_PROGRESS_INTERVAL_S * 1_000_000_000)
+
+    # Wall-clock UTC time is derived from each sample's receive timestamp via
+    # a fixed offset; the "YYYY-MM-DDTHH:MM:SS" part is formatted once per second
+    wall_offset_ns = time.time_ns() - time.monotonic_ns()
+    last_second = -1
+    second_prefix = ""
+
+    def flush_pending(writer: AsyncFileWriter) -> None:
+        nonlocal last_second, second_prefix
+        if not pending:
+            return
+        counts = np.array([sample.counts for sample in pending], dtype=np.int32)
+        force_N, torque_Nm = cal.convert_counts_batch(counts)
+        for sample, force, torque in zip(pending, force_N.tolist(), torque_Nm.tolist()):
+            second, ns = divmod(sample.t_monotonic_ns + wall_offset_ns, 1_000_000_000)
+            if second != last_second:
+                last_second = second
+                second_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            writer.write(
+                row_format
+                % (
+                    second_prefix,
+                    ns // 1000,
+                    sample.t_monotonic_ns,
+                    sample.rdt_sequence,
+                    sample.ft_sequence,
+                    sample.status,
+                    *force,
+                    *torque,
+                )
+            )
+        pending.clear()
 
     # Build header
     header_lines = []
@@ -256,7 +415,7 @@ def cmd_log(args: argparse.Namespace) -> int:
         f"# Firmware: {cal.firmware_version or 'N/A'}",
         f"# CPF: {cal.counts_per_force}",
         f"# CPT: {cal.counts_per_torque}",
-        f"# Start: {datetime.now().isoformat()}",
+        f"# Start: {time.strftime('%Y-%m-%dT%H:%M:%S', start_local)}",
     ])
     
     col_headers = [
@@ -276,12 +435,14 @@ def cmd_log(args: argparse.Namespace) -> int:
     full_header = "\n".join(header_lines) + "\n"
 
     start_time = time.monotonic()
+    next_progress = start_time + LOG_PROGRESS_INTERVAL_S
     sample_count = 0
 
     try:
         with AsyncFileWriter(
             output_path,
-            formatter=log_formatter,
+            buffer_size=LOG_WRITE_BUFFER_BYTES,
+            formatter=str,
             header=full_header,
             rotate_size_bytes=rotate_size,
             rotate_interval_s=rotate_time,
@@ -290,23 +451,34 @@ def cmd_log(args: argparse.Namespace) -> int:
             with RdtClient(ip, port=udp_port) as client:
                 client.start_streaming()
 
-                for sample in client.receive_samples(timeout=0.5):
-                    # Capture time for logging
-                    ts_iso = datetime.utcnow().isoformat()
-                    
-                    writer.write((ts_iso, sample))
-                    sample_count += 1
-
-                    # Progress update every 1000 samples
-                    if sample_count % 1000 == 0:
-                        elapsed = time.monotonic() - start_time
-                        rate = sample_count / elapsed if elapsed > 0 else 0
-                        stats = writer.stats()
-                        drops = stats.samples_dropped
-                        print(f"\rSamples: {sample_count}, Rate: {rate:.1f} Hz, Drops: {drops}", end="", flush=True)
-
-                    if seconds is not None and (time.monotonic() - start_time) >= seconds:
-                        break
+                try:
+                    for sample in client.receive_samples(timeout=0.5):
+                        pending.append(sample)
+                        # A slow stream must not hold rows back, or time-based
+                        # rotation would put them in a later file
+                        if (
+                            len(pending) >= LOG_CONVERT_BATCH_SIZE
+                            or sample.t_monotonic_ns - pending[0].t_monotonic_ns
+                            >= max_pending_age_ns
+                        ):
+                            flush_pending(writer)
+                        sample_count += 1
+
+                        # Progress update on a fixed wall-clock cadence
+                        now = time.monotonic()
+                        if now >= next_progress:
+                            next_progress = now + LOG_PROGRESS_INTERVAL_S
+                            rate = sample_count / (now - start_time)
+                            drops = writer.stats().samples_dropped
+                            sys.stderr.write(
+                                f"\rSamples: {sample_count}, Rate: {rate:.1f} Hz, Drops: {drops}"
+                            )
+
+                        if seconds is not None and now - start_time >= seconds:
+                            break
+                finally:
+                    # Also reached on Ctrl+C, while the writer is still open
+                    flush_pending(writer)
 
     except KeyboardInterrupt:
         print()
@@ -330,8 +502,6 @@ def cmd_log(args: argparse.Namespace) -> int:
 
 def cmd_simulate_sensor(args: argparse.Namespace) -> int:
     """Run the sensor simulator."""
-    import time
-
     from gsdv.diagnostics.sensor_simulator import (
         FaultConfig,
         SensorSimulator,
@@ -399,6 +569,13 @@ def main() -> int:
         default=0.5,
         help="Timeout per host in seconds",
     )
+    discover_parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=DISCOVER_CONNECT_TIMEOUT_S,
+        help="TCP connect timeout per host in seconds (capped at --timeout); "
+        "raise it for sensors behind a VPN or other high-latency link",
+    )
     discover_parser.add_argument(
         "--http-port",
         type=int,
@@ -436,6 +613,11 @@ def main() -> int:
         default=80,
         help="HTTP calibration port",
     )
+    stream_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download calibration instead of revalidating a cached copy",
+    )
     stream_parser.set_defaults(func=cmd_stream)
 
     # log command
@@ -483,6 +665,11 @@ def main() -> int:
         default=80,
         help="HTTP calibration port",
     )
+    log_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download calibration instead of revalidating a cached copy",
+    )
     log_parser.add_argument(
         "--rotate-size",
         help="Rotate log after size (e.g. 2GB, 100MB)",
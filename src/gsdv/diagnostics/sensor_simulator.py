@@ -11,18 +11,23 @@ for automated integration tests.
 """
 
 import argparse
-import collections
+import ctypes
+import errno
+import functools
 import math
+import os
+import selectors
 import socket
 import struct
+import sys
 import threading
 import time
 from dataclasses import dataclass, field
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 
+from gsdv.acquisition.scheduling import apply_thread_scheduling
 from gsdv.protocols.rdt_udp import (
     RDT_HEADER,
     RDT_REQUEST_SIZE,
@@ -38,12 +43,323 @@ from gsdv.protocols.tcp_cmd import (
     TcpCommand,
 )
 
+# Precompiled packet layouts
+_REQUEST_STRUCT = struct.Struct(REQUEST_FORMAT)
+_CALINFO_RESPONSE_STRUCT = struct.Struct(">HBBII6H")
+_SYS_COMMANDS_STRUCT = struct.Struct(">H")  # READFT flags, at READFT_SYS_COMMANDS_OFFSET
+READFT_SYS_COMMANDS_OFFSET = 18
+_SOCKADDR_IN_STRUCT = struct.Struct("!2xH4s")  # port, address
 
-@dataclass
+# The streaming loop sleeps until this close to a send deadline, then spins,
+# since sleep() can overshoot by tens of microseconds
+STREAM_SPIN_NS = 150_000
+
+# Above this many packets per second, the streaming loop sends several
+# packets back-to-back per deadline rather than waking for each one
+STREAM_MAX_WAKEUPS_PER_SECOND = 1000
+
+# Phase offsets of the simulated signals [Fx, Fy, Fz, Tx, Ty, Tz]
+_CHANNEL_PHASES = np.arange(6) * (math.pi / 3)
+
+# Small send buffer so a stalled receiver pushes back on the streaming loop
+# instead of queuing stale samples in the kernel
+UDP_SEND_BUFFER_SIZE = 65536
+
+# UDP generic segmentation offload option (Linux 4.18+); the socket module
+# only exports the constant from Python 3.12
+_UDP_SEGMENT: Optional[int] = (
+    getattr(socket, "UDP_SEGMENT", 103) if sys.platform.startswith("linux") else None
+)
+
+# Streaming from a second RDT-port socket connected to the client relies on
+# Linux delivering that client's datagrams to the connected socket. Elsewhere
+# the shared bind either fails (BSD/macOS) or leaves delivery between the two
+# sockets undefined (Windows), so packets are sent with sendto instead.
+_CONNECTED_STREAM_SOCKET = sys.platform.startswith("linux")
+
+# Most segments the kernel accepts in one UDP_SEGMENT send
+UDP_GSO_MAX_SEGMENTS = 64
+
+# Largest HTTP request head read before answering
+HTTP_MAX_REQUEST_SIZE = 4096
+
+# RDT requests drained per recvmmsg call
+UDP_RECEIVE_BATCH_SIZE = 16
+
+# Longest signal period, in samples, tabulated instead of computing sin()
+SINE_TABLE_MAX_SAMPLES = 1 << 16
+
+# Live noise (no replayed table) is drawn this many samples at a time
+NOISE_CHUNK_SAMPLES = 4096
+
+# Fault injection decisions drawn per bulk draw
+FAULT_DRAW_CHUNK = 65536
+
+# Samples synthesized per vectorized call by the streaming loop
+SIGNAL_BLOCK_SAMPLES = 256
+
+
+def _sleep_until(deadline_ns: int) -> None:
+    """Sleep until time.monotonic_ns() reaches deadline_ns.
+
+    time.sleep() already waits in clock_nanosleep(2) against an absolute
+    CLOCK_MONOTONIC deadline on Linux (Python 3.11+), so converting to a
+    relative timeout here is the only slack.
+    """
+    remaining_ns = deadline_ns - time.monotonic_ns()
+    if remaining_ns > 0:
+        time.sleep(remaining_ns * 1e-9)
+
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IoVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_libc_mmsg(name: str) -> Optional[Callable[..., int]]:
+    """Return libc's sendmmsg(2) or recvmmsg(2), or None where it is unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        func = getattr(ctypes.CDLL(None, use_errno=True), name)
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+    if name == "recvmmsg":
+        func.argtypes.append(ctypes.c_void_p)  # struct timespec *timeout
+    func.restype = ctypes.c_int
+    return func
+
+
+class _DatagramBatch:
+    """Fixed-size IPv4 datagrams queued and sent with as few syscalls as possible.
+
+    Each datagram is copied into a slot of one preallocated buffer. On Linux
+    flush() hands the buffer to the kernel as one UDP_SEGMENT (GSO) send per
+    UDP_GSO_MAX_SEGMENTS datagrams, which the kernel splits back into
+    datagrams. Where GSO is refused it uses one sendmmsg(2) call, whose
+    message headers pointing at the slots are built once, and where sendmmsg
+    is unavailable one sendto() per datagram.
+
+    Zero-copy sends (MSG_ZEROCOPY, io_uring SEND_ZC) are deliberately not
+    used: pinning pages and reaping completions costs more than copying a
+    36-byte RDT packet, and they need kernel 6.0+ and a third-party binding.
+    """
+
+    def __init__(self, capacity: int, size: int) -> None:
+        self._capacity = capacity
+        self._size = size
+        self._buffer = bytearray(capacity * size)
+        self._view = memoryview(self._buffer)
+        self._count = 0
+        self._addr: Optional[tuple[str, int]] = None
+        self._gso_control: Optional[list[tuple[int, int, bytes]]] = None
+        if _UDP_SEGMENT is not None:
+            self._gso_control = [(socket.IPPROTO_UDP, _UDP_SEGMENT, struct.pack("=H", size))]
+        self._sendmmsg = _load_libc_mmsg("sendmmsg")
+        if self._sendmmsg is None:
+            return
+
+        # sockaddr_in, filled in by flush() when the destination changes
+        self._name = ctypes.create_string_buffer(16)
+        # Holding this export also pins the bytearray's memory
+        self._slots = (ctypes.c_char * len(self._buffer)).from_buffer(self._buffer)
+        base = ctypes.addressof(self._slots)
+        self._iovecs = (_IoVec * capacity)()
+        self._msgs = (_MMsgHdr * capacity)()
+        for i in range(capacity):
+            self._iovecs[i].iov_base = base + i * size
+            self._iovecs[i].iov_len = size
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(self._name)
+            hdr.msg_namelen = len(self._name)
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+
+    def __len__(self) -> int:
+        """Number of queued datagrams."""
+        return self._count
+
+    @property
+    def full(self) -> bool:
+        """Whether every slot holds a queued datagram."""
+        return self._count == self._capacity
+
+    def append(self, datagram: bytes | memoryview) -> None:
+        """Copy a datagram into the next free slot."""
+        start = self._count * self._size
+        self._view[start:start + self._size] = datagram
+        self._count += 1
+
+    def clear(self) -> None:
+        """Drop all queued datagrams."""
+        self._count = 0
+
+    def flush(self, sock: socket.socket, addr: tuple[str, int]) -> None:
+        """Send all queued datagrams to addr and empty the batch.
+
+        Raises:
+            OSError: If sending fails (the batch is emptied regardless).
+        """
+        count = self._count
+        self._count = 0
+        if not count:
+            return
+
+        sent = 0
+        if self._gso_control is not None:
+            sent = self._send_segmented(sock, addr, count)
+            if sent == count:
+                return
+
+        if self._sendmmsg is None:
+            size = self._size
+            for i in range(sent, count):
+                sock.sendto(self._view[i * size:(i + 1) * size], addr)
+            return
+
+        if addr != self._addr:
+            ip, port = addr
+            family = struct.pack("=H", socket.AF_INET)  # sa_family_t is host order
+            self._name.raw = family + struct.pack("!H4s8x", port, socket.inet_aton(ip))
+            self._addr = addr
+        msgs = ctypes.byref(self._msgs, sent * ctypes.sizeof(_MMsgHdr))
+        if self._sendmmsg(sock.fileno(), msgs, count - sent, 0) < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def _send_segmented(self, sock: socket.socket, addr: tuple[str, int], count: int) -> int:
+        """Send queued datagrams as UDP_SEGMENT sends and return how many went out.
+
+        Returns early, with GSO disabled for later flushes, if the kernel or
+        the outgoing device refuses segmentation offload.
+        """
+        size = self._size
+        step = UDP_GSO_MAX_SEGMENTS * size
+        end = count * size
+        for start in range(0, end, step):
+            try:
+                segments = self._view[start:min(start + step, end)]
+                sock.sendmsg([segments], self._gso_control, 0, addr)
+            except OSError as e:
+                if e.errno not in (errno.EINVAL, errno.EIO, errno.ENOPROTOOPT, errno.EOPNOTSUPP):
+                    raise
+                self._gso_control = None
+                return start // size
+        return count
+
+
+class _DatagramReceiver:
+    """Receives up to `capacity` queued datagrams with one recvmmsg(2) call.
+
+    Datagrams longer than `size` are truncated, as with recvfrom(size).
+    Where recvmmsg is unavailable, receive() falls back to one recvfrom().
+    """
+
+    def __init__(self, capacity: int, size: int) -> None:
+        self._capacity = capacity
+        self._size = size
+        self._recvmmsg = _load_libc_mmsg("recvmmsg")
+        if self._recvmmsg is None:
+            return
+
+        self._buffer = ctypes.create_string_buffer(capacity * size)
+        self._view = memoryview(self._buffer).cast("B")
+        # One sockaddr_in per message for the sender's address
+        self._names = ctypes.create_string_buffer(capacity * 16)
+        base = ctypes.addressof(self._buffer)
+        names = ctypes.addressof(self._names)
+        self._iovecs = (_IoVec * capacity)()
+        self._msgs = (_MMsgHdr * capacity)()
+        for i in range(capacity):
+            self._iovecs[i].iov_base = base + i * size
+            self._iovecs[i].iov_len = size
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = names + i * 16
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+
+    def receive(self, sock: socket.socket) -> list[tuple[bytes | memoryview, tuple[str, int]]]:
+        """Return the (data, address) of every datagram queued on the socket, without blocking.
+
+        The data may be views of a buffer that the next call overwrites.
+
+        Raises:
+            OSError: If receiving fails for a reason other than an empty queue.
+        """
+        if self._recvmmsg is None:
+            try:
+                return [sock.recvfrom(self._size, socket.MSG_DONTWAIT)]
+            except (BlockingIOError, TimeoutError):
+                return []
+
+        msgs = self._msgs
+        for i in range(self._capacity):
+            msgs[i].msg_hdr.msg_namelen = 16  # The kernel overwrites it
+        count = self._recvmmsg(sock.fileno(), msgs, self._capacity, socket.MSG_DONTWAIT, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return []
+            raise OSError(err, os.strerror(err))
+
+        received = []
+        for i in range(count):
+            start = i * self._size
+            data = self._view[start:start + min(msgs[i].msg_len, self._size)]
+            port, address = _SOCKADDR_IN_STRUCT.unpack_from(self._names, i * 16)
+            received.append((data, (socket.inet_ntoa(address), port)))
+        return received
+
+
+class _BernoulliDraws:
+    """Per-packet fault decisions drawn from a generator in bulk.
+
+    Each draw is True with the given probability. Calling Generator.random()
+    for every packet costs several times more than indexing a precomputed
+    list, so decisions are drawn FAULT_DRAW_CHUNK at a time and refilled
+    when used up.
+    """
+
+    __slots__ = ("_rng", "_probability", "_draws", "_pos")
+
+    def __init__(self, rng: np.random.Generator, probability: float) -> None:
+        self._rng = rng
+        self._probability = probability
+        self._draws: list[bool] = []
+        self._pos = 0
+
+    def draw(self) -> bool:
+        """Return the next decision."""
+        pos = self._pos
+        if pos == len(self._draws):
+            self._draws = (self._rng.random(FAULT_DRAW_CHUNK) < self._probability).tolist()
+            pos = 0
+        self._pos = pos + 1
+        return self._draws[pos]
+
+
+@dataclass(slots=True)
 class FaultConfig:
     """Configuration for fault injection in the simulator.
 
     All probabilities are per-packet and should be in range [0.0, 1.0].
+    They are read when the SensorSimulator is created.
     """
 
     # Packet loss
@@ -62,7 +378,7 @@ class FaultConfig:
     disconnect_duration_ms: int = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulatorConfig:
     """Configuration for the sensor simulator."""
 
@@ -83,16 +399,29 @@ class SimulatorConfig:
     force_units_code: int = 2  # N
     torque_units_code: int = 3  # N-m
 
+    # Packets handed to the kernel per send; above 1, packets go out in
+    # bursts of this size via sendmmsg(2) on Linux
+    send_batch_size: int = 1
+
+    # Streaming thread placement (Linux only, best effort). For kHz rates,
+    # reserve the CPU with the isolcpus=N nohz_full=N rcu_nocbs=N kernel
+    # boot parameters. SCHED_FIFO priority (1-99) needs CAP_SYS_NICE.
+    streaming_cpu: Optional[int] = None
+    realtime_priority: Optional[int] = None
+
     # Signal generation
     signal_amplitude: int = 100000
     signal_frequency_hz: float = 1.0
     noise_stddev: int = 1000
+    # Noise is replayed from a table of this many pregenerated samples
+    # (rounded up to a power of two); 0 draws fresh noise for every sample
+    noise_table_samples: int = 65536
 
     # Fault injection
     faults: FaultConfig = field(default_factory=FaultConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulatorState:
     """Mutable state for the simulator."""
 
@@ -100,12 +429,14 @@ class SimulatorState:
     streaming_client: Optional[tuple[str, int]] = None
     rdt_sequence: int = 0
     ft_sequence: int = 0
-    bias_offset: np.ndarray = field(default_factory=lambda: np.zeros(6, dtype=np.int32))
+    # Whole counts, kept as float64 to match the synthesized signal. It is
+    # broadcast over a whole synthesized block at once, never per sample.
+    bias_offset: np.ndarray = field(default_factory=lambda: np.zeros(6, dtype=np.float64))
     running: bool = True
 
     # Fault injection state
     burst_loss_remaining: int = 0
-    disconnect_until: float = 0.0
+    disconnect_until_ns: int = 0  # time.monotonic_ns() deadline, 0 = connected
 
 
 class SensorSimulator:
@@ -132,63 +463,201 @@ class SensorSimulator:
         self._rng = np.random.default_rng(self.config.seed)
 
         self._udp_socket: Optional[socket.socket] = None
+        # Second RDT-port socket connected to the streaming client
+        self._stream_socket: Optional[socket.socket] = None
         self._tcp_socket: Optional[socket.socket] = None
-        self._http_server: Optional[HTTPServer] = None
-
-        self._udp_thread: Optional[threading.Thread] = None
-        self._tcp_thread: Optional[threading.Thread] = None
-        self._http_thread: Optional[threading.Thread] = None
+        self._http_socket: Optional[socket.socket] = None
+        # Fixed responses, built from the config by start()
+        self._calinfo_response = b""
+        self._http_responses = (b"", b"")
+
+        self._io_thread: Optional[threading.Thread] = None
+        self._io_selector: Optional[selectors.BaseSelector] = None
+        # stop() writes to the second socket to wake the IO thread
+        self._io_wakeup: Optional[tuple[socket.socket, socket.socket]] = None
+        self._udp_receiver = _DatagramReceiver(UDP_RECEIVE_BATCH_SIZE, RDT_REQUEST_SIZE)
         self._streaming_thread: Optional[threading.Thread] = None
 
-        self._start_time = time.monotonic()
+        # Signal position in sample ticks
+        self._sample_index = 0
+        self._cycles_per_sample = self.config.signal_frequency_hz / self.config.sample_rate_hz
+
+        # When a signal period is a whole number of samples, one period of all
+        # six channels is tabulated and looked up by tick instead
+        self._sine_table: Optional[np.ndarray] = None
+        period = self.config.sample_rate_hz / self.config.signal_frequency_hz
+        if period.is_integer() and period <= SINE_TABLE_MAX_SAMPLES:
+            phases = np.arange(int(period)) * (2 * math.pi / period)
+            self._sine_table = np.sin(np.add.outer(phases, _CHANNEL_PHASES))
+            self._sine_table *= self.config.signal_amplitude
+
+        # Upcoming RDT response packets, packed a block at a time into one
+        # buffer (streaming thread only). The numpy views below address the
+        # buffer's big-endian header and counts fields for every packet.
+        self._block = bytearray(SIGNAL_BLOCK_SAMPLES * RDT_RESPONSE_SIZE)
+        block_view = memoryview(self._block)
+        # One view per packet, sliced once rather than per tick
+        self._block_packets = [
+            block_view[i * RDT_RESPONSE_SIZE : (i + 1) * RDT_RESPONSE_SIZE]
+            for i in range(SIGNAL_BLOCK_SAMPLES)
+        ]
+        block_shape = (SIGNAL_BLOCK_SAMPLES, len(RESPONSE_FORMAT) - 1)
+        words = np.ndarray(block_shape, dtype=">u4", buffer=self._block)
+        self._block_sequences = words[:, :2]  # rdt_sequence, ft_sequence
+        self._block_counts = words[:, 3:].view(">i4")
+        self._block_row = SIGNAL_BLOCK_SAMPLES  # Empty until the first block
+        self._block_bias: Optional[np.ndarray] = None
+        # Sequence numbers packed into each packet, as Python ints so the
+        # per-tick check against the stream's numbering is a list lookup
+        self._block_rdt_sequences = [0] * SIGNAL_BLOCK_SAMPLES
+        self._block_ft_sequences = [0] * SIGNAL_BLOCK_SAMPLES
+
+        # Whole-count noise replayed by tick index, or None for live noise
+        self._noise_table: Optional[np.ndarray] = None
+        self._noise_mask = 0
+        if self.config.noise_table_samples > 0:
+            rows = 1 << (self.config.noise_table_samples - 1).bit_length()
+            noise = self._rng.standard_normal((rows, 6))
+            noise *= self.config.noise_stddev
+            self._noise_table = np.rint(noise).astype(np.int32)
+            self._noise_mask = rows - 1
+        # Otherwise, unread rows of the last bulk draw of live noise
+        self._noise_chunk = np.empty((0, 6))
+        self._noise_pos = 0
+
+        # Set while a client has streaming started
+        self._streaming_event = threading.Event()
+
+        # Reorder buffer for out-of-order packet simulation: a ring of
+        # preallocated packet slots, indexed by running push/pop counts
+        # (streaming thread only)
+        self._reorder_slots = [
+            bytearray(RDT_RESPONSE_SIZE)
+            for _ in range(max(self.config.faults.reorder_delay_packets, 0) + 1)
+        ]
+        self._reorder_pushed = 0
+        self._reorder_popped = 0
+
+        # Fault injection decisions (streaming thread only)
+        faults = self.config.faults
+        self._loss_draws = _BernoulliDraws(self._rng, faults.loss_probability)
+        self._burst_draws = _BernoulliDraws(self._rng, faults.burst_loss_probability)
+        self._reorder_draws = _BernoulliDraws(self._rng, faults.reorder_probability)
+        self._disconnect_draws = _BernoulliDraws(self._rng, faults.disconnect_probability)
+        # Without faults the streaming loop skips the fault checks entirely
+        self._faults_enabled = (
+            faults.loss_probability > 0
+            or faults.burst_loss_probability > 0
+            or faults.reorder_probability > 0
+            or faults.disconnect_probability > 0
+        )
+
+        # Packets queued for one batched send (streaming thread only)
+        self._send_batch: Optional[_DatagramBatch] = None
+        if self.config.send_batch_size > 1:
+            self._send_batch = _DatagramBatch(self.config.send_batch_size, RDT_RESPONSE_SIZE)
 
-        # Reorder buffer for out-of-order packet simulation
-        self._reorder_buffer: collections.deque[bytes] = collections.deque()
+    def _signal(self, first: int, count: int) -> np.ndarray:
+        """Synthesize noisy sinusoids for a run of sample ticks.
 
-    def _generate_sample(self) -> np.ndarray:
-        """Generate a simulated sensor sample.
+        Args:
+            first: Tick index of the first sample.
+            count: Number of samples.
 
         Returns:
-            Array of 6 int32 counts [Fx, Fy, Fz, Tx, Ty, Tz].
+            Float array of shape (count, 6) before bias is applied.
         """
-        t = time.monotonic() - self._start_time
-        freq = self.config.signal_frequency_hz
-        amp = self.config.signal_amplitude
-
-        # Generate sinusoidal signals with phase offsets
-        base = np.array([
-            amp * math.sin(2 * math.pi * freq * t),
-            amp * math.sin(2 * math.pi * freq * t + math.pi / 3),
-            amp * math.sin(2 * math.pi * freq * t + 2 * math.pi / 3),
-            amp * math.sin(2 * math.pi * freq * t + math.pi),
-            amp * math.sin(2 * math.pi * freq * t + 4 * math.pi / 3),
-            amp * math.sin(2 * math.pi * freq * t + 5 * math.pi / 3),
-        ], dtype=np.float64)
+        ticks = np.arange(first, first + count)
+        if self._sine_table is not None:
+            signal = self._sine_table[ticks % len(self._sine_table)]
+        else:
+            # Phase in cycles, wrapped to [0, 1) so precision holds for long runs
+            cycles = ticks * self._cycles_per_sample
+            cycles %= 1.0
+            signal = np.sin(np.add.outer(2 * math.pi * cycles, _CHANNEL_PHASES))
+            signal *= self.config.signal_amplitude
 
         # Add noise
-        noise = self._rng.normal(0, self.config.noise_stddev, 6)
+        if self._noise_table is not None:
+            ticks &= self._noise_mask
+            signal += self._noise_table[ticks]
+        else:
+            signal += self._live_noise(count)
+        return signal
+
+    def _live_noise(self, count: int) -> np.ndarray:
+        """Return the next `count` rows of never-repeating noise.
+
+        Noise is drawn NOISE_CHUNK_SAMPLES rows at a time and handed out in
+        order, so synthesizing a block does not call the generator.
+        """
+        chunk = self._noise_chunk
+        pos = self._noise_pos
+        if pos + count > len(chunk):
+            fresh = self._rng.standard_normal((max(NOISE_CHUNK_SAMPLES, count), 6))
+            fresh *= self.config.noise_stddev
+            chunk = self._noise_chunk = np.concatenate((chunk[pos:], fresh))
+            pos = 0
+        self._noise_pos = pos + count
+        return chunk[pos : pos + count]
+
+    def _capture_bias(self) -> None:
+        """Store the sample at the current stream position as the bias offset.
+
+        Replaces state.bias_offset with a new array rather than modifying it,
+        which is how _next_response() notices the change.
+        """
+        sample = self._signal(self._sample_index, 1)[0]
+        sample -= self.state.bias_offset
+        # Round to whole counts, as the streamed int32 values are
+        self.state.bias_offset = np.rint(sample, out=sample)
 
-        # Apply bias offset and convert to int32
-        counts = (base + noise - self.state.bias_offset).astype(np.int32)
-        return counts
+    def _next_response(self) -> memoryview:
+        """Return the next streamed RDT response packet (streaming thread only).
 
-    def _build_rdt_response(self, counts: np.ndarray) -> bytes:
-        """Build an RDT response packet.
+        Packets are synthesized, rounded, and packed to wire format
+        SIGNAL_BLOCK_SAMPLES at a time, so each tick is normally a slice. The
+        rest of a block is resynthesized if the bias offset changes, and its
+        sequence numbers are rewritten if the stream's numbering was reset.
 
-        Args:
-            counts: Array of 6 int32 counts.
+        Block synthesis takes roughly 40 us, about 150 ns per packet, so it is
+        left in numpy rather than compiled (e.g. with Numba): most of the
+        per-packet cost is the interpreted send loop, which stays either way.
 
         Returns:
-            36-byte RDT response packet.
+            36-byte RDT response packet, valid until the next block is packed.
         """
-        return struct.pack(
-            RESPONSE_FORMAT,
-            self.state.rdt_sequence,
-            self.state.ft_sequence,
-            0,  # status
-            counts[0], counts[1], counts[2],
-            counts[3], counts[4], counts[5],
-        )
+        state = self.state
+        bias = state.bias_offset
+        row = self._block_row
+        if row == SIGNAL_BLOCK_SAMPLES or bias is not self._block_bias:
+            if row == SIGNAL_BLOCK_SAMPLES:
+                row = 0
+                self._pack_sequences(row)
+            block = self._signal(self._sample_index, SIGNAL_BLOCK_SAMPLES - row)
+            block -= bias
+            np.rint(block, out=block)
+            np.copyto(self._block_counts[row:], block, casting="unsafe")
+            self._block_bias = bias
+        if (
+            state.rdt_sequence != self._block_rdt_sequences[row]
+            or state.ft_sequence != self._block_ft_sequences[row]
+        ):
+            self._pack_sequences(row)
+
+        self._block_row = row + 1
+        self._sample_index += 1
+        return self._block_packets[row]
+
+    def _pack_sequences(self, row: int) -> None:
+        """Number the packed packets from `row` on, continuing the stream's sequences."""
+        steps = np.arange(SIGNAL_BLOCK_SAMPLES - row)
+        rdt_sequences = (steps + self.state.rdt_sequence) & 0xFFFFFFFF
+        ft_sequences = (steps + self.state.ft_sequence) & 0xFFFFFFFF
+        self._block_sequences[row:, 0] = rdt_sequences
+        self._block_sequences[row:, 1] = ft_sequences
+        self._block_rdt_sequences[row:] = rdt_sequences.tolist()
+        self._block_ft_sequences[row:] = ft_sequences.tolist()
 
     def _should_drop_packet(self) -> bool:
         """Determine if the current packet should be dropped due to faults.
@@ -205,22 +674,23 @@ class SensorSimulator:
 
         # Check for new burst loss
         if faults.burst_loss_probability > 0:
-            if self._rng.random() < faults.burst_loss_probability:
+            if self._burst_draws.draw():
                 self.state.burst_loss_remaining = faults.burst_loss_length - 1
                 return True
 
         # Check for single packet loss
         if faults.loss_probability > 0:
-            if self._rng.random() < faults.loss_probability:
+            if self._loss_draws.draw():
                 return True
 
         return False
 
-    def _send_packet(self, response: bytes) -> None:
+    def _send_packet(self, response: bytes | memoryview) -> None:
         """Send a packet, possibly with reordering.
 
         Args:
-            response: The packet data to send.
+            response: The packet data to send. Copied into a reorder slot if
+                it has to be held back.
         """
         if self._udp_socket is None or self.state.streaming_client is None:
             return
@@ -228,180 +698,335 @@ class SensorSimulator:
         faults = self.config.faults
 
         # Check for reordering
-        if faults.reorder_probability > 0 and self._rng.random() < faults.reorder_probability:
+        if faults.reorder_probability > 0 and self._reorder_draws.draw():
             # Buffer this packet for delayed sending
-            self._reorder_buffer.append(response)
-            if len(self._reorder_buffer) >= faults.reorder_delay_packets:
+            slots = self._reorder_slots
+            slots[self._reorder_pushed % len(slots)][:] = response
+            self._reorder_pushed += 1
+            if self._reorder_pushed - self._reorder_popped >= faults.reorder_delay_packets:
                 # Send the oldest buffered packet instead
-                response = self._reorder_buffer.popleft()
-        elif self._reorder_buffer:
+                response = self._pop_reordered()
+        elif self._reorder_pushed != self._reorder_popped:
             # Randomly flush a buffered packet
-            response = self._reorder_buffer.popleft()
+            response = self._pop_reordered()
+
+        self._transmit(response)
+
+    def _transmit(self, response: bytes | memoryview) -> None:
+        """Send or batch a packet for the streaming client, without faults."""
+        if self._udp_socket is None or self.state.streaming_client is None:
+            return
 
+        if self._send_batch is not None:
+            self._send_batch.append(response)
+            if self._send_batch.full:
+                self._flush_send_batch()
+            return
+
+        # A connected socket skips converting the address tuple and the
+        # kernel's per-send route lookup
         try:
-            self._udp_socket.sendto(response, self.state.streaming_client)
+            if self._stream_socket is not None:
+                self._stream_socket.send(response)
+            else:
+                self._udp_socket.sendto(response, self.state.streaming_client)
+        except OSError:
+            pass
+
+    def _pop_reordered(self) -> bytearray:
+        """Remove the oldest held-back packet; its slot is reused by later pushes."""
+        slots = self._reorder_slots
+        slot = slots[self._reorder_popped % len(slots)]
+        self._reorder_popped += 1
+        return slot
+
+    def _flush_send_batch(self) -> None:
+        """Send packets queued by _send_packet() when batching is enabled."""
+        batch = self._send_batch
+        if batch is None or not len(batch):
+            return
+        client = self.state.streaming_client
+        if self._udp_socket is None or client is None:
+            batch.clear()
+            return
+        try:
+            batch.flush(self._udp_socket, client)
         except OSError:
             pass
 
     def _streaming_loop(self) -> None:
-        """Main streaming loop - sends RDT packets at configured rate."""
-        interval = 1.0 / self.config.sample_rate_hz
-        next_send = time.monotonic()
+        """Streaming thread body - streams while started, idles while stopped."""
+        apply_thread_scheduling(self.config.streaming_cpu, self.config.realtime_priority)
+
+        # The thread outlives STOP so a quick STOP/START cannot race with it
+        # exiting; between streams it blocks on the event instead of pacing
+        while self.state.running:
+            if self._streaming_event.wait(timeout=0.1):
+                self._stream_packets()
+
+    def _stream_packets(self) -> None:
+        """Send RDT packets at the configured rate until streaming stops."""
+        # Integer nanosecond deadlines so pacing does not drift over long runs.
+        # Each deadline sends at least one whole send batch, and enough
+        # packets that the clock is read at most STREAM_MAX_WAKEUPS_PER_SECOND
+        # times a second.
+        rate = self.config.sample_rate_hz
+        packets_per_deadline = max(
+            self.config.send_batch_size, -(-rate // STREAM_MAX_WAKEUPS_PER_SECOND)
+        )
+        interval_ns = 1_000_000_000 * packets_per_deadline // rate
         faults = self.config.faults
 
-        while self.state.running and self.state.streaming:
-            now = time.monotonic()
+        # Local bindings for the per-packet path
+        state = self.state
+        monotonic_ns = time.monotonic_ns
+        next_response = self._next_response
+        should_drop = self._should_drop_packet
+        send_packet = self._send_packet
+        transmit = self._transmit
+        faults_enabled = self._faults_enabled
+
+        next_send_ns = monotonic_ns()
+
+        while state.running and state.streaming:
+            now_ns = monotonic_ns()
 
             # Check for disconnect fault
-            if self.state.disconnect_until > 0:
-                if now < self.state.disconnect_until:
+            if state.disconnect_until_ns:
+                if now_ns < state.disconnect_until_ns:
                     # Still disconnected, skip packet generation
-                    next_send = now + interval
-                    time.sleep(max(0, interval * 0.9))
+                    next_send_ns = now_ns + interval_ns
+                    _sleep_until(next_send_ns - STREAM_SPIN_NS)
                     continue
                 else:
                     # Disconnect period ended
-                    self.state.disconnect_until = 0.0
-
-            if now >= next_send:
-                if self.state.streaming_client and self._udp_socket:
-                    counts = self._generate_sample()
-                    response = self._build_rdt_response(counts)
-
-                    # Apply fault injection
-                    if not self._should_drop_packet():
-                        self._send_packet(response)
-
-                    self.state.rdt_sequence = (self.state.rdt_sequence + 1) & 0xFFFFFFFF
-                    self.state.ft_sequence = (self.state.ft_sequence + 1) & 0xFFFFFFFF
-
-                    # Check for new disconnect fault
-                    if faults.disconnect_probability > 0:
-                        if self._rng.random() < faults.disconnect_probability:
-                            self.state.disconnect_until = now + faults.disconnect_duration_ms / 1000.0
-
-                next_send += interval
-                if next_send < now:
-                    next_send = now + interval
+                    state.disconnect_until_ns = 0
+
+            if now_ns >= next_send_ns:
+                if state.streaming_client and self._udp_socket:
+                    if not faults_enabled:
+                        # Fault-free fast path: no drop, reorder or disconnect checks
+                        for _ in range(packets_per_deadline):
+                            transmit(next_response())
+                            state.rdt_sequence = (state.rdt_sequence + 1) & 0xFFFFFFFF
+                            state.ft_sequence = (state.ft_sequence + 1) & 0xFFFFFFFF
+                    else:
+                        for _ in range(packets_per_deadline):
+                            response = next_response()
+
+                            # Apply fault injection
+                            if not should_drop():
+                                send_packet(response)
+
+                            state.rdt_sequence = (state.rdt_sequence + 1) & 0xFFFFFFFF
+                            state.ft_sequence = (state.ft_sequence + 1) & 0xFFFFFFFF
+
+                            # Check for new disconnect fault
+                            if faults.disconnect_probability > 0:
+                                if self._disconnect_draws.draw():
+                                    state.disconnect_until_ns = (
+                                        now_ns + faults.disconnect_duration_ms * 1_000_000
+                                    )
+                                    break
+
+                    self._flush_send_batch()
+
+                next_send_ns += interval_ns
+                if next_send_ns < now_ns:
+                    next_send_ns = now_ns + interval_ns
             else:
-                time.sleep(max(0, next_send - now - 0.0001))
+                if next_send_ns - now_ns > STREAM_SPIN_NS:
+                    _sleep_until(next_send_ns - STREAM_SPIN_NS)
+                else:
+                    while monotonic_ns() < next_send_ns:
+                        # Let the other simulator threads take the GIL
+                        time.sleep(0)
 
-    def _handle_udp(self) -> None:
-        """Handle incoming UDP RDT requests."""
-        if self._udp_socket is None:
-            return
+    def _serve_io(self) -> None:
+        """Serve UDP requests, TCP commands and HTTP from this one thread.
 
-        self._udp_socket.settimeout(0.1)
+        Every registered socket carries a zero-argument callback as its
+        selector data; the loop just runs whichever callbacks are ready.
+        Selecting has no timeout, so the thread sleeps until a socket is
+        ready or stop() writes to the wakeup socket.
+        """
+        selector = self._io_selector
+        if selector is None or self._io_wakeup is None:
+            return
 
-        while self.state.running:
+        try:
+            while self.state.running:
+                for key, _ in selector.select():
+                    key.data()
+        finally:
+            listeners = (
+                self._udp_socket, self._tcp_socket, self._http_socket, self._io_wakeup[0]
+            )
+            for key in list(selector.get_map().values()):
+                if key.fileobj not in listeners:
+                    key.fileobj.close()  # type: ignore[union-attr]
+            selector.close()
+            self._io_selector = None
+
+    def _drain_wakeup(self) -> None:
+        """Consume stop() wakeup bytes; the loop then sees running is False."""
+        if self._io_wakeup is not None:
             try:
-                data, addr = self._udp_socket.recvfrom(RDT_REQUEST_SIZE)
-            except socket.timeout:
-                continue
+                self._io_wakeup[0].recv(64)
             except OSError:
-                break
+                pass
 
-            if len(data) != RDT_REQUEST_SIZE:
-                continue
+    def _drain_udp(self, sock: socket.socket) -> None:
+        """Handle every RDT request datagram queued on an RDT-port socket."""
+        try:
+            requests = self._udp_receiver.receive(sock)
+        except OSError:
+            # Includes ICMP errors reported on the connected stream socket
+            return
+        for data, addr in requests:
+            self._handle_rdt_request(data, addr)
 
-            header, command, sample_count = struct.unpack(REQUEST_FORMAT, data)
-            if header != RDT_HEADER:
-                continue
+    def _connect_stream_socket(self, addr: tuple[str, int]) -> None:
+        """Point the stream socket at a new streaming client (IO thread only).
 
-            if command == RdtCommand.START_REALTIME:
-                self.state.streaming_client = addr
-                self.state.streaming = True
-                self.state.rdt_sequence = 0
-                self.state.ft_sequence = 0
-                if self._streaming_thread is None or not self._streaming_thread.is_alive():
-                    self._streaming_thread = threading.Thread(target=self._streaming_loop, daemon=True)
-                    self._streaming_thread.start()
+        The socket shares the RDT port, so packets keep the sensor's source
+        port. Being connected, it also receives the client's later requests
+        in place of the main socket, so it is served by the same selector.
+        Only used on Linux (see _CONNECTED_STREAM_SOCKET). If it cannot be
+        set up, packets are sent from the main socket.
+        """
+        sock = self._stream_socket
+        try:
+            if sock is None:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.bind(("", self.config.udp_port))
+                self._set_low_latency_options(sock)
+                sock.settimeout(0.1)
+            # Re-connecting an existing socket just changes its peer
+            sock.connect(addr)
+        except OSError:
+            if sock is not None:
+                sock.close()
+            self._stream_socket = None
+            return
+        if self._stream_socket is None and self._io_selector is not None:
+            self._io_selector.register(
+                sock, selectors.EVENT_READ, functools.partial(self._drain_udp, sock)
+            )
+        self._stream_socket = sock
 
-            elif command == RdtCommand.STOP:
-                self.state.streaming = False
+    def _handle_rdt_request(self, data: bytes | memoryview, addr: tuple[str, int]) -> None:
+        """Execute one RDT request datagram."""
+        if len(data) != RDT_REQUEST_SIZE:
+            return
 
-            elif command == RdtCommand.SET_BIAS:
-                # Store current values as bias offset
-                self.state.bias_offset = self._generate_sample()
+        header, command, sample_count = _REQUEST_STRUCT.unpack_from(data)
+        if header != RDT_HEADER:
+            return
 
-    def _handle_tcp_client(self, client_socket: socket.socket) -> None:
-        """Handle a TCP client connection."""
-        client_socket.settimeout(1.0)
+        state = self.state
+        if command == RdtCommand.START_REALTIME:
+            if _CONNECTED_STREAM_SOCKET and (
+                addr != state.streaming_client or self._stream_socket is None
+            ):
+                self._connect_stream_socket(addr)
+            state.streaming_client = addr
+            state.streaming = True
+            state.rdt_sequence = 0
+            state.ft_sequence = 0
+            self._streaming_event.set()
+            if self._streaming_thread is None or not self._streaming_thread.is_alive():
+                self._streaming_thread = threading.Thread(target=self._streaming_loop, daemon=True)
+                self._streaming_thread.start()
+
+        elif command == RdtCommand.STOP:
+            self._streaming_event.clear()
+            state.streaming = False
+
+        elif command == RdtCommand.SET_BIAS:
+            # Store current values as bias offset
+            self._capture_bias()
+
+    def _handle_tcp_command(self, client_socket: socket.socket, request: bytes) -> None:
+        """Execute one fixed-size TCP command request."""
+        command = request[0]
+
+        if command == TcpCommand.READCALINFO:
+            client_socket.sendall(self._calinfo_response)
+
+        elif command == TcpCommand.READFT:
+            # Check for bias flag
+            sys_commands = _SYS_COMMANDS_STRUCT.unpack_from(request, READFT_SYS_COMMANDS_OFFSET)[0]
+            if sys_commands & 0x0001:
+                self._capture_bias()
+
+        elif command == TcpCommand.WRITETRANSFORM:
+            # Accept transform command (no response needed)
+            pass
 
+    def _read_tcp_client(self, client_socket: socket.socket, pending: bytearray) -> None:
+        """Read from a ready client and run each complete request received."""
         try:
-            while self.state.running:
-                try:
-                    data = client_socket.recv(CALINFO_REQUEST_SIZE)
-                except socket.timeout:
-                    continue
-                except OSError:
-                    break
-
-                if not data:
-                    break
-
-                command = data[0]
-
-                if command == TcpCommand.READCALINFO:
-                    response = struct.pack(
-                        ">HBBII6H",
-                        TCP_RESPONSE_HEADER,
-                        self.config.force_units_code,
-                        self.config.torque_units_code,
-                        self.config.counts_per_force,
-                        self.config.counts_per_torque,
-                        1, 1, 1, 1, 1, 1,  # scale factors
-                    )
-                    client_socket.sendall(response)
-
-                elif command == TcpCommand.READFT:
-                    # Check for bias flag
-                    if len(data) >= 20:
-                        sys_commands = struct.unpack_from(">H", data, 18)[0]
-                        if sys_commands & 0x0001:
-                            self.state.bias_offset = self._generate_sample()
-
-                elif command == TcpCommand.WRITETRANSFORM:
-                    # Accept transform command (no response needed)
-                    pass
-
-        finally:
-            client_socket.close()
-
-    def _handle_tcp(self) -> None:
-        """Accept and handle TCP connections."""
-        if self._tcp_socket is None:
+            data = client_socket.recv(4096)
+        except BlockingIOError:
             return
+        except OSError:
+            data = b""
 
-        self._tcp_socket.settimeout(0.1)
-
-        while self.state.running:
+        if data:
+            # All command requests are CALINFO_REQUEST_SIZE bytes. Complete
+            # ones are handled in order, then trimmed off together.
+            pending += data
+            complete = len(pending) - len(pending) % CALINFO_REQUEST_SIZE
             try:
-                client_socket, _ = self._tcp_socket.accept()
-            except socket.timeout:
-                continue
+                for start in range(0, complete, CALINFO_REQUEST_SIZE):
+                    request = pending[start : start + CALINFO_REQUEST_SIZE]
+                    self._handle_tcp_command(client_socket, request)
+                del pending[:complete]
+                return
             except OSError:
-                break
+                pass
 
-            # Handle client in a separate thread
-            client_thread = threading.Thread(
-                target=self._handle_tcp_client,
-                args=(client_socket,),
-                daemon=True,
-            )
-            client_thread.start()
+        # Closed by the peer, or a send failed
+        self._close_io_client(client_socket)
 
-    def _create_http_handler(self) -> type:
-        """Create an HTTP request handler class with access to simulator config."""
-        config = self.config
+    def _close_io_client(self, client_socket: socket.socket) -> None:
+        """Stop watching a client connection and close it."""
+        if self._io_selector is not None:
+            self._io_selector.unregister(client_socket)
+        client_socket.close()
 
-        class CalibrationHandler(BaseHTTPRequestHandler):
-            def log_message(self, format: str, *args: object) -> None:
-                pass  # Suppress logging
+    def _accept_client(self, listener: socket.socket, reader: Callable[..., None]) -> None:
+        """Accept a connection and register it to be served by ``reader``.
 
-            def do_GET(self) -> None:
-                if self.path == "/netftapi2.xml":
-                    xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+        The reader is called with the client socket and a bytearray holding
+        the request bytes received so far.
+        """
+        try:
+            client_socket, _ = listener.accept()
+        except OSError:
+            # BlockingIOError when another wakeup already took it
+            return
+        selector = self._io_selector
+        if selector is None:
+            client_socket.close()
+            return
+        client_socket.setblocking(False)
+        selector.register(
+            client_socket,
+            selectors.EVENT_READ,
+            functools.partial(reader, client_socket, bytearray()),
+        )
+
+    def _build_http_responses(self) -> tuple[bytes, bytes]:
+        """Build the complete calibration and not-found HTTP responses.
+
+        The configuration is fixed once the simulator starts, so every
+        response is one of these two byte strings.
+        """
+        config = self.config
+        xml = f"""<?xml version="1.0" encoding="UTF-8"?>
 <netftapi2>
     <cfgcpf>{config.counts_per_force}</cfgcpf>
     <cfgcpt>{config.counts_per_torque}</cfgcpt>
@@ -409,78 +1034,164 @@ class SensorSimulator:
     <cfgtu>{config.torque_units_code}</cfgtu>
     <setserial>{config.serial_number}</setserial>
     <setfwver>{config.firmware_version}</setfwver>
-</netftapi2>"""
-                    self.send_response(200)
-                    self.send_header("Content-Type", "application/xml")
-                    self.send_header("Content-Length", str(len(xml)))
-                    self.end_headers()
-                    self.wfile.write(xml.encode("utf-8"))
-                else:
-                    self.send_response(404)
-                    self.end_headers()
+</netftapi2>""".encode("utf-8")
+        calibration_response = (
+            b"HTTP/1.0 200 OK\r\n"
+            b"Content-Type: application/xml\r\n"
+            b"Content-Length: " + str(len(xml)).encode("ascii") + b"\r\n"
+            b"\r\n" + xml
+        )
+        not_found_response = b"HTTP/1.0 404 Not Found\r\nContent-Length: 0\r\n\r\n"
+        return calibration_response, not_found_response
 
-        return CalibrationHandler
+    def _read_http_client(self, client_socket: socket.socket, request: bytearray) -> None:
+        """Buffer a request head, then answer it with a prebuilt response."""
+        try:
+            data = client_socket.recv(HTTP_MAX_REQUEST_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._close_io_client(client_socket)
+            return
 
-    def _handle_http(self) -> None:
-        """Run the HTTP server."""
-        if self._http_server is None:
+        request += data
+        # Read the whole head so closing doesn't reset the connection
+        # under unread request bytes
+        if data and b"\r\n\r\n" not in request and len(request) < HTTP_MAX_REQUEST_SIZE:
             return
 
-        self._http_server.timeout = 0.1
-        while self.state.running:
-            self._http_server.handle_request()
+        calibration_response, not_found_response = self._http_responses
+        response = (
+            calibration_response
+            if request.startswith(b"GET /netftapi2.xml ")
+            else not_found_response
+        )
+        try:
+            # Responses are a few hundred bytes, well inside an empty send
+            # buffer; the timeout only bounds a stalled peer
+            client_socket.settimeout(1.0)
+            client_socket.sendall(response)
+        except OSError:
+            pass
+        self._close_io_client(client_socket)
+
+    def _set_low_latency_options(self, sock: socket.socket) -> None:
+        """Mark the RDT socket's traffic as latency-sensitive (best effort).
+
+        Bounds the send buffer, requests the low-delay TOS, and on Linux raises
+        the socket priority so packets skip the bulk qdisc bands. Options the
+        platform lacks or refuses are skipped.
+        """
+        options = [
+            (socket.SOL_SOCKET, socket.SO_SNDBUF, UDP_SEND_BUFFER_SIZE),
+            (socket.IPPROTO_IP, getattr(socket, "IP_TOS", None), 0x10),  # IPTOS_LOWDELAY
+            (socket.SOL_SOCKET, getattr(socket, "SO_PRIORITY", None), 6),
+        ]
+        for level, option, value in options:
+            if option is None:
+                continue
+            try:
+                sock.setsockopt(level, option, value)
+            except OSError:
+                pass
 
     def start(self) -> None:
         """Start the simulator."""
         self.state.running = True
-        self._start_time = time.monotonic()
+        self._streaming_event.clear()
 
         # Start UDP server
         self._udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self._udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self._udp_socket.bind(("", self.config.udp_port))
-        self._udp_thread = threading.Thread(target=self._handle_udp, daemon=True)
-        self._udp_thread.start()
+        self._set_low_latency_options(self._udp_socket)
+        # The timeout keeps sends from the streaming thread from blocking;
+        # receives never block since recvmmsg is called with MSG_DONTWAIT
+        # after the selector reports the socket readable
+        self._udp_socket.settimeout(0.1)
 
         # Start TCP server
+        self._calinfo_response = _CALINFO_RESPONSE_STRUCT.pack(
+            TCP_RESPONSE_HEADER,
+            self.config.force_units_code,
+            self.config.torque_units_code,
+            self.config.counts_per_force,
+            self.config.counts_per_torque,
+            1, 1, 1, 1, 1, 1,  # scale factors
+        )
         self._tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self._tcp_socket.bind(("", self.config.tcp_port))
         self._tcp_socket.listen(5)
-        self._tcp_thread = threading.Thread(target=self._handle_tcp, daemon=True)
-        self._tcp_thread.start()
+        self._tcp_socket.setblocking(False)
 
         # Start HTTP server
-        handler_class = self._create_http_handler()
-        self._http_server = HTTPServer(("", self.config.http_port), handler_class)
-        self._http_thread = threading.Thread(target=self._handle_http, daemon=True)
-        self._http_thread.start()
+        self._http_responses = self._build_http_responses()
+        self._http_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._http_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._http_socket.bind(("", self.config.http_port))
+        self._http_socket.listen(5)
+        self._http_socket.setblocking(False)
+
+        # Serve all three from one selector thread
+        self._io_wakeup = socket.socketpair()
+        for wakeup_socket in self._io_wakeup:
+            wakeup_socket.setblocking(False)
+        selector = selectors.DefaultSelector()
+        selector.register(self._io_wakeup[0], selectors.EVENT_READ, self._drain_wakeup)
+        selector.register(
+            self._udp_socket,
+            selectors.EVENT_READ,
+            functools.partial(self._drain_udp, self._udp_socket),
+        )
+        selector.register(
+            self._tcp_socket,
+            selectors.EVENT_READ,
+            functools.partial(self._accept_client, self._tcp_socket, self._read_tcp_client),
+        )
+        selector.register(
+            self._http_socket,
+            selectors.EVENT_READ,
+            functools.partial(self._accept_client, self._http_socket, self._read_http_client),
+        )
+        self._io_selector = selector
+        self._io_thread = threading.Thread(target=self._serve_io, daemon=True)
+        self._io_thread.start()
 
     def stop(self) -> None:
         """Stop the simulator."""
         self.state.running = False
         self.state.streaming = False
+        self._streaming_event.set()  # Wake an idle streaming thread to exit
+        if self._io_wakeup is not None:
+            try:
+                self._io_wakeup[1].send(b"\0")
+            except OSError:
+                pass  # Buffer already holds an unread wakeup
 
         # Wait for threads to finish
         if self._streaming_thread and self._streaming_thread.is_alive():
             self._streaming_thread.join(timeout=1.0)
-        if self._udp_thread and self._udp_thread.is_alive():
-            self._udp_thread.join(timeout=1.0)
-        if self._tcp_thread and self._tcp_thread.is_alive():
-            self._tcp_thread.join(timeout=1.0)
-        if self._http_thread and self._http_thread.is_alive():
-            self._http_thread.join(timeout=1.0)
+        if self._io_thread and self._io_thread.is_alive():
+            self._io_thread.join(timeout=1.0)
 
         # Close sockets
         if self._udp_socket:
             self._udp_socket.close()
             self._udp_socket = None
+        if self._stream_socket:
+            self._stream_socket.close()
+            self._stream_socket = None
         if self._tcp_socket:
             self._tcp_socket.close()
             self._tcp_socket = None
-        if self._http_server:
-            self._http_server.server_close()
-            self._http_server = None
+        if self._http_socket:
+            self._http_socket.close()
+            self._http_socket = None
+        if self._io_wakeup:
+            for wakeup_socket in self._io_wakeup:
+                wakeup_socket.close()
+            self._io_wakeup = None
 
     def __enter__(self) -> "SensorSimulator":
         """Context manager entry."""
@@ -503,8 +1214,22 @@ def main() -> None:
     parser.add_argument("--http-port", type=int, default=8080, help="HTTP calibration port")
     parser.add_argument("--rate", type=int, default=1000, help="Sample rate in Hz")
     parser.add_argument("--seed", type=int, default=None, help="Random seed for deterministic output")
+    parser.add_argument(
+        "--noise-table",
+        type=int,
+        default=65536,
+        help="Pregenerated noise samples to replay (0 = fresh noise per sample)",
+    )
     parser.add_argument("--cpf", type=int, default=1000000, help="Counts per force")
     parser.add_argument("--cpt", type=int, default=1000000, help="Counts per torque")
+    parser.add_argument(
+        "--send-batch",
+        type=int,
+        default=1,
+        help="Packets per send call (UDP GSO or sendmmsg on Linux)",
+    )
+    parser.add_argument("--streaming-cpu", type=int, default=None, help="CPU to pin the streaming thread to")
+    parser.add_argument("--rt-priority", type=int, default=None, help="SCHED_FIFO priority for the streaming thread")
 
     # Fault injection arguments
     parser.add_argument("--loss", type=float, default=0.0, help="Packet loss probability (0.0-1.0)")
@@ -533,8 +1258,12 @@ def main() -> None:
         http_port=args.http_port,
         sample_rate_hz=args.rate,
         seed=args.seed,
+        noise_table_samples=args.noise_table,
         counts_per_force=args.cpf,
         counts_per_torque=args.cpt,
+        send_batch_size=args.send_batch,
+        streaming_cpu=args.streaming_cpu,
+        realtime_priority=args.rt_priority,
         faults=fault_config,
     )
 
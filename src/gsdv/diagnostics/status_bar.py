@@ -49,6 +49,10 @@ class StatusBarTarget(Protocol):
 def build_status_warning(stats: AcquisitionStats, *, dropped_by_app: int = 0) -> str | None:
     """Build a single status-bar warning string from current diagnostics."""
 
+    # Steady state: nothing to report, so skip building the parts list
+    if stats.packets_lost <= 0 and stats.receive_errors <= 0 and dropped_by_app <= 0:
+        return None
+
     parts: list[str] = []
 
     if stats.packets_lost > 0:
@@ -93,7 +97,11 @@ def status_bar_snapshot_from_acquisition(
 
 
 class StatusBarPoller(QObject):
-    """Periodically pulls a snapshot and applies it to a status bar target."""
+    """Periodically pulls a snapshot and applies it to a status bar target.
+
+    Only values that changed since the last applied snapshot are pushed to the
+    target; the first tick after start() applies every value.
+    """
 
     def __init__(
         self,
@@ -109,6 +117,7 @@ class StatusBarPoller(QObject):
 
         self._target = target
         self._snapshot_provider = snapshot_provider
+        self._last: StatusBarSnapshot | None = None
 
         self._timer = QTimer(self)
         self._timer.setInterval(interval_ms)
@@ -121,6 +130,7 @@ class StatusBarPoller(QObject):
 
     def start(self) -> None:
         """Start periodic polling."""
+        self._last = None
         self._timer.start()
 
     def stop(self) -> None:
@@ -140,19 +150,26 @@ class StatusBarPoller(QObject):
             self._best_effort_warning(f"Diagnostics update stopped: {type(exc).__name__}")
             return
 
-        if snapshot is None:
+        last = self._last
+        if snapshot is None or snapshot == last:
             return
 
         try:
-            self._target.update_sample_rate(snapshot.sample_rate_hz)
-            self._target.update_buffer_status(snapshot.buffer_fill_percent)
-            self._target.update_packet_loss(snapshot.packets_lost)
-            self._target.update_dropped_count(snapshot.dropped_by_app)
-
-            if snapshot.warning_message:
-                self._target.show_warning(snapshot.warning_message)
-            else:
-                self._target.clear_warning()
+            if last is None or snapshot.sample_rate_hz != last.sample_rate_hz:
+                self._target.update_sample_rate(snapshot.sample_rate_hz)
+            if last is None or snapshot.buffer_fill_percent != last.buffer_fill_percent:
+                self._target.update_buffer_status(snapshot.buffer_fill_percent)
+            if last is None or snapshot.packets_lost != last.packets_lost:
+                self._target.update_packet_loss(snapshot.packets_lost)
+            if last is None or snapshot.dropped_by_app != last.dropped_by_app:
+                self._target.update_dropped_count(snapshot.dropped_by_app)
+
+            if last is None or snapshot.warning_message != last.warning_message:
+                if snapshot.warning_message:
+                    self._target.show_warning(snapshot.warning_message)
+                else:
+                    self._target.clear_warning()
+            self._last = snapshot
         except Exception as exc:
             self.stop()
             self._best_effort_warning(f"Diagnostics update stopped: {type(exc).__name__}")
@@ -9,11 +9,15 @@ Error taxonomy:
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Any, ClassVar, Optional
 
 
 class ErrorCategory(Enum):
-    """Error category for classification and routing."""
+    """Error category for classification and routing.
+
+    Members are singletons, so route on them by identity:
+    ``err.category is ErrorCategory.NET``.
+    """
 
     NET = "NET"
     PROTO = "PROTO"
@@ -22,7 +26,11 @@ class ErrorCategory(Enum):
 
 
 class RecoveryAction(Enum):
-    """Suggested recovery action for the user."""
+    """Suggested recovery action for the user.
+
+    Like ErrorCategory, members are compared by identity
+    (``err.recovery is RecoveryAction.RETRY``).
+    """
 
     RETRY = "retry"
     RECONNECT = "reconnect"
@@ -50,6 +58,20 @@ class ErrorContext:
     original_error: Optional[str] = None
 
 
+# ErrorContext is frozen, so contexts that only name a protocol (the usual
+# case for per-packet protocol errors) are built once and shared
+_EMPTY_CONTEXT = ErrorContext()
+_PROTOCOL_CONTEXTS = {
+    protocol: ErrorContext(protocol=protocol) for protocol in ("RDT", "UDP", "TCP", "HTTP")
+}
+
+
+def _protocol_context(protocol: str) -> ErrorContext:
+    """Return an ErrorContext naming only a protocol, shared where possible."""
+    context = _PROTOCOL_CONTEXTS.get(protocol)
+    return context if context is not None else ErrorContext(protocol=protocol)
+
+
 class GsdvError(Exception):
     """Base exception for all GSDV errors.
 
@@ -61,32 +83,85 @@ class GsdvError(Exception):
         context: Additional error context.
     """
 
+    # Errors can be raised per packet, so attributes live in slots rather
+    # than a per-instance __dict__
+    __slots__ = ("category", "code", "_message", "recovery", "context")
+
+    # Used by subclasses that pass message=None: the message is formatted
+    # from self.args on first access, so errors that are caught and dropped
+    # never pay for string formatting
+    _message_template: ClassVar[str] = ""
+
     def __init__(
         self,
         category: ErrorCategory,
         code: str,
-        message: str,
+        message: Optional[str],
         recovery: RecoveryAction,
         context: Optional[ErrorContext] = None,
     ) -> None:
-        super().__init__(message)
+        if message is not None:
+            super().__init__(message)
         self.category = category
         self.code = code
-        self.message = message
+        self._message = message
         self.recovery = recovery
-        self.context = context or ErrorContext()
+        self.context = context or _EMPTY_CONTEXT
+
+    @property
+    def message(self) -> str:
+        """User-friendly error message."""
+        message = self._message
+        if message is None:
+            message = self._message = self._message_template.format(*self.args)
+        return message
 
     def __str__(self) -> str:
         return f"[{self.code}] {self.message}"
 
+    def __reduce__(self) -> tuple[object, ...]:
+        # Exception pickling re-calls __init__ with self.args, which don't
+        # match the subclass signatures; rebuild from the stored fields
+        return (
+            _restore_error,
+            (
+                type(self),
+                self.category,
+                self.code,
+                self.message,
+                self.recovery,
+                self.context,
+                self.args,
+            ),
+        )
+
     def user_message(self) -> str:
         """Return a user-friendly message suitable for display in the UI."""
         return self.message
 
 
+def _restore_error(
+    cls: type[GsdvError],
+    category: ErrorCategory,
+    code: str,
+    message: str,
+    recovery: RecoveryAction,
+    context: ErrorContext,
+    args: tuple[Any, ...],
+) -> GsdvError:
+    """Recreate a pickled error without calling the subclass __init__."""
+    error = cls.__new__(cls)
+    GsdvError.__init__(error, category, code, message, recovery, context)
+    # Lazy-message errors keep their format parameters in args, not the message
+    error.args = args
+    return error
+
+
 class NetworkError(GsdvError):
     """Network-related errors (connection, timeout, socket issues)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         code: str,
@@ -100,6 +175,8 @@ class NetworkError(GsdvError):
 class SensorConnectionRefused(NetworkError):
     """Connection was refused by the remote host."""
 
+    __slots__ = ()
+
     def __init__(self, host: str, port: int, original_error: Optional[str] = None) -> None:
         context = ErrorContext(host=host, port=port, original_error=original_error)
         super().__init__(
@@ -113,6 +190,8 @@ class SensorConnectionRefused(NetworkError):
 class SensorConnectionTimeout(NetworkError):
     """Connection attempt timed out."""
 
+    __slots__ = ()
+
     def __init__(self, host: str, port: int, timeout_seconds: float) -> None:
         context = ErrorContext(host=host, port=port)
         super().__init__(
@@ -126,6 +205,8 @@ class SensorConnectionTimeout(NetworkError):
 class NetworkDisconnectError(NetworkError):
     """Connection was lost unexpectedly."""
 
+    __slots__ = ()
+
     def __init__(self, host: str, port: int, original_error: Optional[str] = None) -> None:
         context = ErrorContext(host=host, port=port, original_error=original_error)
         super().__init__(
@@ -139,6 +220,8 @@ class NetworkDisconnectError(NetworkError):
 class SocketError(NetworkError):
     """Low-level socket error."""
 
+    __slots__ = ()
+
     def __init__(self, host: str, port: int, operation: str, original_error: str) -> None:
         context = ErrorContext(host=host, port=port, original_error=original_error)
         super().__init__(
@@ -152,10 +235,12 @@ class SocketError(NetworkError):
 class ProtocolError(GsdvError):
     """Protocol parsing or communication errors."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         code: str,
-        message: str,
+        message: Optional[str],
         recovery: RecoveryAction = RecoveryAction.RECONNECT,
         context: Optional[ErrorContext] = None,
     ) -> None:
@@ -165,13 +250,21 @@ class ProtocolError(GsdvError):
 class MalformedPacketError(ProtocolError):
     """Received packet has invalid format or length."""
 
+    __slots__ = ()
+
+    _message_template = "Malformed {0} packet: expected {1} bytes, got {2}."
+
     def __init__(
         self, protocol: str, expected_size: int, actual_size: int, host: Optional[str] = None
     ) -> None:
-        context = ErrorContext(host=host, protocol=protocol)
+        if host is None:
+            context = _protocol_context(protocol)
+        else:
+            context = ErrorContext(host=host, protocol=protocol)
+        self.args = (protocol, expected_size, actual_size)
         super().__init__(
             code="PROTO-001",
-            message=f"Malformed {protocol} packet: expected {expected_size} bytes, got {actual_size}.",
+            message=None,
             recovery=RecoveryAction.RECONNECT,
             context=context,
         )
@@ -180,11 +273,16 @@ class MalformedPacketError(ProtocolError):
 class InvalidHeaderError(ProtocolError):
     """Packet header is invalid or missing."""
 
+    __slots__ = ()
+
+    _message_template = "Invalid {0} header: expected {1}, got {2}."
+
     def __init__(self, protocol: str, expected: str, actual: str) -> None:
-        context = ErrorContext(protocol=protocol)
+        context = _protocol_context(protocol)
+        self.args = (protocol, expected, actual)
         super().__init__(
             code="PROTO-002",
-            message=f"Invalid {protocol} header: expected {expected}, got {actual}.",
+            message=None,
             recovery=RecoveryAction.RECONNECT,
             context=context,
         )
@@ -193,11 +291,16 @@ class InvalidHeaderError(ProtocolError):
 class PacketParseError(ProtocolError):
     """Failed to parse packet contents."""
 
+    __slots__ = ()
+
+    _message_template = "Failed to parse {0} packet field '{1}': {2}"
+
     def __init__(self, protocol: str, field: str, reason: str) -> None:
-        context = ErrorContext(protocol=protocol)
+        context = _protocol_context(protocol)
+        self.args = (protocol, field, reason)
         super().__init__(
             code="PROTO-003",
-            message=f"Failed to parse {protocol} packet field '{field}': {reason}",
+            message=None,
             recovery=RecoveryAction.RECONNECT,
             context=context,
         )
@@ -206,11 +309,16 @@ class PacketParseError(ProtocolError):
 class SequenceGapError(ProtocolError):
     """Detected gap in sequence numbers indicating packet loss."""
 
+    __slots__ = ()
+
+    _message_template = "Packet loss detected: expected sequence {0}, got {1} ({2} packets lost)."
+
     def __init__(self, expected_seq: int, actual_seq: int, gap_size: int) -> None:
-        context = ErrorContext(protocol="RDT")
+        context = _protocol_context("RDT")
+        self.args = (expected_seq, actual_seq, gap_size)
         super().__init__(
             code="PROTO-004",
-            message=f"Packet loss detected: expected sequence {expected_seq}, got {actual_seq} ({gap_size} packets lost).",
+            message=None,
             recovery=RecoveryAction.MANUAL,
             context=context,
         )
@@ -219,6 +327,8 @@ class SequenceGapError(ProtocolError):
 class CalibrationError(GsdvError):
     """Calibration retrieval or parsing errors."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         code: str,
@@ -232,6 +342,8 @@ class CalibrationError(GsdvError):
 class HttpCalibrationError(CalibrationError):
     """Failed to retrieve calibration via HTTP."""
 
+    __slots__ = ()
+
     def __init__(self, host: str, status_code: Optional[int] = None, reason: str = "") -> None:
         context = ErrorContext(host=host, port=80, protocol="HTTP")
         if status_code:
@@ -249,6 +361,8 @@ class HttpCalibrationError(CalibrationError):
 class TcpCalibrationError(CalibrationError):
     """Failed to retrieve calibration via TCP."""
 
+    __slots__ = ()
+
     def __init__(self, host: str, reason: str) -> None:
         context = ErrorContext(host=host, port=49151, protocol="TCP")
         super().__init__(
@@ -262,8 +376,10 @@ class TcpCalibrationError(CalibrationError):
 class CalibrationParseError(CalibrationError):
     """Failed to parse calibration data."""
 
+    __slots__ = ()
+
     def __init__(self, protocol: str, field: str, reason: str) -> None:
-        context = ErrorContext(protocol=protocol)
+        context = _protocol_context(protocol)
         super().__init__(
             code="CAL-003",
             message=f"Failed to parse calibration data ({protocol}): missing or invalid '{field}'. {reason}",
@@ -275,6 +391,8 @@ class CalibrationParseError(CalibrationError):
 class CalibrationUnavailableError(CalibrationError):
     """Calibration could not be retrieved from any source."""
 
+    __slots__ = ()
+
     def __init__(self, host: str, http_error: Optional[str], tcp_error: Optional[str]) -> None:
         context = ErrorContext(host=host)
         details = []
@@ -294,6 +412,8 @@ class CalibrationUnavailableError(CalibrationError):
 class BiasError(CalibrationError):
     """Failed to apply bias (tare) command."""
 
+    __slots__ = ()
+
     def __init__(self, host: str, mode: str, reason: str) -> None:
         context = ErrorContext(host=host)
         super().__init__(
@@ -307,6 +427,8 @@ class BiasError(CalibrationError):
 class IoError(GsdvError):
     """File I/O errors."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         code: str,
@@ -320,6 +442,8 @@ class IoError(GsdvError):
 class DirectoryNotWritableError(IoError):
     """Output directory is not writable."""
 
+    __slots__ = ()
+
     def __init__(self, path: str) -> None:
         context = ErrorContext(path=path)
         super().__init__(
@@ -333,6 +457,8 @@ class DirectoryNotWritableError(IoError):
 class DiskFullError(IoError):
     """Disk is full, cannot write data."""
 
+    __slots__ = ()
+
     def __init__(self, path: str) -> None:
         context = ErrorContext(path=path)
         super().__init__(
@@ -346,6 +472,8 @@ class DiskFullError(IoError):
 class LogRotationError(IoError):
     """Failed to rotate log file."""
 
+    __slots__ = ()
+
     def __init__(self, current_path: str, reason: str) -> None:
         context = ErrorContext(path=current_path, original_error=reason)
         super().__init__(
@@ -359,6 +487,8 @@ class LogRotationError(IoError):
 class FileWriteError(IoError):
     """General file write error."""
 
+    __slots__ = ()
+
     def __init__(self, path: str, reason: str) -> None:
         context = ErrorContext(path=path, original_error=reason)
         super().__init__(
@@ -372,6 +502,8 @@ class FileWriteError(IoError):
 class FileCloseError(IoError):
     """Error closing file (data may be incomplete)."""
 
+    __slots__ = ()
+
     def __init__(self, path: str, reason: str) -> None:
         context = ErrorContext(path=path, original_error=reason)
         super().__init__(
@@ -380,3 +512,47 @@ class FileCloseError(IoError):
             recovery=RecoveryAction.MANUAL,
             context=context,
         )
+
+
+# Error code -> concrete class, for rebuilding errors from a logged or
+# transported code with a single dict lookup
+_ERROR_REGISTRY: dict[str, type[GsdvError]] = {
+    "NET-001": SensorConnectionRefused,
+    "NET-002": SensorConnectionTimeout,
+    "NET-003": NetworkDisconnectError,
+    "NET-004": SocketError,
+    "PROTO-001": MalformedPacketError,
+    "PROTO-002": InvalidHeaderError,
+    "PROTO-003": PacketParseError,
+    "PROTO-004": SequenceGapError,
+    "CAL-001": HttpCalibrationError,
+    "CAL-002": TcpCalibrationError,
+    "CAL-003": CalibrationParseError,
+    "CAL-004": CalibrationUnavailableError,
+    "CAL-005": BiasError,
+    "IO-001": DirectoryNotWritableError,
+    "IO-002": DiskFullError,
+    "IO-003": LogRotationError,
+    "IO-004": FileWriteError,
+    "IO-005": FileCloseError,
+}
+
+
+def from_code(code: str, **kwargs: Any) -> GsdvError:
+    """Construct the error class registered for an error code.
+
+    Args:
+        code: Error code (e.g., "NET-001").
+        **kwargs: Keyword arguments for that class's constructor.
+
+    Returns:
+        The constructed error.
+
+    Raises:
+        ValueError: If no error class is registered for the code.
+    """
+    try:
+        cls = _ERROR_REGISTRY[code]
+    except KeyError:
+        raise ValueError(f"Unknown error code: {code!r}") from None
+    return cls(**kwargs)
@@ -2,6 +2,7 @@
 
 from gsdv.logging.writer import (
     AsyncFileWriter,
+    SampleBatchFormatter,
     SampleFormatter,
     WriterState,
     WriterStats,
@@ -10,6 +11,7 @@ from gsdv.logging.writer import (
 
 __all__ = [
     "AsyncFileWriter",
+    "SampleBatchFormatter",
     "SampleFormatter",
     "WriterState",
     "WriterStats",
@@ -6,6 +6,7 @@ and filesystem-safe sanitization.
 
 from __future__ import annotations
 
+import functools
 import re
 from datetime import datetime, timezone
 from pathlib import Path
@@ -16,14 +17,35 @@ from pathlib import Path
 _SAFE_PREFIX_PATTERN = re.compile(r"^[a-zA-Z0-9_.\-]*$")
 
 # Characters to strip from prefix (reserved on Windows and generally problematic)
-# Includes space to ensure sanitized output is valid per _SAFE_PREFIX_PATTERN
-_UNSAFE_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f ]')
+# Includes space to ensure sanitized output is valid per _SAFE_PREFIX_PATTERN.
+# A fixed set, so they are deleted with one translate pass: bytes.translate for
+# ASCII prefixes (the usual case, and faster than the regex engine), and a
+# str.translate table otherwise.
+_UNSAFE_CHARS = '<>:"/\\|?* ' + "".join(map(chr, range(0x20)))
+_UNSAFE_ASCII_BYTES = _UNSAFE_CHARS.encode("ascii")
+_UNSAFE_CHARS_TABLE = str.maketrans("", "", _UNSAFE_CHARS)
+
+# Runs of two or more underscores/hyphens, collapsed to one underscore. Most
+# prefixes have no such run, which the substring checks in _collapse_separators
+# rule out without entering the regex engine.
+_SEPARATOR_RUN_PATTERN = re.compile(r"[_\-]{2,}")
 
 # Pattern matching unsafe characters in extension (anything that isn't alphanumeric)
 # Prevents path traversal attacks via extension parameter
 _UNSAFE_EXTENSION_CHARS = re.compile(r"[^a-zA-Z0-9]")
 
+# The sanitizers below are pure functions of a string that rarely changes (the
+# configured prefix and extension), called on every rotation and preview
+_SANITIZE_CACHE_SIZE = 128
 
+# Last (year, month, day, hour, minute, second) key and its formatted
+# "YYYYMMDD_HHMMSS" string. Rotations and previews within the same second
+# reuse it instead of formatting again. Replaced as one tuple, so a reader on
+# another thread never sees a key paired with the wrong string.
+_last_time_str: tuple[tuple[int, int, int, int, int, int], str] | None = None
+
+
+@functools.lru_cache(maxsize=_SANITIZE_CACHE_SIZE)
 def sanitize_prefix(prefix: str) -> str:
     """Sanitize a filename prefix for filesystem safety.
 
@@ -40,10 +62,13 @@ def sanitize_prefix(prefix: str) -> str:
         return ""
 
     # Remove unsafe characters
-    sanitized = _UNSAFE_CHARS.sub("", prefix)
+    if prefix.isascii():
+        sanitized = prefix.encode("ascii").translate(None, _UNSAFE_ASCII_BYTES).decode("ascii")
+    else:
+        sanitized = prefix.translate(_UNSAFE_CHARS_TABLE)
 
     # Collapse multiple underscores/hyphens
-    sanitized = re.sub(r"[_\-]{2,}", "_", sanitized)
+    sanitized = _collapse_separators(sanitized)
 
     # Strip leading/trailing whitespace and dots (problematic on some systems)
     sanitized = sanitized.strip(" .")
@@ -51,6 +76,14 @@ def sanitize_prefix(prefix: str) -> str:
     return sanitized
 
 
+def _collapse_separators(text: str) -> str:
+    """Replace each run of two or more '_'/'-' characters with a single '_'."""
+    if "__" in text or "--" in text or "_-" in text or "-_" in text:
+        return _SEPARATOR_RUN_PATTERN.sub("_", text)
+    return text
+
+
+@functools.lru_cache(maxsize=_SANITIZE_CACHE_SIZE)
 def is_valid_prefix(prefix: str) -> bool:
     """Check if a prefix contains only safe filesystem characters.
 
@@ -65,6 +98,7 @@ def is_valid_prefix(prefix: str) -> bool:
     return bool(_SAFE_PREFIX_PATTERN.match(prefix))
 
 
+@functools.lru_cache(maxsize=_SANITIZE_CACHE_SIZE)
 def sanitize_extension(extension: str) -> str:
     """Sanitize a file extension for filesystem safety.
 
@@ -79,10 +113,35 @@ def sanitize_extension(extension: str) -> str:
     """
     # Strip leading dots first
     ext = extension.lstrip(".")
+    # Usual case: already plain ASCII alphanumerics (str.isalnum alone would
+    # also accept non-ASCII letters and digits)
+    if ext.isascii() and ext.isalnum():
+        return ext
     # Remove all non-alphanumeric characters (including path separators)
     return _UNSAFE_EXTENSION_CHARS.sub("", ext)
 
 
+def _format_timestamp(timestamp: datetime) -> str:
+    """Format a timestamp as YYYYMMDD_HHMMSS, reusing the last result."""
+    global _last_time_str
+    key = (
+        timestamp.year,
+        timestamp.month,
+        timestamp.day,
+        timestamp.hour,
+        timestamp.minute,
+        timestamp.second,
+    )
+    cached = _last_time_str
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    # The key already holds every field, so format it directly rather than
+    # going through strftime's format-string parsing
+    time_str = "%04d%02d%02d_%02d%02d%02d" % key
+    _last_time_str = (key, time_str)
+    return time_str
+
+
 def generate_filename(
     extension: str,
     prefix: str = "",
@@ -114,7 +173,7 @@ def generate_filename(
         timestamp = datetime.now(timezone.utc)
 
     # Format timestamp as YYYYMMDD_HHMMSS
-    time_str = timestamp.strftime("%Y%m%d_%H%M%S")
+    time_str = _format_timestamp(timestamp)
 
     # Sanitize and apply prefix
     safe_prefix = sanitize_prefix(prefix)
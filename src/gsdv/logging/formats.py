@@ -1,6 +1,6 @@
 """Export format implementations (CSV, TSV, Excel-compatible)."""
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Sequence
 
 from gsdv.models import CalibrationInfo, SampleRecord
 
@@ -11,48 +11,49 @@ FORMAT_EXCEL = "excel_compatible"
 BOM_UTF8 = "\ufeff"
 
 
-def _format_value(val: Any) -> str:
-    """Format a single value for output."""
-    if val is None:
-        return ""
-    if isinstance(val, float):
-        # Use enough precision for scientific data
-        return f"{val:.6f}"
-    return str(val)
+def _row_templates(sep: str) -> dict[tuple[bool, bool], str]:
+    """Build %-format row templates keyed by (has force, has torque).
 
-
-def _flatten_sample(sample: SampleRecord) -> list[Any]:
-    """Flatten a SampleRecord into a list of values."""
-    # Base fields
-    values = [
+    The column types are fixed, so each row is formatted by one %-format call
+    rather than by checking and formatting every value separately. Missing
+    force or torque values leave their three columns empty.
+    """
+    base = ["%d"] * 10
+    floats = ["%.6f"] * 3  # Enough precision for scientific data
+    empty = [""] * 3
+    return {
+        (has_force, has_torque): sep.join(
+            base + (floats if has_force else empty) + (floats if has_torque else empty)
+        )
+        for has_force in (False, True)
+        for has_torque in (False, True)
+    }
+
+
+_CSV_ROW_TEMPLATES = _row_templates(",")
+_TSV_ROW_TEMPLATES = _row_templates("\t")
+
+
+def _format_row(sample: SampleRecord, templates: dict[tuple[bool, bool], str]) -> str:
+    """Format one sample with the template matching its optional fields."""
+    force = sample.force_N
+    torque = sample.torque_Nm
+    values = (
         sample.t_monotonic_ns,
         sample.rdt_sequence,
         sample.ft_sequence,
         sample.status,
-    ]
-    # Counts
-    values.extend(sample.counts)
-    
-    # Force (if available, else empty placeholders)
-    if sample.force_N:
-        values.extend(sample.force_N)
-    else:
-        values.extend([""] * 3)
-        
-    # Torque (if available, else empty placeholders)
-    if sample.torque_Nm:
-        values.extend(sample.torque_Nm)
-    else:
-        values.extend([""] * 3)
-        
-    return values
+        *sample.counts,
+        *(force or ()),
+        *(torque or ()),
+    )
+    return templates[bool(force), bool(torque)] % values
 
 
 def csv_formatter(sample: Any) -> str:
     """Format a sample as CSV."""
     if isinstance(sample, SampleRecord):
-        values = _flatten_sample(sample)
-        return ",".join(_format_value(v) for v in values)
+        return _format_row(sample, _CSV_ROW_TEMPLATES)
     elif isinstance(sample, tuple):
         return ",".join(str(v) for v in sample)
     return str(sample)
@@ -61,13 +62,34 @@ def csv_formatter(sample: Any) -> str:
 def tsv_formatter(sample: Any) -> str:
     """Format a sample as TSV."""
     if isinstance(sample, SampleRecord):
-        values = _flatten_sample(sample)
-        return "\t".join(_format_value(v) for v in values)
+        return _format_row(sample, _TSV_ROW_TEMPLATES)
     elif isinstance(sample, tuple):
         return "\t".join(str(v) for v in sample)
     return str(sample)
 
 
+def _format_batch(
+    samples: Sequence[Any],
+    templates: dict[tuple[bool, bool], str],
+    fallback: Callable[[Any], str],
+) -> list[str]:
+    """Format SampleRecords with the row templates and anything else with fallback."""
+    return [
+        _format_row(sample, templates) if isinstance(sample, SampleRecord) else fallback(sample)
+        for sample in samples
+    ]
+
+
+def csv_format_batch(samples: Sequence[Any]) -> list[str]:
+    """Format a batch of samples as CSV lines, as csv_formatter would."""
+    return _format_batch(samples, _CSV_ROW_TEMPLATES, csv_formatter)
+
+
+def tsv_format_batch(samples: Sequence[Any]) -> list[str]:
+    """Format a batch of samples as TSV lines, as tsv_formatter would."""
+    return _format_batch(samples, _TSV_ROW_TEMPLATES, tsv_formatter)
+
+
 def excel_formatter(sample: Any) -> str:
     """Format a sample for Excel (CSV compatible).
     
@@ -77,29 +99,33 @@ def excel_formatter(sample: Any) -> str:
     return csv_formatter(sample)
 
 
+_COLUMNS = (
+    "t_monotonic_ns",
+    "rdt_sequence",
+    "ft_sequence",
+    "status",
+    "Fx_counts",
+    "Fy_counts",
+    "Fz_counts",
+    "Tx_counts",
+    "Ty_counts",
+    "Tz_counts",
+    "Fx_N",
+    "Fy_N",
+    "Fz_N",
+    "Tx_Nm",
+    "Ty_Nm",
+    "Tz_Nm",
+)
+
+# The column set is fixed, so both header lines are built once
+_CSV_HEADER = ",".join(_COLUMNS)
+_TSV_HEADER = "\t".join(_COLUMNS)
+
+
 def get_column_headers(format_type: str = FORMAT_CSV) -> str:
     """Get the column header line."""
-    cols = [
-        "t_monotonic_ns",
-        "rdt_sequence",
-        "ft_sequence",
-        "status",
-        "Fx_counts",
-        "Fy_counts",
-        "Fz_counts",
-        "Tx_counts",
-        "Ty_counts",
-        "Tz_counts",
-        "Fx_N",
-        "Fy_N",
-        "Fz_N",
-        "Tx_Nm",
-        "Ty_Nm",
-        "Tz_Nm",
-    ]
-    
-    sep = "\t" if format_type == FORMAT_TSV else ","
-    return sep.join(cols)
+    return _TSV_HEADER if format_type == FORMAT_TSV else _CSV_HEADER
 
 
 def get_metadata_header(
@@ -109,77 +135,38 @@ def get_metadata_header(
     extra_metadata: Optional[dict[str, str]] = None,
 ) -> str:
     """Generate the full metadata header string including BOM if needed.
-    
+
+    Metadata is written as '#'-prefixed "key: value" comment lines (keys with a
+    None value are skipped) ahead of the column headers. Comment lines end with
+    CRLF for the Excel-compatible format and LF otherwise.
+
     Args:
         format_type: One of FORMAT_CSV, FORMAT_TSV, FORMAT_EXCEL.
         calibration: Optional CalibrationInfo object.
         identity: Optional dictionary with identity info (serial, firmware).
         extra_metadata: Optional additional metadata key-values.
-        
+
     Returns:
         String containing BOM (if Excel), comments, and column headers.
         Does NOT include the final newline, as Writer adds it.
     """
-    lines = []
-    
-    # Add BOM for Excel-compatible format
-    if format_type == FORMAT_EXCEL:
-        lines.append(BOM_UTF8)
-        
-    # Add metadata comments
-    # Note: Excel opening CSV ignores '#' comments usually, but putting them 
-    # at the top is standard for scientific data. User can import text to handle them.
-    # However, if requirement "Excel opens files correctly" means "click and see table",
-    # comments might push data down or be in first cell.
-    # Standard practice for "Excel CSV" is usually just headers. 
-    # But "Metadata header" is a requirement.
-    # We will use '#' prefix.
-    
-    def add_comment(key: str, val: Any) -> None:
-        if val is not None:
-             lines.append(f"# {key}: {val}")
-
+    items: list[tuple[str, Any]] = []
     if identity:
-        add_comment("Serial Number", identity.get("serial_number"))
-        add_comment("Firmware Version", identity.get("firmware_version"))
-        
+        items.append(("Serial Number", identity.get("serial_number")))
+        items.append(("Firmware Version", identity.get("firmware_version")))
     if calibration:
-        add_comment("Counts Per Force", calibration.counts_per_force)
-        add_comment("Counts Per Torque", calibration.counts_per_torque)
-        add_comment("Force Units Code", calibration.force_units_code)
-        add_comment("Torque Units Code", calibration.torque_units_code)
-        
+        items.append(("Counts Per Force", calibration.counts_per_force))
+        items.append(("Counts Per Torque", calibration.counts_per_torque))
+        items.append(("Force Units Code", calibration.force_units_code))
+        items.append(("Torque Units Code", calibration.torque_units_code))
     if extra_metadata:
-        for k, v in extra_metadata.items():
-            add_comment(k, v)
-            
-    # Add column headers
-    # Ensure previous lines have newlines if we added them (except BOM which is just a marker)
-    # Actually, `lines` is a list of strings. We should join them with the target line ending.
-    # But Writer takes a single string header.
-    # If we return a multi-line string, Writer might add ONE line terminator at the end.
-    # We should pre-join these with the target terminator?
-    # Writer's `line_terminator` is used for data rows.
-    # The header is written as-is, with `line_terminator` appended if not present.
-    # So we should join metadata lines with `\n` (or `\r\n` for Excel).
-    
-    terminator = "\r\n" if format_type == FORMAT_EXCEL else "\n"
-    
-    # Filter out empty BOM entry if present (it's handled by join if we're careful)
-    # Actually, BOM should be the start of the string, no newline after it.
-    
-    header_str = ""
+        items.extend(extra_metadata.items())
+
     if format_type == FORMAT_EXCEL:
-        header_str += BOM_UTF8
-        # Remove BOM from lines list to avoid double adding or newline issues
-        if lines and lines[0] == BOM_UTF8:
-            lines.pop(0)
-            
-    # Join comment lines
-    if lines:
-        header_str += terminator.join(lines) + terminator
-        
-    # Append column headers
-    header_str += get_column_headers(format_type)
-    
-    return header_str
\ No newline at end of file
+        prefix, terminator = BOM_UTF8, "\r\n"
+    else:
+        prefix, terminator = "", "\n"
+
+    lines = [f"# {key}: {val}" for key, val in items if val is not None]
+    lines.append(get_column_headers(format_type))
+    return prefix + terminator.join(lines)
@@ -59,6 +59,9 @@ class WriterStats:
 # Type for sample formatter function
 SampleFormatter = Callable[[Any], str]
 
+# Type for a formatter that turns a list of samples into one line per sample
+SampleBatchFormatter = Callable[[list[Any]], list[str]]
+
 
 def default_csv_formatter(sample: Any) -> str:
     """Default CSV formatter for samples.
@@ -101,6 +104,7 @@ class AsyncFileWriter:
     DEFAULT_QUEUE_CAPACITY = 10_000  # Samples in queue (~10s at 1000Hz)
     DEFAULT_BUFFER_SIZE = 8192  # Bytes in write buffer
     DEFAULT_FLUSH_INTERVAL_MS = 250  # Flush every 250ms
+    BATCH_MAX_SAMPLES = 1000  # Samples dequeued per batch_formatter call
 
     def __init__(
         self,
@@ -113,6 +117,7 @@ class AsyncFileWriter:
         line_terminator: str = "\n",
         rotate_size_bytes: Optional[int] = None,
         rotate_interval_s: Optional[float] = None,
+        batch_formatter: Optional[SampleBatchFormatter] = None,
     ) -> None:
         """Initialize the file writer.
 
@@ -126,12 +131,16 @@ class AsyncFileWriter:
             line_terminator: String to append to each line (e.g. "\\n", "\\r\\n").
             rotate_size_bytes: Max file size in bytes before rotation. None to disable.
             rotate_interval_s: Max duration in seconds before rotation. None to disable.
+            batch_formatter: Optional function formatting a list of samples at once
+                (e.g. csv_format_batch). When given, it is used instead of formatter
+                on whatever samples are queued, up to BATCH_MAX_SAMPLES per call.
         """
         self._path = path
         self._queue_capacity = queue_capacity
         self._buffer_size = buffer_size
         self._flush_interval_s = flush_interval_ms / 1000.0
         self._formatter = formatter or default_csv_formatter
+        self._batch_formatter = batch_formatter
         self._header = header
         self._line_terminator = line_terminator
         self._rotate_size_bytes = rotate_size_bytes
@@ -162,8 +171,9 @@ class AsyncFileWriter:
         self._flush_latencies: list[float] = []
         self._stats_lock = threading.Lock()
 
-        # File handle (managed by writer thread)
-        self._file: Optional[io.TextIOWrapper] = None
+        # File handle (managed by writer thread). Binary: lines are encoded to
+        # UTF-8 once per flush, and the encoded length is the byte count.
+        self._file: Optional[io.BufferedWriter] = None
         self._error: Optional[BaseException] = None
 
     @property
@@ -319,19 +329,18 @@ class AsyncFileWriter:
     def _open_current_file(self) -> None:
         """Open the current file and write header if needed."""
         path = self._get_current_path()
-        self._file = open(
-            path, "w", buffering=self._buffer_size, newline=""
-        )
+        self._file = open(path, "wb", buffering=self._buffer_size)
         self._current_file_bytes = 0
         self._current_file_start_time = time.monotonic()
 
         # Write header if provided
         if self._header:
-            self._file.write(self._header)
-            self._current_file_bytes += len(self._header)
-            if not self._header.endswith(self._line_terminator):
-                self._file.write(self._line_terminator)
-                self._current_file_bytes += len(self._line_terminator)
+            header = self._header
+            if not header.endswith(self._line_terminator):
+                header += self._line_terminator
+            data = header.encode("utf-8")
+            self._file.write(data)
+            self._current_file_bytes += len(data)
 
     def _rotate_file(self) -> None:
         """Close current file and open next part."""
@@ -392,8 +401,16 @@ class AsyncFileWriter:
                     if sample is None:
                         # Sentinel received, exit loop
                         break
-                    line = self._formatter(sample) + self._line_terminator
-                    buffer.append(line)
+                    if self._batch_formatter is None:
+                        line = self._formatter(sample) + self._line_terminator
+                        buffer.append(line)
+                    else:
+                        batch = [sample]
+                        sentinel = self._dequeue_batch(batch)
+                        terminator = self._line_terminator
+                        buffer.extend(line + terminator for line in self._batch_formatter(batch))
+                        if sentinel:
+                            break
                 except queue.Empty:
                     pass
 
@@ -421,11 +438,15 @@ class AsyncFileWriter:
                 if self._should_rotate():
                     self._rotate_file()
 
-                line = self._formatter(sample) + self._line_terminator
+                if self._batch_formatter is None:
+                    text = self._formatter(sample)
+                else:
+                    text = self._batch_formatter([sample])[0]
+                line = (text + self._line_terminator).encode("utf-8")
                 if self._file is None:
                     return
                 self._file.write(line)
-                byte_len = len(line.encode("utf-8"))
+                byte_len = len(line)
                 self._current_file_bytes += byte_len
                 with self._stats_lock:
                     self._samples_written += 1
@@ -451,18 +472,34 @@ class AsyncFileWriter:
                 self._file.close()
                 self._file = None
 
+    def _dequeue_batch(self, batch: list[Any]) -> bool:
+        """Move already-queued samples into batch without blocking.
+
+        Returns:
+            True if the stop sentinel was dequeued.
+        """
+        while len(batch) < self.BATCH_MAX_SAMPLES:
+            try:
+                sample = self._queue.get_nowait()
+            except queue.Empty:
+                return False
+            if sample is None:
+                return True
+            batch.append(sample)
+        return False
+
     def _flush_buffer(self, buffer: list[str]) -> None:
         """Flush buffer to file and update statistics."""
         if self._file is None:
             return
 
         start = time.perf_counter()
-        data = "".join(buffer)
+        data = "".join(buffer).encode("utf-8")
         self._file.write(data)
         self._file.flush()
         elapsed_ms = (time.perf_counter() - start) * 1000
-        
-        byte_len = len(data.encode("utf-8"))
+
+        byte_len = len(data)
         self._current_file_bytes += byte_len
 
         with self._stats_lock:
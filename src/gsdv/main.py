@@ -50,17 +50,11 @@ def main() -> int:
             calibration = get_calibration_with_fallback(ip)
             window.update_calibration(calibration)
 
-            # Sample callback for recording
+            # Sample callback for recording; the SampleRecord is queued as is
+            # and formatted on the writer thread
             def on_sample(sample):
                 if file_writer is not None and file_writer.is_running:
-                    # Convert SampleRecord to tuple for the formatter
-                    file_writer.write((
-                        sample.t_monotonic_ns,
-                        sample.rdt_sequence,
-                        sample.ft_sequence,
-                        sample.status,
-                        sample.counts,
-                    ))
+                    file_writer.write(sample)
 
             # Create and start acquisition engine with decimation
             print(f"DEBUG: decimation_factor = {preferences.decimation_factor}")
@@ -85,6 +79,10 @@ def main() -> int:
 
             window.connection_panel.set_connected(True, f"Connected to {ip}")
 
+            # Remember the sensor without blocking the UI on disk I/O
+            preferences.last_ip = ip
+            prefs_store.save_async(preferences)
+
         except Exception as e:
             window.connection_panel.set_connected(False, f"Failed: {e}")
             window.show_status_message(f"Connection failed: {e}", 5000)
@@ -150,16 +148,22 @@ def main() -> int:
         # Create CSV header
         header = "timestamp_ns,rdt_sequence,ft_sequence,status,Fx,Fy,Fz,Tx,Ty,Tz\n"
 
-        # Sample formatter
-        def format_sample(sample: tuple) -> str:
-            t_ns, rdt_seq, ft_seq, status, counts = sample
-            return f"{t_ns},{rdt_seq},{ft_seq},{status},{counts[0]},{counts[1]},{counts[2]},{counts[3]},{counts[4]},{counts[5]}"
+        # The writer thread formats everything queued since its last wakeup
+        # in one call, with one %-format per row
+        row_format = ",".join(["%d"] * 10)
+
+        def format_samples(samples: list) -> list[str]:
+            return [
+                row_format
+                % (s.t_monotonic_ns, s.rdt_sequence, s.ft_sequence, s.status, *s.counts)
+                for s in samples
+            ]
 
         try:
             file_writer = AsyncFileWriter(
                 path=filepath,
-                formatter=format_sample,
                 header=header,
+                batch_formatter=format_samples,
             )
             file_writer.start()
             recording_start_time = time.monotonic()
@@ -215,11 +219,22 @@ def main() -> int:
     if preferences.last_ip:
         window.connection_panel.set_ip(preferences.last_ip)
 
+    # Persist settings shortly after they change; a burst of edits is one write
+    def on_preferences_changed(*_args: object) -> None:
+        prefs_store.save_debounced(preferences)
+
+    window.display_settings_changed.connect(on_preferences_changed)
+    window.theme_changed.connect(on_preferences_changed)
+
     # Save preferences on exit
     def save_preferences() -> None:
         """Save current preferences before exit."""
         preferences.last_ip = window.connection_panel.get_ip()
-        prefs_store.save(preferences)
+        # Supersedes any debounced save still waiting; close() then waits for
+        # every queued write, since the debounce timer would not outlive exit,
+        # and raises any write that failed during the session
+        prefs_store.save_async(preferences, durable=True)
+        prefs_store.close()
 
     def cleanup() -> None:
         """Clean up on exit."""
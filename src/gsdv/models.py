@@ -7,6 +7,18 @@ import numpy as np
 from numpy.typing import NDArray
 
 
+# Record layout for arrays of samples, with fields in SampleRecord order
+SAMPLE_DTYPE = np.dtype(
+    [
+        ("t_monotonic_ns", np.int64),
+        ("rdt_sequence", np.uint32),
+        ("ft_sequence", np.uint32),
+        ("status", np.uint32),
+        ("counts", np.int32, (6,)),
+    ]
+)
+
+
 @dataclass(frozen=True, slots=True)
 class SampleRecord:
     """A single force/torque sample from the sensor.
@@ -88,3 +100,19 @@ class CalibrationInfo:
         force_N = arr[:3] / self.counts_per_force
         torque_Nm = arr[3:] / self.counts_per_torque
         return force_N, torque_Nm
+
+    def convert_counts_batch(
+        self, counts: NDArray[np.int32]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Convert a block of raw counts to SI units in one vectorized divide.
+
+        Args:
+            counts: Raw counts with shape (N, 6), columns [Fx, Fy, Fz, Tx, Ty, Tz].
+
+        Returns:
+            Tuple of (force_N, torque_Nm) arrays each with shape (N, 3).
+        """
+        cpf = self.counts_per_force
+        cpt = self.counts_per_torque
+        si = np.asarray(counts) / np.array([cpf, cpf, cpf, cpt, cpt, cpt])
+        return si[:, :3], si[:, 3:]
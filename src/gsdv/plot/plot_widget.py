@@ -12,6 +12,8 @@ from numpy.typing import NDArray
 from PySide6.QtCore import QPointF, QTimer
 from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
+from gsdv.acquisition.ring_buffer import CHANNEL_KEYS
+
 
 class MultiChannelPlot(QWidget):
     """Multi-channel real-time plot widget.
@@ -388,9 +390,14 @@ class MultiChannelPlot(QWidget):
         if hasattr(self._buffer, "get_window_data"):
             data = self._buffer.get_window_data(self._window_seconds)  # type: ignore[attr-defined]
         else:
-            # Calculate how many samples to fetch for the window
+            # Calculate how many samples to fetch for the window, copying
+            # only the channels that are actually drawn
             n_samples = int(self._window_seconds * self._sample_rate)
-            data = self._buffer.get_latest(n_samples)
+            visible = [
+                i for i, channel in enumerate(self.CHANNEL_NAMES)
+                if self._lines[channel].isVisible()
+            ]
+            data = self._buffer.get_latest(n_samples, channels=visible)
 
         if data is None:
             return
@@ -411,7 +418,8 @@ class MultiChannelPlot(QWidget):
 
     def _update_raw_plot(self, data: dict[str, Any]) -> None:
         timestamps = data["timestamps"]
-        counts = data["counts"]
+        # Either all channels as "counts" (n, 6) or per-channel 1-D arrays
+        counts = data.get("counts")
 
         if len(timestamps) == 0:
             return
@@ -431,7 +439,8 @@ class MultiChannelPlot(QWidget):
             else:
                 cpf = self._counts_per_torque
 
-            y_values = counts[:, i].astype(np.float64) / cpf
+            channel_counts = counts[:, i] if counts is not None else data[CHANNEL_KEYS[i]]
+            y_values = channel_counts.astype(np.float64) / cpf
             line.setData(t_seconds, y_values, connect="all")
 
     def _update_minmax_plot(self, data: dict[str, Any]) -> None:
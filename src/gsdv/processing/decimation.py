@@ -607,13 +607,6 @@ class MultiResolutionBuffer:
         """Compute current buffer memory usage."""
         tiers_stats = self._tiers.stats()
 
-        # RingBuffer storage layout (per sample):
-        # - timestamps: int64 (8)
-        # - rdt_sequence: uint32 (4)
-        # - ft_sequence: uint32 (4)
-        # - status: uint32 (4)
-        # - counts: int32[6] (24)
-        bytes_per_sample = 8 + 4 + 4 + 4 + 24
-        raw_memory = self._raw.capacity * bytes_per_sample
-
-        return MultiResolutionBufferStats(tiers=tiers_stats, raw_memory_bytes=raw_memory)
+        return MultiResolutionBufferStats(
+            tiers=tiers_stats, raw_memory_bytes=self._raw.memory_bytes
+        )
@@ -41,6 +41,9 @@ from gsdv.protocols.http_calibration import (
     CALIBRATION_ENDPOINT,
     HttpCalibrationClient,
     HttpCalibrationError,
+    get_calibration_async,
+    get_calibration_cache_dir,
+    get_calibration_cached,
     get_calibration_with_fallback,
     parse_calibration_xml,
 )
@@ -115,6 +118,9 @@ __all__ = [
     "HTTP_TIMEOUT",
     "HttpCalibrationClient",
     "HttpCalibrationError",
+    "get_calibration_async",
+    "get_calibration_cache_dir",
+    "get_calibration_cached",
     "get_calibration_with_fallback",
     "parse_calibration_xml",
 ]
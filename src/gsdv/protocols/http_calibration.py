@@ -10,10 +10,19 @@ Protocol details (per ATI documentation):
 - Response: XML with calibration fields
 """
 
+import asyncio
+import hashlib
+import ipaddress
+import json
+import os
 import socket
+import tempfile
+from pathlib import Path
 from typing import Optional
 from xml.etree import ElementTree
 
+import platformdirs
+
 from gsdv.models import CalibrationInfo
 
 
@@ -22,6 +31,9 @@ HTTP_PORT = 80
 CALIBRATION_ENDPOINT = "/netftapi2.xml"
 HTTP_TIMEOUT = 5.0
 
+# Subdirectory of the user cache dir holding calibration responses
+CALIBRATION_CACHE_SUBDIR = "calibration"
+
 
 class HttpCalibrationError(Exception):
     """Error during HTTP calibration retrieval."""
@@ -44,7 +56,29 @@ def _http_get(ip: str, port: int, path: str, timeout: float) -> str:
     Raises:
         HttpCalibrationError: If request fails or response is invalid.
     """
-    request = f"GET {path} HTTP/1.1\r\nHost: {ip}\r\nConnection: close\r\n\r\n"
+    return _parse_http_response(_http_request(ip, port, path, timeout))
+
+
+def _http_request(
+    ip: str, port: int, path: str, timeout: float, headers: Optional[dict[str, str]] = None
+) -> bytes:
+    """Send an HTTP GET request and return the raw response.
+
+    Args:
+        ip: Server IP address.
+        port: HTTP port.
+        path: URL path.
+        timeout: Socket timeout in seconds.
+        headers: Extra request headers.
+
+    Returns:
+        Raw response bytes (status line, headers and body).
+
+    Raises:
+        HttpCalibrationError: If the connection fails or times out.
+    """
+    extra = "".join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+    request = f"GET {path} HTTP/1.1\r\nHost: {ip}\r\n{extra}Connection: close\r\n\r\n"
 
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
         sock.settimeout(timeout)
@@ -63,22 +97,105 @@ def _http_get(ip: str, port: int, path: str, timeout: float) -> str:
         except OSError as e:
             raise HttpCalibrationError(f"Connection failed: {e}") from e
 
+    return response
+
+
+async def _http_get_async(
+    ip: str, port: int, path: str, timeout: float, connect_timeout: Optional[float] = None
+) -> str:
+    """Perform a simple HTTP GET request on the running event loop.
+
+    Args:
+        ip: Server IP address.
+        port: HTTP port.
+        path: URL path.
+        timeout: Timeout in seconds for the whole request.
+        connect_timeout: Separate, usually shorter, timeout for the TCP
+            connect (defaults to timeout).
+
+    Returns:
+        Response body as string.
+
+    Raises:
+        HttpCalibrationError: If request fails or response is invalid.
+    """
+    request = f"GET {path} HTTP/1.1\r\nHost: {ip}\r\nConnection: close\r\n\r\n"
+
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip, port),
+            timeout if connect_timeout is None else connect_timeout,
+        )
+    except asyncio.TimeoutError as e:
+        raise HttpCalibrationError(f"Connection timed out: {e}") from e
+    except OSError as e:
+        raise HttpCalibrationError(f"Connection failed: {e}") from e
+
+    try:
+        writer.write(request.encode("ascii"))
+        response = await asyncio.wait_for(reader.read(), timeout)
+    except asyncio.TimeoutError as e:
+        raise HttpCalibrationError(f"Connection timed out: {e}") from e
+    except OSError as e:
+        raise HttpCalibrationError(f"Connection failed: {e}") from e
+    finally:
+        writer.close()
+
+    return _parse_http_response(response)
+
+
+def _parse_http_response(response: bytes) -> str:
+    """Split an HTTP response, check its status, and return the body.
+
+    Raises:
+        HttpCalibrationError: If the response is malformed or not 200.
+    """
+    status_line, _, body = _split_http_response(response)
+    if "200" not in status_line:
+        raise HttpCalibrationError(f"HTTP request failed: {status_line}")
+
+    return body
+
+
+def _split_http_response(response: bytes) -> tuple[str, dict[str, str], str]:
+    """Split an HTTP response into status line, headers and body.
+
+    Header names are lower-cased.
+
+    Raises:
+        HttpCalibrationError: If there is no header/body separator.
+    """
     response_str = response.decode("utf-8", errors="replace")
 
     # Split headers and body
     if "\r\n\r\n" in response_str:
-        headers, body = response_str.split("\r\n\r\n", 1)
+        head, body = response_str.split("\r\n\r\n", 1)
     elif "\n\n" in response_str:
-        headers, body = response_str.split("\n\n", 1)
+        head, body = response_str.split("\n\n", 1)
     else:
         raise HttpCalibrationError("Invalid HTTP response: no header/body separator")
 
-    # Check status
-    status_line = headers.split("\r\n")[0] if "\r\n" in headers else headers.split("\n")[0]
-    if "200" not in status_line:
-        raise HttpCalibrationError(f"HTTP request failed: {status_line}")
+    lines = head.splitlines()
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+
+    return lines[0], headers, body
 
-    return body
+
+def _http_status_code(status_line: str) -> int:
+    """Return the numeric code from an HTTP status line.
+
+    Raises:
+        HttpCalibrationError: If the status line has no numeric code.
+    """
+    parts = status_line.split()
+    try:
+        return int(parts[1])
+    except (IndexError, ValueError) as e:
+        raise HttpCalibrationError(f"Invalid HTTP status line: {status_line}") from e
 
 
 def _find_xml_element(
@@ -233,11 +350,145 @@ class HttpCalibrationClient:
         return _http_get(self._ip, self._port, CALIBRATION_ENDPOINT, self._timeout)
 
 
+async def get_calibration_async(
+    ip: str,
+    port: int = HTTP_PORT,
+    timeout: float = HTTP_TIMEOUT,
+    connect_timeout: Optional[float] = None,
+) -> CalibrationInfo:
+    """Retrieve calibration data over HTTP without blocking the event loop.
+
+    Lets a single thread probe many hosts at once (see ``gsdv discover``).
+
+    Args:
+        ip: Sensor IP address.
+        port: HTTP port (default 80).
+        timeout: Request timeout in seconds.
+        connect_timeout: TCP connect timeout in seconds (defaults to timeout).
+
+    Returns:
+        CalibrationInfo with sensor calibration values.
+
+    Raises:
+        HttpCalibrationError: If request fails or response is invalid.
+    """
+    xml_content = await _http_get_async(ip, port, CALIBRATION_ENDPOINT, timeout, connect_timeout)
+    return parse_calibration_xml(xml_content)
+
+
+def get_calibration_cache_dir() -> Path:
+    """Get the default directory for cached calibration responses."""
+    return Path(platformdirs.user_cache_dir("gsdv")) / CALIBRATION_CACHE_SUBDIR
+
+
+def get_calibration_cached(
+    ip: str,
+    port: int = HTTP_PORT,
+    timeout: float = HTTP_TIMEOUT,
+    cache_dir: Optional[Path] = None,
+) -> CalibrationInfo:
+    """Retrieve calibration data over HTTP, revalidating a cached copy.
+
+    The last response is kept per sensor address together with its ETag and
+    Last-Modified validators. Later calls send a conditional request and, on
+    304 Not Modified, parse the cached XML instead of downloading it again.
+    Responses without validators are not cached. Cache read or write errors
+    fall back to an unconditional fetch.
+
+    Args:
+        ip: Sensor IP address.
+        port: HTTP port (default 80).
+        timeout: Request timeout in seconds.
+        cache_dir: Cache directory (default: get_calibration_cache_dir()).
+
+    Returns:
+        CalibrationInfo with sensor calibration values.
+
+    Raises:
+        HttpCalibrationError: If request fails or response is invalid.
+    """
+    if cache_dir is None:
+        cache_dir = get_calibration_cache_dir()
+    cache_path = _calibration_cache_path(cache_dir, ip, port)
+    cached = _read_calibration_cache(cache_path)
+
+    headers: dict[str, str] = {}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = _http_request(ip, port, CALIBRATION_ENDPOINT, timeout, headers)
+    status_line, response_headers, body = _split_http_response(response)
+    status = _http_status_code(status_line)
+
+    if status == 304 and cached is not None:
+        return parse_calibration_xml(cached["xml"])
+    if status != 200:
+        raise HttpCalibrationError(f"HTTP request failed: {status_line}")
+
+    # Parse before caching so an invalid response never replaces a good one
+    calibration = parse_calibration_xml(body)
+    etag = response_headers.get("etag")
+    last_modified = response_headers.get("last-modified")
+    if etag or last_modified:
+        _write_calibration_cache(
+            cache_path, {"etag": etag, "last_modified": last_modified, "xml": body}
+        )
+    return calibration
+
+
+def _calibration_cache_path(cache_dir: Path, ip: str, port: int) -> Path:
+    """Cache file for a sensor address, always directly inside cache_dir.
+
+    A plain IP address is used as the file name so entries stay readable.
+    Anything else (hostnames, scoped IPv6, or malformed input such as
+    ``../x``) is replaced by a hash so it can never form a path.
+    """
+    try:
+        host = str(ipaddress.ip_address(ip))
+    except ValueError:
+        host = ""
+    if not host or "%" in host:
+        host = hashlib.sha256(ip.encode("utf-8")).hexdigest()[:32]
+    return cache_dir / f"{host.replace(':', '_')}_{port}.json"
+
+
+def _read_calibration_cache(path: Path) -> Optional[dict[str, str]]:
+    """Load a cached calibration entry, or None if missing or unreadable."""
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("xml"), str):
+        return None
+    return entry
+
+
+def _write_calibration_cache(path: Path, entry: dict[str, Optional[str]]) -> None:
+    """Atomically replace a cached calibration entry, ignoring errors."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".calibration_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        # The cache is only an optimization
+        pass
+
+
 def get_calibration_with_fallback(
     ip: str,
     http_port: int = HTTP_PORT,
     tcp_port: int = 49151,
     timeout: float = HTTP_TIMEOUT,
+    cache_dir: Optional[Path] = None,
 ) -> CalibrationInfo:
     """Get calibration data, preferring HTTP with TCP fallback.
 
@@ -246,6 +497,8 @@ def get_calibration_with_fallback(
         http_port: HTTP port (default 80).
         tcp_port: TCP port for fallback (default 49151).
         timeout: Request timeout in seconds.
+        cache_dir: If set, cache HTTP responses there and revalidate them
+            (see get_calibration_cached). None always downloads.
 
     Returns:
         CalibrationInfo from HTTP or TCP.
@@ -255,6 +508,8 @@ def get_calibration_with_fallback(
     """
     # Try HTTP first
     try:
+        if cache_dir is not None:
+            return get_calibration_cached(ip, http_port, timeout, cache_dir)
         client = HttpCalibrationClient(ip, http_port, timeout)
         return client.get_calibration()
     except HttpCalibrationError:
@@ -38,6 +38,7 @@ RDT_RESPONSE_SIZE = 36
 # Struct formats (big-endian)
 REQUEST_FORMAT = ">HHI"  # header (uint16), command (uint16), sample_count (uint32)
 RESPONSE_FORMAT = ">IIIiiiiii"  # rdt_seq, ft_seq, status, Fx, Fy, Fz, Tx, Ty, Tz
+_RESPONSE_STRUCT = struct.Struct(RESPONSE_FORMAT)
 
 
 @dataclass
@@ -62,11 +63,13 @@ def build_rdt_request(command: RdtCommand, sample_count: int = 0) -> bytes:
     return struct.pack(REQUEST_FORMAT, RDT_HEADER, command, sample_count)
 
 
-def parse_rdt_response(data: bytes) -> tuple[int, int, int, tuple[int, int, int, int, int, int]]:
+def parse_rdt_response(
+    data: bytes | bytearray | memoryview,
+) -> tuple[int, int, int, tuple[int, int, int, int, int, int]]:
     """Parse an RDT response packet.
 
     Args:
-        data: 36-byte response packet from sensor.
+        data: 36-byte response packet from sensor (any bytes-like object).
 
     Returns:
         Tuple of (rdt_sequence, ft_sequence, status, counts_tuple).
@@ -77,7 +80,7 @@ def parse_rdt_response(data: bytes) -> tuple[int, int, int, tuple[int, int, int,
     if len(data) != RDT_RESPONSE_SIZE:
         raise ValueError(f"Invalid RDT response size: expected {RDT_RESPONSE_SIZE}, got {len(data)}")
 
-    unpacked = struct.unpack(RESPONSE_FORMAT, data)
+    unpacked = _RESPONSE_STRUCT.unpack(data)
     rdt_sequence = unpacked[0]
     ft_sequence = unpacked[1]
     status = unpacked[2]
@@ -122,8 +125,11 @@ class RdtClient:
         self._port = port
         self._socket: Optional[socket.socket] = None
         self._receive_buffer_size = receive_buffer_size
+        self._effective_receive_buffer_size: Optional[int] = None
         self._streaming = False
         self._stats = RdtStatistics()
+        self._recv_buffer = bytearray(RDT_RESPONSE_SIZE)
+        self._recv_view = memoryview(self._recv_buffer)
 
     @property
     def ip(self) -> str:
@@ -140,6 +146,15 @@ class RdtClient:
         """Whether streaming is active."""
         return self._streaming
 
+    @property
+    def effective_receive_buffer_size(self) -> Optional[int]:
+        """Kernel receive buffer size actually granted, or None before the socket exists.
+
+        Linux doubles the requested value for bookkeeping and clamps it to
+        net.core.rmem_max unless SO_RCVBUFFORCE was permitted.
+        """
+        return self._effective_receive_buffer_size
+
     @property
     def statistics(self) -> RdtStatistics:
         """Current streaming statistics."""
@@ -149,10 +164,30 @@ class RdtClient:
         """Ensure socket is created and bound."""
         if self._socket is None:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._receive_buffer_size)
+            self._set_receive_buffer(self._socket)
             self._socket.bind(("", 0))  # Bind to any available port
         return self._socket
 
+    def _set_receive_buffer(self, sock: socket.socket) -> None:
+        """Size the kernel receive buffer so scheduling stalls don't drop packets.
+
+        Tries SO_RCVBUFFORCE first (Linux, needs CAP_NET_ADMIN) to bypass the
+        net.core.rmem_max clamp, falling back to SO_RCVBUF.
+        """
+        forced = False
+        rcvbuf_force = getattr(socket, "SO_RCVBUFFORCE", None)
+        if rcvbuf_force is not None:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, rcvbuf_force, self._receive_buffer_size)
+                forced = True
+            except OSError:
+                pass  # Unprivileged; fall back to the clamped option
+        if not forced:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._receive_buffer_size)
+        self._effective_receive_buffer_size = sock.getsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVBUF
+        )
+
     def _send_command(self, command: RdtCommand, sample_count: int = 0) -> None:
         """Send an RDT command to the sensor."""
         sock = self._ensure_socket()
@@ -198,15 +233,20 @@ class RdtClient:
         sock = self._ensure_socket()
         sock.settimeout(timeout)
 
+        # Packets are received into one reused buffer rather than a new bytes
+        # object per packet
+        buf = self._recv_buffer
+        view = self._recv_view
+
         samples_received = 0
         while max_samples is None or samples_received < max_samples:
             try:
-                data, _ = sock.recvfrom(RDT_RESPONSE_SIZE)
+                nbytes, _ = sock.recvfrom_into(buf, RDT_RESPONSE_SIZE)
             except socket.timeout:
                 break
 
             t_monotonic_ns = time.monotonic_ns()
-            rdt_sequence, ft_sequence, status, counts = parse_rdt_response(data)
+            rdt_sequence, ft_sequence, status, counts = parse_rdt_response(view[:nbytes])
 
             # Track packet loss
             self._stats.packets_received += 1
@@ -1,11 +1,14 @@
 """Pytest configuration for GSDV tests."""
 
+import functools
+import os
 import socket
 import time
 
 import pytest
 
 
+@functools.lru_cache(maxsize=1)
 def _qt_is_available() -> bool:
     """Check if Qt is fully available (Python bindings and native libraries)."""
     try:
@@ -37,6 +40,7 @@ if not _qt_is_available():
     collect_ignore.append("test_issue_rw5_repro.py")
     collect_ignore.append("test_main_window.py")
     collect_ignore.append("test_plot_widget.py")
+    collect_ignore.append("test_sensor_controller.py")
     collect_ignore.append("test_ui_accessibility.py")
 
 
@@ -55,6 +59,11 @@ if not _acquisition_engine_available():
     collect_ignore.append("test_acquisition.py")
 
 
+def _network_tests_disabled() -> bool:
+    """Check if loopback network tests are disabled via PYTEST_DISABLE_NETWORK_TESTS."""
+    return bool(os.environ.get("PYTEST_DISABLE_NETWORK_TESTS"))
+
+
 def _find_available_ports(count: int = 3, start: int = 59000) -> list[int]:
     """Find available ports for the simulator.
 
@@ -110,6 +119,9 @@ def sensor_simulator():
     from gsdv.diagnostics.sensor_simulator import SensorSimulator, SimulatorConfig
 
     # Find available ports
+    if _network_tests_disabled():
+        pytest.skip("Network tests disabled by PYTEST_DISABLE_NETWORK_TESTS")
+
     ports = _find_available_ports(3)
     if len(ports) < 3:
         pytest.skip("Could not find 3 available ports for simulator")
@@ -135,6 +147,34 @@ def sensor_simulator():
     time.sleep(0.05)
 
 
+@pytest.fixture
+def sensor_simulator_batched():
+    """Simulator handing packets to the kernel in batches of 8."""
+    from gsdv.diagnostics.sensor_simulator import SensorSimulator, SimulatorConfig
+
+    if _network_tests_disabled():
+        pytest.skip("Network tests disabled by PYTEST_DISABLE_NETWORK_TESTS")
+
+    ports = _find_available_ports(3)
+    if len(ports) < 3:
+        pytest.skip("Could not find 3 available ports for simulator")
+
+    config = SimulatorConfig(
+        udp_port=ports[0],
+        tcp_port=ports[1],
+        http_port=ports[2],
+        seed=42,
+        send_batch_size=8,
+    )
+
+    sim = SensorSimulator(config)
+    sim.start()
+    time.sleep(0.1)
+    yield sim
+    sim.stop()
+    time.sleep(0.05)
+
+
 def _create_simulator_with_faults(**fault_kwargs):
     """Helper to create a simulator with specific fault configuration."""
     from gsdv.diagnostics.sensor_simulator import (
@@ -143,6 +183,9 @@ def _create_simulator_with_faults(**fault_kwargs):
         SimulatorConfig,
     )
 
+    if _network_tests_disabled():
+        pytest.skip("Network tests disabled by PYTEST_DISABLE_NETWORK_TESTS")
+
     ports = _find_available_ports(3)
     if len(ports) < 3:
         pytest.skip("Could not find 3 available ports for simulator")
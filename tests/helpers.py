@@ -0,0 +1,21 @@
+"""Shared helpers for GSDV tests."""
+
+
+def recvfrom_into(side_effect):
+    """Adapt a recvfrom-style mock side effect for socket.recvfrom_into.
+
+    side_effect is an iterable of (data, addr) tuples and exceptions to
+    raise, or a single exception raised on every call.
+    """
+    items = None if isinstance(side_effect, BaseException) else iter(side_effect)
+
+    def recvfrom_into(buffer, nbytes=0):
+        item = side_effect if items is None else next(items)
+        if isinstance(item, BaseException):
+            raise item
+        data, addr = item
+        data = data[: nbytes or len(buffer)]
+        buffer[: len(data)] = data
+        return len(data), addr
+
+    return recvfrom_into
@@ -17,8 +17,12 @@ from gsdv.acquisition import (
     RingBuffer,
     RingBufferStats,
 )
+from gsdv.acquisition.spsc_ring import SpscRing
+from gsdv.models import SAMPLE_DTYPE
 from gsdv.protocols.rdt_udp import RESPONSE_FORMAT
 
+from tests.helpers import recvfrom_into
+
 
 class TestRingBufferStats:
     """Tests for RingBufferStats dataclass."""
@@ -67,6 +71,11 @@ class TestRingBufferInit:
         with pytest.raises(ValueError, match="capacity must be positive"):
             RingBuffer(capacity=-1)
 
+    def test_memory_bytes_includes_mirror(self) -> None:
+        buffer = RingBuffer(capacity=1000)
+        # (8 + 4 + 4 + 4 + 24) bytes per sample, stored twice
+        assert buffer.memory_bytes == 2 * 1000 * 44
+
     def test_stats_initially_empty(self) -> None:
         buffer = RingBuffer(capacity=100)
         stats = buffer.stats()
@@ -142,6 +151,95 @@ class TestRingBufferAppend:
         assert buffer.stats().fill_ratio == 0.5
 
 
+class TestRingBufferAppendBatch:
+    """Tests for RingBuffer.append_batch()."""
+
+    def _batch(self, start: int, n: int) -> dict[str, np.ndarray]:
+        seq = np.arange(start, start + n)
+        return {
+            "t_monotonic_ns": (seq * 1000).astype(np.int64),
+            "rdt_sequence": seq.astype(np.uint32),
+            "ft_sequence": seq.astype(np.uint32),
+            "status": np.zeros(n, dtype=np.uint32),
+            "counts": np.repeat(seq[:, None], 6, axis=1).astype(np.int32),
+        }
+
+    def test_batch_updates_stats(self) -> None:
+        buffer = RingBuffer(capacity=100)
+        buffer.append_batch(**self._batch(0, 10))
+        stats = buffer.stats()
+        assert stats.size == 10
+        assert stats.total_written == 10
+        assert stats.overwrites == 0
+
+    def test_empty_batch_is_noop(self) -> None:
+        buffer = RingBuffer(capacity=10)
+        buffer.append_batch(**self._batch(0, 0))
+        assert buffer.stats().total_written == 0
+        assert buffer.get_latest(1) is None
+
+    def test_batch_wraps_in_order(self) -> None:
+        buffer = RingBuffer(capacity=8)
+        buffer.append_batch(**self._batch(0, 5))
+        buffer.append_batch(**self._batch(5, 6))
+        stats = buffer.stats()
+        assert stats.size == 8
+        assert stats.overwrites == 3
+        data = buffer.get_latest(8)
+        assert data is not None
+        np.testing.assert_array_equal(data["rdt_sequence"], np.arange(3, 11))
+        np.testing.assert_array_equal(data["counts"][:, 5], np.arange(3, 11))
+
+    def test_batch_larger_than_capacity_keeps_newest(self) -> None:
+        buffer = RingBuffer(capacity=4)
+        buffer.append(
+            t_monotonic_ns=0, rdt_sequence=99, ft_sequence=0, status=0, counts=(0,) * 6
+        )
+        buffer.append_batch(**self._batch(0, 10))
+        stats = buffer.stats()
+        assert stats.size == 4
+        assert stats.total_written == 11
+        assert stats.overwrites == 7
+        data = buffer.get_all()
+        assert data is not None
+        np.testing.assert_array_equal(data["rdt_sequence"], [6, 7, 8, 9])
+
+    def test_matches_per_sample_append(self) -> None:
+        batched = RingBuffer(capacity=7)
+        single = RingBuffer(capacity=7)
+        for start, n in ((0, 3), (3, 5), (8, 4)):
+            batch = self._batch(start, n)
+            batched.append_batch(**batch)
+            for i in range(n):
+                single.append(
+                    t_monotonic_ns=int(batch["t_monotonic_ns"][i]),
+                    rdt_sequence=int(batch["rdt_sequence"][i]),
+                    ft_sequence=int(batch["ft_sequence"][i]),
+                    status=int(batch["status"][i]),
+                    counts=tuple(int(c) for c in batch["counts"][i]),
+                )
+        assert batched.stats() == single.stats()
+        a, b = batched.get_all(), single.get_all()
+        assert a is not None and b is not None
+        for key in a:
+            np.testing.assert_array_equal(a[key], b[key])
+
+    def test_append_records_matches_append_batch(self) -> None:
+        batch = self._batch(0, 12)
+        records = np.empty(12, dtype=SAMPLE_DTYPE)
+        for key, values in batch.items():
+            records[key] = values
+        from_records = RingBuffer(capacity=8)
+        from_fields = RingBuffer(capacity=8)
+        from_records.append_records(records)
+        from_fields.append_batch(**batch)
+        assert from_records.stats() == from_fields.stats()
+        a, b = from_records.get_all(), from_fields.get_all()
+        assert a is not None and b is not None
+        for key in a:
+            np.testing.assert_array_equal(a[key], b[key])
+
+
 class TestRingBufferGetLatest:
     """Tests for RingBuffer.get_latest()."""
 
@@ -221,6 +319,23 @@ class TestRingBufferGetLatest:
         # Should return samples 3, 4, 5, 6, 7 in order
         np.testing.assert_array_equal(data["rdt_sequence"], [3, 4, 5, 6, 7])
 
+    def test_every_window_size_after_wrap(self) -> None:
+        buffer = RingBuffer(capacity=7)
+        for i in range(19):
+            buffer.append(
+                t_monotonic_ns=i,
+                rdt_sequence=i,
+                ft_sequence=i,
+                status=0,
+                counts=(i, 0, 0, 0, 0, -i),
+            )
+        for n in range(1, 8):
+            data = buffer.get_latest(n)
+            assert data is not None
+            expected = np.arange(19 - n, 19)
+            np.testing.assert_array_equal(data["rdt_sequence"], expected)
+            np.testing.assert_array_equal(data["counts"][:, 5], -expected)
+
     def test_returns_copy_not_view(self) -> None:
         buffer = RingBuffer(capacity=10)
         buffer.append(
@@ -250,6 +365,23 @@ class TestRingBufferGetLatest:
         assert data is not None
         assert data["counts"].shape == (3, 6)
 
+    def test_channels_returns_only_requested_axes(self) -> None:
+        buffer = RingBuffer(capacity=4)
+        for i in range(6):
+            buffer.append(
+                t_monotonic_ns=i,
+                rdt_sequence=i,
+                ft_sequence=i,
+                status=0,
+                counts=(i, 10 * i, 0, 0, 0, -i),
+            )
+        data = buffer.get_latest(3, channels=[1, 5])
+        assert data is not None
+        assert "counts" not in data
+        assert set(data) == {"timestamps", "rdt_sequence", "ft_sequence", "status", "fy", "tz"}
+        np.testing.assert_array_equal(data["fy"], [30, 40, 50])
+        np.testing.assert_array_equal(data["tz"], [-3, -4, -5])
+
 
 class TestRingBufferGetAll:
     """Tests for RingBuffer.get_all()."""
@@ -396,6 +528,106 @@ class TestRingBufferThreadSafety:
         assert read_count[0] > 0
         assert buffer.stats().total_written > 0
 
+    def test_reads_are_consistent_during_writes(self) -> None:
+        buffer = RingBuffer(capacity=64)
+        stop_event = threading.Event()
+        torn_reads: list[np.ndarray] = []
+
+        def writer() -> None:
+            i = 0
+            while not stop_event.is_set():
+                seq = np.arange(i, i + 10)
+                buffer.append_batch(
+                    t_monotonic_ns=seq.astype(np.int64),
+                    rdt_sequence=seq.astype(np.uint32),
+                    ft_sequence=seq.astype(np.uint32),
+                    status=np.zeros(10, dtype=np.uint32),
+                    counts=np.repeat(seq[:, None], 6, axis=1).astype(np.int32),
+                )
+                i += 10
+
+        writer_thread = threading.Thread(target=writer)
+        writer_thread.start()
+        deadline = time.monotonic() + 0.2
+        while time.monotonic() < deadline:
+            data = buffer.get_latest(50)
+            if data is None:
+                continue
+            seq = data["rdt_sequence"].astype(np.int64)
+            if not (np.all(np.diff(seq) == 1) and np.array_equal(data["counts"][:, 0], seq)):
+                torn_reads.append(seq)
+        stop_event.set()
+        writer_thread.join()
+
+        assert torn_reads == []
+
+
+class TestSpscRing:
+    """Tests for the SPSC callback ring."""
+
+    def test_capacity_rounds_up_to_power_of_two(self) -> None:
+        assert SpscRing(capacity=1000).capacity == 1024
+        assert SpscRing(capacity=1).capacity == 1
+
+    def test_rejects_non_positive_capacity(self) -> None:
+        with pytest.raises(ValueError, match="capacity must be positive"):
+            SpscRing(capacity=0)
+
+    def test_fifo_order(self) -> None:
+        ring: SpscRing[int] = SpscRing(capacity=4)
+        for i in range(3):
+            assert ring.push(i)
+        assert len(ring) == 3
+        assert [ring.pop(), ring.pop(), ring.pop()] == [0, 1, 2]
+        assert ring.pop() is None
+
+    def test_push_drops_when_full(self) -> None:
+        ring: SpscRing[int] = SpscRing(capacity=2)
+        assert ring.push(1)
+        assert ring.push(2)
+        assert not ring.push(3)
+        assert ring.pop() == 1
+        assert ring.push(3)
+        assert [ring.pop(), ring.pop()] == [2, 3]
+
+    def test_drain_returns_all_in_order(self) -> None:
+        ring: SpscRing[int] = SpscRing(capacity=4)
+        for i in range(3):
+            ring.push(i)
+        assert ring.drain(limit=2) == [0, 1]
+        ring.push(3)
+        ring.push(4)
+        assert ring.drain() == [2, 3, 4]
+        assert ring.drain() == []
+        assert len(ring) == 0
+
+    def test_wait_times_out_when_empty(self) -> None:
+        ring: SpscRing[int] = SpscRing(capacity=2)
+        assert ring.wait(timeout=0.01) is False
+
+    def test_cross_thread_delivery(self) -> None:
+        ring: SpscRing[int] = SpscRing(capacity=64)
+        total = 10_000
+        received: list[int] = []
+
+        def consumer() -> None:
+            while len(received) < total:
+                item = ring.pop()
+                if item is None:
+                    ring.wait(timeout=0.1)
+                    continue
+                received.append(item)
+
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        i = 0
+        while i < total:
+            if ring.push(i):
+                i += 1
+        thread.join(timeout=5.0)
+
+        assert received == list(range(total))
+
 
 class TestAcquisitionStats:
     """Tests for AcquisitionStats dataclass."""
@@ -469,6 +701,40 @@ class TestAcquisitionEngineInit:
         assert engine.is_running is False
 
 
+class TestAcquisitionEngineRate:
+    """Tests for sample rate tracking."""
+
+    def test_rate_zero_without_packets(self) -> None:
+        engine = AcquisitionEngine(ip="192.168.1.100")
+        assert engine.stats().samples_per_second == 0.0
+
+    def test_rate_at_steady_1000hz(self) -> None:
+        engine = AcquisitionEngine(ip="192.168.1.100")
+        with patch("gsdv.acquisition.acquisition_engine.time.monotonic_ns") as clock:
+            for i in range(5000):
+                clock.return_value = 1_000_000_000 + i * 1_000_000
+                engine._packets_received += 1
+                engine._update_rate()
+        engine._publish_stats()
+
+        assert engine.stats().samples_per_second == pytest.approx(1000.0, rel=0.01)
+
+    def test_rate_follows_rate_change(self) -> None:
+        engine = AcquisitionEngine(ip="192.168.1.100")
+        with patch("gsdv.acquisition.acquisition_engine.time.monotonic_ns") as clock:
+            # 3s at 1000Hz, then 5s at 500Hz: window holds only the 500Hz data
+            t_ns = 1_000_000_000
+            for interval_ns, count in ((1_000_000, 3000), (2_000_000, 2500)):
+                for _ in range(count):
+                    t_ns += interval_ns
+                    clock.return_value = t_ns
+                    engine._packets_received += 1
+                    engine._update_rate()
+        engine._publish_stats()
+
+        assert engine.stats().samples_per_second == pytest.approx(500.0, rel=0.01)
+
+
 class TestAcquisitionEngineWithMockedSocket:
     """Tests for AcquisitionEngine with mocked socket."""
 
@@ -502,7 +768,7 @@ class TestAcquisitionEngineWithMockedSocket:
     def test_start_changes_state_to_running(self, mock_socket_class: MagicMock) -> None:
         mock_sock = MagicMock()
         mock_socket_class.return_value = mock_sock
-        mock_sock.recvfrom.side_effect = socket.timeout()
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(socket.timeout())
 
         engine = AcquisitionEngine(ip="192.168.1.100")
         engine.start()
@@ -510,11 +776,24 @@ class TestAcquisitionEngineWithMockedSocket:
         assert engine.state == AcquisitionState.RUNNING
         engine.stop()
 
+    @patch("socket.socket")
+    def test_start_requests_receive_buffer_size(self, mock_socket_class: MagicMock) -> None:
+        mock_sock = MagicMock()
+        mock_socket_class.return_value = mock_sock
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(socket.timeout())
+
+        engine = AcquisitionEngine(ip="192.168.1.100", recv_buffer_bytes=8_000_000)
+        engine.start()
+        engine.stop()
+
+        requested = [c.args[2] for c in mock_sock.setsockopt.call_args_list]
+        assert 8_000_000 in requested
+
     @patch("socket.socket")
     def test_stop_changes_state_to_stopped(self, mock_socket_class: MagicMock) -> None:
         mock_sock = MagicMock()
         mock_socket_class.return_value = mock_sock
-        mock_sock.recvfrom.side_effect = socket.timeout()
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(socket.timeout())
 
         engine = AcquisitionEngine(ip="192.168.1.100")
         engine.start()
@@ -526,7 +805,7 @@ class TestAcquisitionEngineWithMockedSocket:
     def test_start_twice_raises_error(self, mock_socket_class: MagicMock) -> None:
         mock_sock = MagicMock()
         mock_socket_class.return_value = mock_sock
-        mock_sock.recvfrom.side_effect = socket.timeout()
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(socket.timeout())
 
         engine = AcquisitionEngine(ip="192.168.1.100")
         engine.start()
@@ -551,9 +830,9 @@ class TestAcquisitionEngineWithMockedSocket:
             (self._build_response(rdt_seq=i, fx=i * 10), ("192.168.1.100", 49152))
             for i in range(5)
         ]
-        mock_sock.recvfrom.side_effect = itertools.chain(
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(
             responses, itertools.repeat(socket.timeout())
-        )
+        ))
 
         engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
         engine.start()
@@ -574,9 +853,9 @@ class TestAcquisitionEngineWithMockedSocket:
             (self._build_response(rdt_seq=0), ("192.168.1.100", 49152)),
             (self._build_response(rdt_seq=5), ("192.168.1.100", 49152)),
         ]
-        mock_sock.recvfrom.side_effect = itertools.chain(
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(
             responses, itertools.repeat(socket.timeout())
-        )
+        ))
 
         engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
         engine.start()
@@ -590,7 +869,7 @@ class TestAcquisitionEngineWithMockedSocket:
     def test_context_manager(self, mock_socket_class: MagicMock) -> None:
         mock_sock = MagicMock()
         mock_socket_class.return_value = mock_sock
-        mock_sock.recvfrom.side_effect = socket.timeout()
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(socket.timeout())
 
         with AcquisitionEngine(ip="192.168.1.100") as engine:
             engine.start()
@@ -607,9 +886,9 @@ class TestAcquisitionEngineWithMockedSocket:
             (self._build_response(rdt_seq=i, fx=i * 100, fy=i * 200, fz=i * 300), ("192.168.1.100", 49152))
             for i in range(10)
         ]
-        mock_sock.recvfrom.side_effect = itertools.chain(
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(
             responses, itertools.repeat(socket.timeout())
-        )
+        ))
 
         engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
         engine.start()
@@ -631,9 +910,9 @@ class TestAcquisitionEngineWithMockedSocket:
             (self._build_response(rdt_seq=i), ("192.168.1.100", 49152))
             for i in range(5)
         ]
-        mock_sock.recvfrom.side_effect = itertools.chain(
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(
             responses, itertools.repeat(socket.timeout())
-        )
+        ))
 
         received_samples: list = []
 
@@ -648,6 +927,238 @@ class TestAcquisitionEngineWithMockedSocket:
 
         assert len(received_samples) == 5
 
+    @patch("socket.socket")
+    def test_sample_batch_callback_receives_all_samples(
+        self, mock_socket_class: MagicMock
+    ) -> None:
+        mock_sock = MagicMock()
+        mock_socket_class.return_value = mock_sock
+
+        responses = [
+            (self._build_response(rdt_seq=i), ("192.168.1.100", 49152))
+            for i in range(50)
+        ]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(
+            responses, itertools.repeat(socket.timeout())
+        ))
+
+        batches: list[list] = []
+        singles: list = []
+
+        engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
+        engine.set_sample_batch_callback(batches.append)
+        engine.set_sample_callback(singles.append)
+        engine.start()
+        time.sleep(0.2)
+        engine.stop()
+
+        assert all(batches)
+        assert [s.rdt_sequence for batch in batches for s in batch] == list(range(50))
+        assert [s.rdt_sequence for s in singles] == list(range(50))
+
+    @patch("socket.socket")
+    def test_inline_sample_callback_runs_on_receive_thread(
+        self, mock_socket_class: MagicMock
+    ) -> None:
+        mock_sock = MagicMock()
+        mock_socket_class.return_value = mock_sock
+
+        responses = [
+            (self._build_response(rdt_seq=i), ("192.168.1.100", 49152))
+            for i in range(5)
+        ]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(
+            responses, itertools.repeat(socket.timeout())
+        ))
+
+        thread_names: list[str] = []
+
+        def callback(sample):
+            thread_names.append(threading.current_thread().name)
+
+        engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
+        engine.set_sample_callback(callback, inline=True)
+        engine.start()
+        time.sleep(0.1)
+        engine.stop()
+
+        assert thread_names == ["AcquisitionReceive"] * 5
+
+    @patch("socket.socket")
+    def test_samples_reach_buffer_before_batch_fills(
+        self, mock_socket_class: MagicMock
+    ) -> None:
+        mock_sock = MagicMock()
+        mock_socket_class.return_value = mock_sock
+
+        # A 1 kHz burst, then a socket that waits for data (well short of a
+        # full batch and with no receive timeout firing)
+        release = threading.Event()
+
+        def responses():
+            for i in range(20):
+                time.sleep(0.001)
+                yield (self._build_response(rdt_seq=i), ("192.168.1.100", 49152))
+            release.wait(timeout=5.0)
+            while True:
+                yield socket.timeout()
+
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(responses())
+
+        engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=5.0)
+        engine.start()
+        try:
+            time.sleep(0.2)
+            written_while_waiting = engine.buffer.stats().total_written
+        finally:
+            release.set()
+            engine.stop()
+
+        assert written_while_waiting >= 10
+        assert engine.buffer.stats().total_written == 20
+
+    @patch("socket.socket")
+    def test_inline_callback_sees_its_sample_in_buffer(
+        self, mock_socket_class: MagicMock
+    ) -> None:
+        mock_sock = MagicMock()
+        mock_socket_class.return_value = mock_sock
+
+        responses = [
+            (self._build_response(rdt_seq=i), ("192.168.1.100", 49152))
+            for i in range(30)
+        ]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(
+            responses, itertools.repeat(socket.timeout())
+        ))
+
+        engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
+        latest_in_buffer: list[int] = []
+
+        def callback(sample):
+            latest = engine.get_latest(1)
+            latest_in_buffer.append(int(latest["rdt_sequence"][-1]))
+
+        engine.set_sample_callback(callback, inline=True)
+        engine.start()
+        time.sleep(0.1)
+        engine.stop()
+
+        assert len(latest_in_buffer) == 30
+        assert all(seq >= i for i, seq in enumerate(latest_in_buffer))
+
+    @patch("socket.socket")
+    def test_raising_inline_callback_is_dropped_and_counted(
+        self, mock_socket_class: MagicMock
+    ) -> None:
+        mock_sock = MagicMock()
+        mock_socket_class.return_value = mock_sock
+
+        responses = [
+            (self._build_response(rdt_seq=i), ("192.168.1.100", 49152))
+            for i in range(10)
+        ]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(
+            responses, itertools.repeat(socket.timeout())
+        ))
+
+        calls: list[int] = []
+
+        def callback(sample):
+            calls.append(sample.rdt_sequence)
+            raise ValueError("callback bug")
+
+        engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
+        engine.set_sample_callback(callback, inline=True)
+        engine.start()
+        time.sleep(0.1)
+        receive_alive = engine._receive_thread is not None and engine._receive_thread.is_alive()
+        stats = engine.stats()
+        engine.stop()
+
+        assert receive_alive
+        assert calls == [0]
+        assert stats.callback_errors == 1
+        assert stats.packets_received == 10
+        assert engine.buffer.stats().total_written == 10
+
+    def test_no_callback_queue_without_queued_callback(self) -> None:
+        engine = AcquisitionEngine(ip="192.168.1.100")
+        engine.set_sample_callback(lambda sample: None, inline=True)
+        assert engine._callback_queue is None
+
+        engine.set_sample_callback(lambda sample: None)
+        assert engine._callback_queue is not None
+
+    @patch("socket.socket")
+    def test_callback_set_after_start_receives_samples(
+        self, mock_socket_class: MagicMock
+    ) -> None:
+        mock_sock = MagicMock()
+        mock_socket_class.return_value = mock_sock
+
+        # Time out (ending each batch) until the callback has been registered
+        release = threading.Event()
+
+        def responses():
+            while not release.is_set():
+                time.sleep(0.005)
+                yield socket.timeout()
+            for i in range(5):
+                yield (self._build_response(rdt_seq=i), ("192.168.1.100", 49152))
+            while True:
+                yield socket.timeout()
+
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(responses())
+
+        received: list = []
+        engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
+        engine.start()
+        engine.set_sample_callback(received.append)
+        release.set()
+        time.sleep(0.2)
+        engine.stop()
+
+        assert [s.rdt_sequence for s in received] == list(range(5))
+
+    @patch("socket.socket")
+    def test_threads_pinned_to_requested_cpus(self, mock_socket_class: MagicMock) -> None:
+        mock_sock = MagicMock()
+        mock_socket_class.return_value = mock_sock
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(socket.timeout())
+
+        pinned: dict[str, set[int]] = {}
+
+        def fake_setaffinity(pid: int, cpus: set[int]) -> None:
+            pinned[threading.current_thread().name] = cpus
+
+        engine = AcquisitionEngine(
+            ip="192.168.1.100",
+            receive_timeout=0.01,
+            cpu_affinity=2,
+            callback_cpu_affinity=3,
+        )
+        engine.set_sample_callback(lambda sample: None)
+        with patch("os.sched_setaffinity", fake_setaffinity, create=True):
+            engine.start()
+            time.sleep(0.05)
+            engine.stop()
+
+        assert pinned == {"AcquisitionReceive": {2}, "AcquisitionCallback": {3}}
+
+    @patch("socket.socket")
+    def test_unpermitted_realtime_priority_is_ignored(self, mock_socket_class: MagicMock) -> None:
+        mock_sock = MagicMock()
+        mock_socket_class.return_value = mock_sock
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(socket.timeout())
+
+        engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01, realtime_priority=20)
+        with patch("os.sched_setscheduler", side_effect=PermissionError, create=True):
+            engine.start()
+            time.sleep(0.05)
+            assert engine.is_running
+            engine.stop()
+
     @patch("socket.socket")
     def test_reset_clears_error_state(self, mock_socket_class: MagicMock) -> None:
         engine = AcquisitionEngine(ip="192.168.1.100")
@@ -660,7 +1171,7 @@ class TestAcquisitionEngineWithMockedSocket:
     def test_reset_while_running_raises(self, mock_socket_class: MagicMock) -> None:
         mock_sock = MagicMock()
         mock_socket_class.return_value = mock_sock
-        mock_sock.recvfrom.side_effect = socket.timeout()
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(socket.timeout())
 
         engine = AcquisitionEngine(ip="192.168.1.100")
         engine.start()
@@ -674,7 +1185,7 @@ class TestAcquisitionEngineWithMockedSocket:
     def test_start_clears_buffer(self, mock_socket_class: MagicMock) -> None:
         mock_sock = MagicMock()
         mock_socket_class.return_value = mock_sock
-        mock_sock.recvfrom.side_effect = socket.timeout()
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(socket.timeout())
 
         engine = AcquisitionEngine(ip="192.168.1.100")
 
@@ -711,9 +1222,9 @@ class TestAcquisitionEngineWithMockedSocket:
             OSError("Another error"),
             socket.timeout(),
         ]
-        mock_sock.recvfrom.side_effect = itertools.chain(
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(
             errors, itertools.repeat(socket.timeout())
-        )
+        ))
 
         engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
         engine.start()
@@ -13,6 +13,7 @@ import socket
 import struct
 import threading
 import time
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -22,6 +23,8 @@ from gsdv.acquisition import RingBuffer, RingBufferStats
 from gsdv.errors import DiskFullError, FileWriteError, NetworkDisconnectError
 from gsdv.protocols.rdt_udp import RESPONSE_FORMAT
 
+from tests.helpers import recvfrom_into
+
 
 class TestLongDurationMemoryBudget:
     """Tests for memory-bounded long-duration streaming.
@@ -356,7 +359,7 @@ class TestDisconnectMidRecording:
             (self._build_response(rdt_seq=2), ("192.168.1.100", 49152)),
             (self._build_response(rdt_seq=3), ("192.168.1.100", 49152)),
         ]
-        mock_sock.recvfrom.side_effect = itertools.chain(responses, itertools.repeat(socket.timeout()))
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(responses, itertools.repeat(socket.timeout())))
 
         engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
         engine.start()
@@ -387,7 +390,7 @@ class TestDisconnectMidRecording:
             (self._build_response(rdt_seq=3), ("192.168.1.100", 49152)),
             (self._build_response(rdt_seq=4), ("192.168.1.100", 49152)),
         ]
-        mock_sock.recvfrom.side_effect = itertools.chain(responses, itertools.repeat(socket.timeout()))
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(responses, itertools.repeat(socket.timeout())))
 
         engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
         engine.start()
@@ -414,7 +417,7 @@ class TestDisconnectMidRecording:
             for i in range(5)
         ]
         responses.append(OSError("Connection lost"))
-        mock_sock.recvfrom.side_effect = itertools.chain(responses, itertools.repeat(socket.timeout()))
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(responses, itertools.repeat(socket.timeout())))
 
         engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
         engine.start()
@@ -453,7 +456,7 @@ class TestSequenceGapDetection:
             (self._build_response(rdt_seq=1), ("192.168.1.100", 49152)),
             (self._build_response(rdt_seq=5), ("192.168.1.100", 49152)),
         ]
-        mock_sock.recvfrom.side_effect = itertools.chain(responses, itertools.repeat(socket.timeout()))
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(itertools.chain(responses, itertools.repeat(socket.timeout())))
 
         engine = AcquisitionEngine(ip="192.168.1.100", receive_timeout=0.01)
         engine.start()
@@ -485,7 +488,3 @@ class TestSequenceGapDetection:
             defaults["ty"],
             defaults["tz"],
         )
-
-
-# Import Path after all other imports (needed for tmp_path fixture)
-from pathlib import Path
@@ -29,6 +29,7 @@ from gsdv.errors import (
     SequenceGapError,
     SocketError,
     TcpCalibrationError,
+    from_code,
 )
 
 
@@ -113,6 +114,33 @@ class TestGsdvError:
         assert err.context.host == "10.0.0.1"
         assert err.context.port == 80
 
+    def test_fields_stored_without_instance_dict(self) -> None:
+        """Error fields live in slots, leaving the instance __dict__ empty."""
+        err = MalformedPacketError("RDT", 36, 24)
+        assert err.code == "PROTO-001"
+        assert err.__dict__ == {}
+
+    @pytest.mark.parametrize(
+        "err",
+        [
+            SensorConnectionRefused("192.168.1.50", 49152, original_error="refused"),
+            MalformedPacketError("RDT", 36, 24, host="192.168.1.50"),
+            SequenceGapError(1, 5, 4),
+        ],
+        ids=lambda err: type(err).__name__,
+    )
+    def test_pickle_round_trip_preserves_subclass_fields(self, err: GsdvError) -> None:
+        """Pickled errors come back with their type, args, message and context."""
+        import pickle
+
+        restored = pickle.loads(pickle.dumps(err))
+
+        assert type(restored) is type(err)
+        assert str(restored) == str(err)
+        assert restored.args == err.args
+        assert restored.recovery is err.recovery
+        assert restored.context == err.context
+
 
 class TestNetworkErrors:
     """Tests for network error types."""
@@ -121,8 +149,8 @@ class TestNetworkErrors:
         """SensorConnectionRefused has correct code and message."""
         err = SensorConnectionRefused("192.168.1.50", 49152)
         assert err.code == "NET-001"
-        assert err.category == ErrorCategory.NET
-        assert err.recovery == RecoveryAction.RECONNECT
+        assert err.category is ErrorCategory.NET
+        assert err.recovery is RecoveryAction.RECONNECT
         assert "192.168.1.50:49152" in err.message
         assert "refused" in err.message.lower()
         assert err.context.host == "192.168.1.50"
@@ -132,7 +160,7 @@ class TestNetworkErrors:
         """SensorConnectionTimeout includes timeout duration."""
         err = SensorConnectionTimeout("10.0.0.5", 49151, 5.0)
         assert err.code == "NET-002"
-        assert err.recovery == RecoveryAction.RETRY
+        assert err.recovery is RecoveryAction.RETRY
         assert "10.0.0.5:49151" in err.message
         assert "5.0s" in err.message
         assert "timed out" in err.message.lower()
@@ -141,7 +169,7 @@ class TestNetworkErrors:
         """NetworkDisconnectError indicates lost connection."""
         err = NetworkDisconnectError("192.168.1.100", 49152, "Connection reset by peer")
         assert err.code == "NET-003"
-        assert err.recovery == RecoveryAction.RECONNECT
+        assert err.recovery is RecoveryAction.RECONNECT
         assert "Lost connection" in err.message
         assert err.context.original_error == "Connection reset by peer"
 
@@ -160,11 +188,33 @@ class TestProtocolErrors:
         """MalformedPacketError includes size information."""
         err = MalformedPacketError("RDT", 36, 24, "192.168.1.100")
         assert err.code == "PROTO-001"
-        assert err.category == ErrorCategory.PROTO
+        assert err.category is ErrorCategory.PROTO
         assert "36 bytes" in err.message
         assert "24" in err.message
         assert err.context.protocol == "RDT"
 
+    def test_protocol_error_message_formatted_on_first_access(self) -> None:
+        """Protocol errors keep their arguments and build the message lazily."""
+        err = SequenceGapError(expected_seq=100, actual_seq=105, gap_size=5)
+        assert err._message is None
+        assert err.args == (100, 105, 5)
+
+        assert str(err) == (
+            "[PROTO-004] Packet loss detected: expected sequence 100, got 105 (5 packets lost)."
+        )
+        assert err.message is err.message
+
+    def test_protocol_only_contexts_are_shared(self) -> None:
+        """Errors that only name a protocol reuse one immutable context."""
+        first = MalformedPacketError("RDT", 36, 24)
+        second = PacketParseError("RDT", "counts", "bad")
+        with_host = MalformedPacketError("RDT", 36, 24, "192.168.1.100")
+
+        assert first.context is second.context
+        assert first.context == ErrorContext(protocol="RDT")
+        assert with_host.context.host == "192.168.1.100"
+        assert PacketParseError("XYZ", "f", "r").context == ErrorContext(protocol="XYZ")
+
     def test_invalid_header_error(self) -> None:
         """InvalidHeaderError shows expected vs actual."""
         err = InvalidHeaderError("TCP", "0x1234", "0x0000")
@@ -183,7 +233,7 @@ class TestProtocolErrors:
         """SequenceGapError reports packet loss."""
         err = SequenceGapError(100, 105, 5)
         assert err.code == "PROTO-004"
-        assert err.recovery == RecoveryAction.MANUAL
+        assert err.recovery is RecoveryAction.MANUAL
         assert "100" in err.message
         assert "105" in err.message
         assert "5 packets lost" in err.message
@@ -196,8 +246,8 @@ class TestCalibrationErrors:
         """HttpCalibrationError shows HTTP status code."""
         err = HttpCalibrationError("192.168.1.100", status_code=404)
         assert err.code == "CAL-001"
-        assert err.category == ErrorCategory.CAL
-        assert err.recovery == RecoveryAction.FALLBACK
+        assert err.category is ErrorCategory.CAL
+        assert err.recovery is RecoveryAction.FALLBACK
         assert "404" in err.message
         assert err.context.port == 80
 
@@ -210,7 +260,7 @@ class TestCalibrationErrors:
         """TcpCalibrationError indicates TCP failure."""
         err = TcpCalibrationError("192.168.1.100", "timeout")
         assert err.code == "CAL-002"
-        assert err.recovery == RecoveryAction.RETRY
+        assert err.recovery is RecoveryAction.RETRY
         assert "49151" in err.message
         assert "timeout" in err.message
 
@@ -229,7 +279,7 @@ class TestCalibrationErrors:
             tcp_error="Connection refused",
         )
         assert err.code == "CAL-004"
-        assert err.recovery == RecoveryAction.MANUAL
+        assert err.recovery is RecoveryAction.MANUAL
         assert "HTTP: 404 Not Found" in err.message
         assert "TCP: Connection refused" in err.message
 
@@ -237,7 +287,7 @@ class TestCalibrationErrors:
         """BiasError indicates bias mode and failure reason."""
         err = BiasError("192.168.1.100", "device tare", "no response")
         assert err.code == "CAL-005"
-        assert err.recovery == RecoveryAction.FALLBACK
+        assert err.recovery is RecoveryAction.FALLBACK
         assert "device tare" in err.message
         assert "no response" in err.message
 
@@ -249,8 +299,8 @@ class TestIoErrors:
         """DirectoryNotWritableError includes path."""
         err = DirectoryNotWritableError("/read/only/dir")
         assert err.code == "IO-001"
-        assert err.category == ErrorCategory.IO
-        assert err.recovery == RecoveryAction.CHOOSE_DIRECTORY
+        assert err.category is ErrorCategory.IO
+        assert err.recovery is RecoveryAction.CHOOSE_DIRECTORY
         assert "/read/only/dir" in err.message
         assert err.context.path == "/read/only/dir"
 
@@ -279,7 +329,7 @@ class TestIoErrors:
         """FileCloseError warns about incomplete data."""
         err = FileCloseError("/data/sensor.csv", "I/O error")
         assert err.code == "IO-005"
-        assert err.recovery == RecoveryAction.MANUAL
+        assert err.recovery is RecoveryAction.MANUAL
         assert "incomplete" in err.message.lower()
 
 
@@ -325,3 +375,62 @@ class TestErrorHierarchy:
 
         io_errors = [e for e in errors if isinstance(e, IoError)]
         assert len(io_errors) == 1
+
+
+# Constructor arguments for each registered error code
+_REGISTRY_KWARGS: dict[str, dict[str, object]] = {
+    "NET-001": {"host": "192.168.1.50", "port": 49152},
+    "NET-002": {"host": "192.168.1.50", "port": 49152, "timeout_seconds": 2.0},
+    "NET-003": {"host": "192.168.1.50", "port": 49152},
+    "NET-004": {
+        "host": "192.168.1.50",
+        "port": 49152,
+        "operation": "recv",
+        "original_error": "reset",
+    },
+    "PROTO-001": {"protocol": "RDT", "expected_size": 36, "actual_size": 24},
+    "PROTO-002": {"protocol": "RDT", "expected": "0x1234", "actual": "0x0000"},
+    "PROTO-003": {"protocol": "RDT", "field": "status", "reason": "out of range"},
+    "PROTO-004": {"expected_seq": 1, "actual_seq": 5, "gap_size": 4},
+    "CAL-001": {"host": "192.168.1.50", "status_code": 404},
+    "CAL-002": {"host": "192.168.1.50", "reason": "timeout"},
+    "CAL-003": {"protocol": "HTTP", "field": "cfgcpf", "reason": "missing"},
+    "CAL-004": {"host": "192.168.1.50", "http_error": "404", "tcp_error": "timeout"},
+    "CAL-005": {"host": "192.168.1.50", "mode": "device", "reason": "timeout"},
+    "IO-001": {"path": "/path"},
+    "IO-002": {"path": "/path"},
+    "IO-003": {"current_path": "/path/log.csv", "reason": "disk full"},
+    "IO-004": {"path": "/path/log.csv", "reason": "disk full"},
+    "IO-005": {"path": "/path/log.csv", "reason": "disk full"},
+}
+
+
+class TestFromCode:
+    """Tests for building errors from their codes."""
+
+    def test_builds_registered_class(self) -> None:
+        """from_code constructs the subclass registered for the code."""
+        err = from_code("NET-001", host="192.168.1.50", port=49152)
+        assert type(err) is SensorConnectionRefused
+        assert err.code == "NET-001"
+        assert err.category is ErrorCategory.NET
+
+    def test_registry_covers_every_code_under_test(self) -> None:
+        """The parametrized cases below exercise every registered code."""
+        from gsdv.errors import _ERROR_REGISTRY
+
+        assert set(_REGISTRY_KWARGS) == set(_ERROR_REGISTRY)
+
+    @pytest.mark.parametrize("code", sorted(_REGISTRY_KWARGS))
+    def test_registered_class_produces_its_code(self, code: str) -> None:
+        """Each registry entry builds an error carrying the code it is registered under."""
+        from gsdv.errors import _ERROR_REGISTRY
+
+        err = from_code(code, **_REGISTRY_KWARGS[code])
+        assert type(err) is _ERROR_REGISTRY[code]
+        assert err.code == code
+
+    def test_unknown_code_raises(self) -> None:
+        """Unregistered codes raise ValueError."""
+        with pytest.raises(ValueError, match="XYZ-999"):
+            from_code("XYZ-999")
@@ -46,6 +46,10 @@ class TestSanitizePrefix:
         assert sanitize_prefix("test__data") == "test_data"
         assert sanitize_prefix("test---data") == "test_data"
         assert sanitize_prefix("test_-_data") == "test_data"
+        assert sanitize_prefix("test-_data") == "test_data"
+
+    def test_keeps_single_separators(self) -> None:
+        assert sanitize_prefix("my_test-run_1") == "my_test-run_1"
 
     def test_strips_leading_trailing_dots(self) -> None:
         assert sanitize_prefix(".hidden") == "hidden"
@@ -59,6 +63,12 @@ class TestSanitizePrefix:
         assert sanitize_prefix("a b") == "ab"
         assert sanitize_prefix("my data file") == "mydatafile"
 
+    def test_repeated_prefix_served_from_cache(self) -> None:
+        sanitize_prefix.cache_clear()
+        for _ in range(3):
+            assert sanitize_prefix("run 1") == "run1"
+        assert sanitize_prefix.cache_info().hits == 2
+
 
 class TestSanitizeExtension:
     """Tests for extension sanitization and path traversal prevention."""
@@ -93,6 +103,10 @@ class TestSanitizeExtension:
         assert sanitize_extension(".") == ""
         assert sanitize_extension("...") == ""
 
+    def test_removes_non_ascii_alphanumerics(self) -> None:
+        assert sanitize_extension("csvé") == "csv"
+        assert sanitize_extension("t٣sv") == "tsv"
+
     def test_only_special_chars_returns_empty(self) -> None:
         assert sanitize_extension("/../") == ""
         assert sanitize_extension("...///") == ""
@@ -127,6 +141,15 @@ class TestGenerateFilename:
         result = generate_filename("csv", timestamp=ts)
         assert result == "20251218_143045.csv"
 
+    def test_consecutive_timestamps_each_formatted(self) -> None:
+        first = datetime(2025, 12, 18, 14, 30, 45, 100, tzinfo=timezone.utc)
+        same_second = first.replace(microsecond=999_999)
+        next_second = datetime(2025, 12, 18, 14, 30, 46, tzinfo=timezone.utc)
+
+        assert generate_filename("csv", timestamp=first) == "20251218_143045.csv"
+        assert generate_filename("csv", timestamp=same_second) == "20251218_143045.csv"
+        assert generate_filename("csv", timestamp=next_second) == "20251218_143046.csv"
+
     def test_with_prefix(self) -> None:
         ts = datetime(2025, 1, 5, 9, 5, 0, tzinfo=timezone.utc)
         result = generate_filename("csv", prefix="experiment", timestamp=ts)
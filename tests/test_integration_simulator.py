@@ -7,14 +7,18 @@ Tests cover:
 
 import argparse
 import csv
+import ipaddress
 import subprocess
 import sys
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from gsdv.diagnostics.cli import cmd_discover, cmd_log, cmd_stream
-from gsdv.protocols.http_calibration import HttpCalibrationClient
+from gsdv.diagnostics.cli import _host_addresses, cmd_discover, cmd_log, cmd_stream
+from gsdv.models import CalibrationInfo
+from gsdv.protocols.http_calibration import HttpCalibrationClient, HttpCalibrationError
 from gsdv.protocols.rdt_udp import RdtClient
 from gsdv.protocols.tcp_cmd import TcpCommandClient
 
@@ -46,6 +50,62 @@ class TestSensorSimulator:
         assert cal.force_units_code == sensor_simulator.config.force_units_code
         assert cal.torque_units_code == sensor_simulator.config.torque_units_code
 
+    def test_tcp_pipelined_and_split_requests_each_answered(self, sensor_simulator) -> None:
+        """Requests sent back-to-back or split across writes all get responses."""
+        import socket
+        import time
+
+        from gsdv.protocols.tcp_cmd import CALINFO_RESPONSE_SIZE, build_calinfo_request
+
+        request = build_calinfo_request()
+        with socket.create_connection(
+            ("127.0.0.1", sensor_simulator.config.tcp_port), timeout=2.0
+        ) as sock:
+            sock.sendall(request * 2 + request[:7])
+            time.sleep(0.05)
+            sock.sendall(request[7:])
+
+            received = b""
+            while len(received) < 3 * CALINFO_RESPONSE_SIZE:
+                chunk = sock.recv(1024)
+                assert chunk
+                received += chunk
+
+        assert len(received) == 3 * CALINFO_RESPONSE_SIZE
+
+    def test_stalled_http_client_does_not_block_other_requests(self, sensor_simulator) -> None:
+        """A half-sent HTTP request leaves HTTP and TCP serving other clients."""
+        import socket
+
+        with socket.create_connection(
+            ("127.0.0.1", sensor_simulator.config.http_port), timeout=2.0
+        ) as stalled:
+            stalled.sendall(b"GET /netftapi2.xml HTTP/1.0\r\n")
+
+            http_cal = HttpCalibrationClient(
+                "127.0.0.1", port=sensor_simulator.config.http_port
+            ).get_calibration()
+            with TcpCommandClient(
+                "127.0.0.1", port=sensor_simulator.config.tcp_port
+            ) as client:
+                tcp_cal = client.read_calibration()
+
+            stalled.sendall(b"\r\n")
+            response = stalled.recv(4096)
+
+        assert http_cal.serial_number == sensor_simulator.config.serial_number
+        assert tcp_cal.counts_per_force == sensor_simulator.config.counts_per_force
+        assert response.startswith(b"HTTP/1.0 200 OK")
+
+    def test_stop_wakes_idle_io_thread(self, sensor_simulator) -> None:
+        """stop() ends the IO thread even though it waits without a timeout."""
+        io_thread = sensor_simulator._io_thread
+
+        sensor_simulator.stop()
+
+        assert not io_thread.is_alive()
+        assert sensor_simulator._io_wakeup is None
+
     def test_udp_streaming_receives_samples(self, sensor_simulator) -> None:
         """UDP RDT streaming returns samples with valid data."""
         with RdtClient("127.0.0.1", port=sensor_simulator.config.udp_port) as client:
@@ -116,6 +176,187 @@ class TestSensorSimulator:
         assert len(samples1) >= 1
         assert len(samples2) >= 1
 
+    def test_batched_send_delivers_sequential_packets(self, sensor_simulator_batched) -> None:
+        """Batched sends deliver every packet, in order."""
+        with RdtClient("127.0.0.1", port=sensor_simulator_batched.config.udp_port) as client:
+            client.start_streaming()
+            samples = list(client.receive_samples(timeout=0.5, max_samples=40))
+            client.stop_streaming()
+
+        assert len(samples) == 40
+        assert [s.rdt_sequence for s in samples] == list(range(40))
+
+    def test_datagram_receiver_drains_burst(self) -> None:
+        """Every queued request datagram is returned with its sender's address."""
+        import socket
+        import time
+
+        from gsdv.diagnostics.sensor_simulator import _DatagramReceiver
+
+        with (
+            socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server,
+            socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as client,
+        ):
+            server.bind(("127.0.0.1", 0))
+            client.bind(("127.0.0.1", 0))
+            receiver = _DatagramReceiver(4, 20)
+            assert receiver.receive(server) == []
+
+            for i in range(3):
+                client.sendto(bytes([i]) * 20, server.getsockname())
+            time.sleep(0.05)
+
+            received = receiver.receive(server)
+
+            assert [data for data, _ in received] == [bytes([i]) * 20 for i in range(3)]
+            assert all(addr == client.getsockname() for _, addr in received)
+
+    @pytest.mark.parametrize("segmented", [True, False])
+    def test_datagram_batch_delivers_each_datagram_in_order(self, segmented: bool) -> None:
+        """A flush larger than one GSO send arrives as separate ordered datagrams."""
+        import socket
+
+        from gsdv.diagnostics.sensor_simulator import UDP_GSO_MAX_SEGMENTS, _DatagramBatch
+
+        count = UDP_GSO_MAX_SEGMENTS + 6
+        with (
+            socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server,
+            socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as client,
+        ):
+            server.bind(("127.0.0.1", 0))
+            server.settimeout(1.0)
+            batch = _DatagramBatch(count, 36)
+            if not segmented:
+                batch._gso_control = None
+            for i in range(count):
+                batch.append(bytes([i]) * 36)
+
+            batch.flush(client, server.getsockname())
+
+            received = [server.recv(100) for _ in range(count)]
+
+        assert received == [bytes([i]) * 36 for i in range(count)]
+
+    def test_restart_streaming_immediately_after_stop(self, sensor_simulator) -> None:
+        """A START right after STOP resumes streaming on the same thread."""
+        with RdtClient("127.0.0.1", port=sensor_simulator.config.udp_port) as client:
+            client.start_streaming()
+            first = list(client.receive_samples(timeout=0.5, max_samples=5))
+            streaming_thread = sensor_simulator._streaming_thread
+            client.stop_streaming()
+            client.start_streaming()
+            second = list(client.receive_samples(timeout=0.5, max_samples=200))
+            client.stop_streaming()
+
+        assert len(first) == 5
+        assert second[-1].rdt_sequence >= 100
+        assert sensor_simulator._streaming_thread is streaming_thread
+
+    def test_stream_comes_from_rdt_port_and_obeys_stop(self, sensor_simulator) -> None:
+        """Packets keep the RDT source port, and the client's STOP still lands."""
+        import socket
+        import time
+
+        from gsdv.protocols.rdt_udp import RdtCommand, build_rdt_request
+
+        server = ("127.0.0.1", sensor_simulator.config.udp_port)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(1.0)
+            sock.sendto(build_rdt_request(RdtCommand.START_REALTIME), server)
+            _, source = sock.recvfrom(64)
+            stream_socket = sensor_simulator._stream_socket
+            sock.sendto(build_rdt_request(RdtCommand.STOP), server)
+            time.sleep(0.1)
+
+            assert source == server
+            assert not sensor_simulator.state.streaming
+            # The connected socket is only used on Linux; elsewhere sendto is
+            if sys.platform.startswith("linux"):
+                assert stream_socket is not None
+            else:
+                assert stream_socket is None
+
+    def test_bernoulli_draws_match_probability_across_refills(self) -> None:
+        """Bulk-drawn fault decisions keep the configured rate over several refills."""
+        import numpy as np
+
+        from gsdv.diagnostics.sensor_simulator import FAULT_DRAW_CHUNK, _BernoulliDraws
+
+        draws = _BernoulliDraws(np.random.default_rng(1), 0.25)
+        hits = sum(draws.draw() for _ in range(3 * FAULT_DRAW_CHUNK))
+
+        assert hits / (3 * FAULT_DRAW_CHUNK) == pytest.approx(0.25, abs=0.01)
+
+    def test_live_noise_is_drawn_in_order_across_chunks(self) -> None:
+        """Live noise continues the same draw sequence across chunk refills."""
+        import numpy as np
+
+        from gsdv.diagnostics.sensor_simulator import (
+            NOISE_CHUNK_SAMPLES,
+            SensorSimulator,
+            SimulatorConfig,
+        )
+
+        sim = SensorSimulator(SimulatorConfig(seed=11, noise_table_samples=0))
+        first = sim._live_noise(NOISE_CHUNK_SAMPLES - 3)
+        spanning = sim._live_noise(6).copy()
+
+        expected = np.random.default_rng(11).standard_normal((2 * NOISE_CHUNK_SAMPLES, 6))
+        expected *= sim.config.noise_stddev
+        np.testing.assert_allclose(first, expected[: NOISE_CHUNK_SAMPLES - 3])
+        np.testing.assert_allclose(
+            spanning, expected[NOISE_CHUNK_SAMPLES - 3 : NOISE_CHUNK_SAMPLES + 3]
+        )
+
+    def test_prepacked_responses_follow_sequence_reset(self) -> None:
+        """Packets packed ahead are renumbered when the stream's sequences reset."""
+        from gsdv.diagnostics.sensor_simulator import SensorSimulator, SimulatorConfig
+        from gsdv.protocols.rdt_udp import parse_rdt_response
+
+        sim = SensorSimulator(SimulatorConfig(seed=5))
+        for _ in range(3):
+            sim._next_response()
+            sim.state.rdt_sequence += 1
+            sim.state.ft_sequence += 1
+
+        sim.state.rdt_sequence = 0
+        sim.state.ft_sequence = 7
+        first = parse_rdt_response(bytes(sim._next_response()))
+        sim.state.rdt_sequence += 1
+        sim.state.ft_sequence += 1
+        second = parse_rdt_response(bytes(sim._next_response()))
+
+        assert first[:2] == (0, 7)
+        assert second[:2] == (1, 8)
+
+    def test_sine_table_matches_computed_signal(self) -> None:
+        """The tabulated signal period matches computing sin() per tick."""
+        import numpy as np
+
+        from gsdv.diagnostics.sensor_simulator import SensorSimulator, SimulatorConfig
+
+        config = SimulatorConfig(seed=3, sample_rate_hz=1000, signal_frequency_hz=4.0)
+        tabulated = SensorSimulator(config)
+        computed = SensorSimulator(config)
+        computed._sine_table = None
+
+        assert tabulated._sine_table is not None
+        np.testing.assert_allclose(
+            tabulated._signal(123_456, 300), computed._signal(123_456, 300), atol=1e-6
+        )
+
+    def test_noise_table_replays_after_its_length(self) -> None:
+        """Noise repeats once the tick index wraps the pregenerated table."""
+        from gsdv.diagnostics.sensor_simulator import SensorSimulator, SimulatorConfig
+
+        sim = SensorSimulator(SimulatorConfig(seed=7, noise_table_samples=1000, signal_amplitude=0))
+
+        first = sim._signal(0, 8)
+        wrapped = sim._signal(1024, 8)
+
+        assert first.any()
+        assert (first == wrapped).all()
+
 
 class TestEndToEnd:
     """End-to-end integration tests combining multiple protocols."""
@@ -255,6 +496,7 @@ class TestCliStream:
             seconds=0.3,
             udp_port=sensor_simulator.config.udp_port,
             http_port=sensor_simulator.config.http_port,
+            no_cache=True,
         )
 
         result = cmd_stream(args)
@@ -271,6 +513,7 @@ class TestCliStream:
             seconds=0.2,
             udp_port=sensor_simulator.config.udp_port,
             http_port=sensor_simulator.config.http_port,
+            no_cache=True,
         )
 
         cmd_stream(args)
@@ -293,6 +536,9 @@ class TestCliLog:
             prefix="test_",
             udp_port=sensor_simulator.config.udp_port,
             http_port=sensor_simulator.config.http_port,
+            no_cache=True,
+            rotate_size=None,
+            rotate_time=None,
         )
 
         result = cmd_log(args)
@@ -316,6 +562,9 @@ class TestCliLog:
             prefix="",
             udp_port=sensor_simulator.config.udp_port,
             http_port=sensor_simulator.config.http_port,
+            no_cache=True,
+            rotate_size=None,
+            rotate_time=None,
         )
 
         cmd_log(args)
@@ -342,6 +591,9 @@ class TestCliLog:
             prefix="",
             udp_port=sensor_simulator.config.udp_port,
             http_port=sensor_simulator.config.http_port,
+            no_cache=True,
+            rotate_size=None,
+            rotate_time=None,
         )
 
         cmd_log(args)
@@ -351,6 +603,39 @@ class TestCliLog:
         assert "Duration:" in captured.out
         assert "Sample rate:" in captured.out
 
+    def test_log_does_not_hold_rows_until_batch_fills(self, sensor_simulator, tmp_path) -> None:
+        """Rows are written within LOG_PROGRESS_INTERVAL_S even if the batch never fills."""
+        from gsdv.diagnostics.cli import LOG_PROGRESS_INTERVAL_S
+        from gsdv.logging.writer import AsyncFileWriter
+
+        args = argparse.Namespace(
+            ip="127.0.0.1",
+            out=str(tmp_path),
+            seconds=0.8,
+            format="csv",
+            prefix="",
+            udp_port=sensor_simulator.config.udp_port,
+            http_port=sensor_simulator.config.http_port,
+            no_cache=True,
+            rotate_size=None,
+            rotate_time=None,
+        )
+        ages_ns: list[int] = []
+        original_write = AsyncFileWriter.write
+
+        def recording_write(self, row):
+            ages_ns.append(time.monotonic_ns() - int(row.split(",")[1]))
+            return original_write(self, row)
+
+        with (
+            patch("gsdv.diagnostics.cli.LOG_CONVERT_BATCH_SIZE", 1_000_000),
+            patch.object(AsyncFileWriter, "write", recording_write),
+        ):
+            assert cmd_log(args) == 0
+
+        assert ages_ns
+        assert max(ages_ns) < (LOG_PROGRESS_INTERVAL_S + 0.15) * 1_000_000_000
+
     def test_log_fails_on_invalid_directory(self, sensor_simulator, capsys) -> None:
         """gsdv log returns error for non-existent output directory."""
         args = argparse.Namespace(
@@ -361,6 +646,9 @@ class TestCliLog:
             prefix="",
             udp_port=sensor_simulator.config.udp_port,
             http_port=sensor_simulator.config.http_port,
+            no_cache=True,
+            rotate_size=None,
+            rotate_time=None,
         )
 
         result = cmd_log(args)
@@ -401,6 +689,60 @@ class TestCliDiscover:
         captured = capsys.readouterr()
         assert sensor_simulator.config.serial_number in captured.out
 
+    def test_discover_probes_all_hosts(self, capsys) -> None:
+        """gsdv discover reports every responding host in the subnet."""
+        cal = CalibrationInfo(counts_per_force=1000000.0, counts_per_torque=1000000.0)
+        responding = {"10.0.0.2", "10.0.0.5"}
+
+        async def fake_get_calibration(ip, port, timeout, connect_timeout=None):
+            if ip not in responding:
+                raise HttpCalibrationError("no sensor")
+            return cal
+
+        args = argparse.Namespace(subnet="10.0.0.0/29", timeout=0.1, http_port=80)
+        with patch(
+            "gsdv.protocols.http_calibration.get_calibration_async",
+            side_effect=fake_get_calibration,
+        ):
+            result = cmd_discover(args)
+
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "Found: 10.0.0.2" in captured.out
+        assert "Found: 10.0.0.5" in captured.out
+        assert "Found 2 sensor" in captured.out
+
+    @pytest.mark.parametrize(
+        ("extra", "expected"),
+        [({}, 0.15), ({"connect_timeout": 1.0}, 1.0), ({"connect_timeout": 5.0}, 2.0)],
+    )
+    def test_discover_connect_timeout_capped_by_timeout(
+        self, extra: dict, expected: float
+    ) -> None:
+        """--connect-timeout is honored, bounded above by --timeout."""
+        seen: list[float] = []
+
+        async def fake_get_calibration(ip, port, timeout, connect_timeout=None):
+            seen.append(connect_timeout)
+            raise HttpCalibrationError("no sensor")
+
+        args = argparse.Namespace(subnet="10.0.0.1/32", timeout=2.0, http_port=80, **extra)
+        with patch(
+            "gsdv.protocols.http_calibration.get_calibration_async",
+            side_effect=fake_get_calibration,
+        ):
+            cmd_discover(args)
+
+        assert seen == [expected]
+
+    @pytest.mark.parametrize(
+        "subnet", ["192.168.1.0/24", "10.0.0.0/30", "10.0.0.4/31", "127.0.0.1/32", "fd00::/125"]
+    )
+    def test_host_addresses_match_ipaddress_hosts(self, subnet: str) -> None:
+        """Host enumeration matches ipaddress.hosts() for all prefix lengths."""
+        network = ipaddress.ip_network(subnet)
+        assert _host_addresses(network) == [str(ip) for ip in network.hosts()]
+
     def test_discover_no_sensors_on_empty_subnet(self, capsys) -> None:
         """gsdv discover reports no sensors on empty subnet."""
         args = argparse.Namespace(
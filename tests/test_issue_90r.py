@@ -10,9 +10,9 @@ from gsdv.models import CalibrationInfo
 
 @pytest.fixture
 def mock_dependencies():
-    with patch("gsdv.diagnostics.cli.get_calibration_with_fallback") as mock_cal, \
-         patch("gsdv.diagnostics.cli.RdtClient") as mock_rdt, \
-         patch("gsdv.diagnostics.cli.csv.writer") as mock_csv:
+    # cmd_log imports its dependencies at call time, so patch them at the source
+    with patch("gsdv.protocols.http_calibration.get_calibration_with_fallback") as mock_cal, \
+         patch("gsdv.protocols.rdt_udp.RdtClient") as mock_rdt:
         
         # Setup mock calibration
         mock_cal.return_value = CalibrationInfo(
@@ -33,7 +33,7 @@ def mock_dependencies():
         # Mock statistics
         mock_client_instance.statistics.packets_lost = 0
         
-        yield mock_cal, mock_rdt, mock_csv
+        yield mock_cal, mock_rdt
 
 def test_cmd_log_sanitizes_prefix(tmp_path, mock_dependencies):
     """Verify that path traversal characters in prefix are sanitized."""
@@ -49,6 +49,7 @@ def test_cmd_log_sanitizes_prefix(tmp_path, mock_dependencies):
         prefix="../traversal/",
         udp_port=49152,
         http_port=80,
+        no_cache=True,
         rotate_size=None,
         rotate_time=None,
     )
@@ -93,6 +94,7 @@ def test_cmd_log_absolute_path_prefix(tmp_path, mock_dependencies):
         prefix="/etc/passwd",
         udp_port=49152,
         http_port=80,
+        no_cache=True,
         rotate_size=None,
         rotate_time=None,
     )
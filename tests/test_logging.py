@@ -19,7 +19,9 @@ from gsdv.logging.formats import (
     FORMAT_TSV,
     FORMAT_EXCEL,
     BOM_UTF8,
+    csv_format_batch,
     csv_formatter,
+    tsv_format_batch,
     tsv_formatter,
     excel_formatter,
     get_column_headers,
@@ -253,6 +255,22 @@ class TestAsyncFileWriterOutput:
         content = path.read_text().strip()
         assert content == "1\t2\t3"
 
+    def test_batch_formatter_writes_every_sample_in_order(self, tmp_path: Path) -> None:
+        path = tmp_path / "test.csv"
+        batch_sizes: list[int] = []
+
+        def batch_formatter(samples: list[tuple]) -> list[str]:
+            batch_sizes.append(len(samples))
+            return [",".join(str(v) for v in sample) for sample in samples]
+
+        with AsyncFileWriter(path, batch_formatter=batch_formatter) as writer:
+            for i in range(2500):
+                writer.write((i, i * 2))
+
+        lines = path.read_text().splitlines()
+        assert lines == [f"{i},{i * 2}" for i in range(2500)]
+        assert max(batch_sizes) <= AsyncFileWriter.BATCH_MAX_SAMPLES
+
     def test_data_persisted_after_stop(self, tmp_path: Path) -> None:
         path = tmp_path / "test.csv"
         with AsyncFileWriter(path, flush_interval_ms=50) as writer:
@@ -544,6 +562,25 @@ class TestExportFormats:
         expected = "1000,1,2,0,10,20,30,40,50,60,,,,,,"
         assert line == expected
 
+    def test_batch_formatters_match_per_sample_formatters(self, sample: SampleRecord) -> None:
+        from dataclasses import replace
+
+        samples = [
+            sample,
+            replace(sample, force_N=None),
+            replace(sample, torque_Nm=None),
+            replace(sample, force_N=None, torque_Nm=None, counts=(-1, 0, 1, 2, 3, 4)),
+        ]
+
+        assert csv_format_batch(samples) == [csv_formatter(s) for s in samples]
+        assert tsv_format_batch(samples) == [tsv_formatter(s) for s in samples]
+
+    def test_batch_formatters_accept_tuples(self, sample: SampleRecord) -> None:
+        samples = [(1000, 1, 2, 0), sample, ("a", 1.5)]
+
+        assert csv_format_batch(samples) == [csv_formatter(s) for s in samples]
+        assert tsv_format_batch(samples) == [tsv_formatter(s) for s in samples]
+
     def test_metadata_header_csv(self) -> None:
         cal = CalibrationInfo(counts_per_force=100.0, counts_per_torque=20.0)
         ident = {"serial_number": "SN123", "firmware_version": "1.0"}
@@ -3,6 +3,9 @@
 import json
 import os
 import stat
+import threading
+import time
+from concurrent.futures import wait
 from pathlib import Path
 
 import pytest
@@ -329,6 +332,249 @@ class TestAtomicWrite:
             os.chmod(prefs_dir, stat.S_IRWXU)
 
 
+class TestSerialization:
+    """Tests for JSON serialization backends."""
+
+    def test_stdlib_fallback_matches_default(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Output parses identically with and without orjson."""
+        import gsdv.config.preferences as preferences_module
+
+        prefs = UserPreferences()
+        prefs.last_ip = "10.0.0.\u00e9"
+        prefs.y_manual_min = -1.5
+        store = PreferencesStore(tmp_path / "preferences.json")
+
+        default_output = store._serialize(prefs)
+        monkeypatch.setattr(preferences_module, "orjson", None)
+        fallback_output = store._serialize(prefs)
+
+        assert json.loads(default_output) == json.loads(fallback_output)
+        assert b"\n  " in fallback_output
+
+
+class TestDebouncedSave:
+    """Tests for coalesced saves."""
+
+    def test_burst_writes_last_value_once(self, tmp_path: Path) -> None:
+        """Rapid calls coalesce into one write of the latest preferences."""
+        prefs_path = tmp_path / "preferences.json"
+        store = PreferencesStore(prefs_path)
+
+        for i in range(5):
+            prefs = UserPreferences()
+            prefs.last_ip = f"10.0.0.{i}"
+            store.save_debounced(prefs, delay=0.05)
+
+        assert not prefs_path.exists()
+        deadline = time.monotonic() + 2.0
+        while not prefs_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert store.load().last_ip == "10.0.0.4"
+
+    def test_flush_writes_pending_immediately(self, tmp_path: Path) -> None:
+        """flush() writes a pending save without waiting for the timer."""
+        prefs_path = tmp_path / "preferences.json"
+        store = PreferencesStore(prefs_path)
+
+        prefs = UserPreferences()
+        prefs.last_ip = "192.168.1.5"
+        store.save_debounced(prefs, delay=60.0)
+        store.flush()
+
+        assert store.load().last_ip == "192.168.1.5"
+
+    def test_debounced_save_snapshots_at_call_time(self, tmp_path: Path) -> None:
+        """Mutations after save_debounced() are not written by it."""
+        store = PreferencesStore(tmp_path / "preferences.json")
+
+        prefs = UserPreferences()
+        prefs.last_ip = "10.2.2.2"
+        store.save_debounced(prefs, delay=60.0)
+        prefs.last_ip = "changed-after-save"
+        store.flush()
+
+        assert store.load().last_ip == "10.2.2.2"
+
+    def test_late_timer_does_not_overwrite_newer_save(self, tmp_path: Path) -> None:
+        """A synchronous save supersedes a debounced save still waiting."""
+        store = PreferencesStore(tmp_path / "preferences.json")
+
+        older = UserPreferences()
+        older.last_ip = "10.0.0.1"
+        store.save_debounced(older, delay=0.05)
+        newer = UserPreferences()
+        newer.last_ip = "10.0.0.2"
+        store.save(newer)
+        time.sleep(0.15)
+        store.flush()
+
+        assert store.load().last_ip == "10.0.0.2"
+
+    def test_all_writes_run_on_writer_thread(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """save(), save_async() and debounced saves share one writer thread."""
+        store = PreferencesStore(tmp_path / "preferences.json")
+        real_write = store._write
+        threads: list[str] = []
+
+        def recording_write(content: bytes, durable: bool) -> None:
+            threads.append(threading.current_thread().name)
+            real_write(content, durable)
+
+        monkeypatch.setattr(store, "_write", recording_write)
+        store.save(UserPreferences())
+        store.save_async(UserPreferences()).result(timeout=5.0)
+        store.save_debounced(UserPreferences(), delay=60.0)
+        store.flush()
+
+        assert len(threads) == 3
+        assert len(set(threads)) == 1
+        assert threads[0].startswith("PreferencesWriter")
+
+    def test_flush_without_pending_is_noop(self, tmp_path: Path) -> None:
+        """flush() with nothing pending does not create a file."""
+        prefs_path = tmp_path / "preferences.json"
+        store = PreferencesStore(prefs_path)
+
+        store.flush()
+
+        assert not prefs_path.exists()
+
+
+class TestAsyncSave:
+    """Tests for background-thread saves."""
+
+    def test_save_async_writes_snapshot(self, tmp_path: Path) -> None:
+        """The saved content reflects preferences at call time."""
+        prefs_path = tmp_path / "preferences.json"
+        store = PreferencesStore(prefs_path)
+
+        prefs = UserPreferences()
+        prefs.last_ip = "10.1.1.1"
+        future = store.save_async(prefs)
+        prefs.last_ip = "changed-after-save"
+        future.result(timeout=5.0)
+
+        assert store.load().last_ip == "10.1.1.1"
+
+    def test_flush_waits_for_async_save(self, tmp_path: Path) -> None:
+        """flush() returns only after queued async writes complete."""
+        prefs_path = tmp_path / "preferences.json"
+        store = PreferencesStore(prefs_path)
+
+        for i in range(10):
+            prefs = UserPreferences()
+            prefs.last_ip = f"10.0.0.{i}"
+            store.save_async(prefs)
+        store.flush()
+
+        assert store.load().last_ip == "10.0.0.9"
+
+    def test_debounced_save_queued_after_async_wins(self, tmp_path: Path) -> None:
+        """Writes land in queue order, so the later debounced content is kept."""
+        store = PreferencesStore(tmp_path / "preferences.json")
+
+        first = UserPreferences()
+        first.last_ip = "10.0.0.1"
+        store.save_async(first)
+        second = UserPreferences()
+        second.last_ip = "10.0.0.2"
+        store.save_debounced(second, delay=0.01)
+        time.sleep(0.1)
+        store.flush()
+
+        assert store.load().last_ip == "10.0.0.2"
+
+    def test_async_save_supersedes_pending_debounced_save(self, tmp_path: Path) -> None:
+        """A pending debounced save does not land after a later async save."""
+        store = PreferencesStore(tmp_path / "preferences.json")
+
+        first = UserPreferences()
+        first.last_ip = "10.0.0.1"
+        store.save_debounced(first, delay=0.05)
+        second = UserPreferences()
+        second.last_ip = "10.0.0.2"
+        store.save_async(second).result(timeout=5.0)
+        time.sleep(0.15)
+        store.flush()
+
+        assert store.load().last_ip == "10.0.0.2"
+
+    def test_flush_raises_unawaited_write_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed write whose future was discarded is raised by the next flush()."""
+        store = PreferencesStore(tmp_path / "preferences.json")
+        real_write = store._write
+        calls: list[bytes] = []
+
+        def write_failing_once(content: bytes, durable: bool) -> None:
+            calls.append(content)
+            if len(calls) == 1:
+                raise OSError("disk gone")
+            real_write(content, durable)
+
+        monkeypatch.setattr(store, "_write", write_failing_once)
+
+        wait([store.save_async(UserPreferences())])
+        store.save_async(UserPreferences()).result(timeout=5.0)
+        with pytest.raises(OSError, match="disk gone"):
+            store.flush()
+        store.flush()
+
+    def test_error_raised_by_save_is_not_raised_again(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """flush() does not repeat an error save() already raised."""
+        store = PreferencesStore(tmp_path / "preferences.json")
+
+        def write_failing(content: bytes, durable: bool) -> None:
+            raise OSError("disk gone")
+
+        monkeypatch.setattr(store, "_write", write_failing)
+
+        with pytest.raises(OSError):
+            store.save(UserPreferences())
+        store.flush()
+
+    def test_close_shuts_down_writer(self, tmp_path: Path) -> None:
+        """close() writes pending saves and stops the executor; later saves still work."""
+        prefs_path = tmp_path / "preferences.json"
+        store = PreferencesStore(prefs_path)
+
+        prefs = UserPreferences()
+        prefs.last_ip = "10.0.0.1"
+        store.save_async(prefs)
+        executor = store._executor
+        store.close()
+
+        assert store.load().last_ip == "10.0.0.1"
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+        prefs.last_ip = "10.0.0.2"
+        store.save(prefs)
+        assert store.load().last_ip == "10.0.0.2"
+        store.close()
+
+    def test_durable_save_fsyncs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """fsync is only called when durable=True."""
+        calls: list[int] = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: (calls.append(fd), real_fsync(fd)))
+        store = PreferencesStore(tmp_path / "preferences.json")
+
+        store.save(UserPreferences())
+        assert calls == []
+
+        store.save(UserPreferences(), durable=True)
+        assert len(calls) >= 1
+
+
 class TestEnums:
     """Tests for preference enum types."""
 
@@ -1,5 +1,13 @@
 """Tests for RDT, TCP, and HTTP protocol implementations."""
 
+import asyncio
+import contextlib
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Iterator, Optional
+
+import numpy as np
 import pytest
 from pathlib import Path
 
@@ -12,7 +20,13 @@ from gsdv.protocols.tcp_cmd import (
     build_transform_request,
     parse_calinfo_response,
 )
-from gsdv.protocols.http_calibration import parse_calibration_xml
+from gsdv.protocols.http_calibration import (
+    HttpCalibrationError,
+    _calibration_cache_path,
+    get_calibration_async,
+    get_calibration_cached,
+    parse_calibration_xml,
+)
 
 
 class TestSampleRecord:
@@ -214,6 +228,24 @@ class TestCalibrationInfo:
         )
         assert cal1 == cal2
 
+    def test_convert_counts_batch_matches_per_sample(self) -> None:
+        """convert_counts_batch matches convert_counts_to_si row by row."""
+        cal = CalibrationInfo(counts_per_force=1000000.0, counts_per_torque=500000.0)
+        counts = np.array(
+            [[1000000, -2000000, 500000, 250000, -500000, 1000000],
+             [0, 1, -1, 2, -2, 3]],
+            dtype=np.int32,
+        )
+
+        force_N, torque_Nm = cal.convert_counts_batch(counts)
+
+        assert force_N.shape == (2, 3)
+        assert torque_Nm.shape == (2, 3)
+        for row, f, t in zip(counts, force_N, torque_Nm):
+            expected_f, expected_t = cal.convert_counts_to_si(row)
+            np.testing.assert_allclose(f, expected_f)
+            np.testing.assert_allclose(t, expected_t)
+
 
 class TestRdtUdp:
     """Tests for UDP RDT streaming protocol."""
@@ -363,3 +395,117 @@ class TestHttpCalibration:
         assert cal.firmware_version == "1.0.0"
         assert cal.force_units_code == 2
         assert cal.torque_units_code == 3
+
+    def test_get_calibration_async_from_local_server(self) -> None:
+        """get_calibration_async fetches and parses calibration over HTTP."""
+        xml_content = Path("tests/fixtures/netftapi2.xml").read_bytes()
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1 200 OK\r\nConnection: close\r\n\r\n" + xml_content)
+            await writer.drain()
+            writer.close()
+
+        async def run() -> CalibrationInfo:
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await get_calibration_async("127.0.0.1", port, timeout=2.0)
+
+        cal = asyncio.run(run())
+
+        assert cal.counts_per_force == 1000000.0
+        assert cal.serial_number == "FT12345"
+
+    def test_get_calibration_async_connection_refused(self) -> None:
+        """get_calibration_async raises HttpCalibrationError when nothing is listening."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        with pytest.raises(HttpCalibrationError):
+            asyncio.run(get_calibration_async("127.0.0.1", port, timeout=1.0))
+
+
+@contextlib.contextmanager
+def _calibration_server(etag: Optional[str]) -> Iterator[tuple[int, list[Optional[str]]]]:
+    """Serve the fixture calibration XML with an optional ETag.
+
+    Yields the port and a list collecting each request's If-None-Match header.
+    """
+    xml_content = Path("tests/fixtures/netftapi2.xml").read_bytes()
+    seen: list[Optional[str]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if_none_match = self.headers.get("If-None-Match")
+            seen.append(if_none_match)
+            if etag is not None and if_none_match == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            if etag is not None:
+                self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(xml_content)))
+            self.end_headers()
+            self.wfile.write(xml_content)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1], seen
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestCalibrationCache:
+    """Tests for get_calibration_cached()."""
+
+    def test_revalidates_with_etag(self, tmp_path: Path) -> None:
+        """Second fetch sends If-None-Match and uses the cached XML on 304."""
+        with _calibration_server(etag='"v1"') as (port, seen):
+            first = get_calibration_cached("127.0.0.1", port, timeout=2.0, cache_dir=tmp_path)
+            second = get_calibration_cached("127.0.0.1", port, timeout=2.0, cache_dir=tmp_path)
+
+        assert seen == [None, '"v1"']
+        assert first == second
+        assert second.serial_number == "FT12345"
+
+    def test_response_without_validators_is_not_cached(self, tmp_path: Path) -> None:
+        """Responses without ETag/Last-Modified are always downloaded."""
+        with _calibration_server(etag=None) as (port, seen):
+            get_calibration_cached("127.0.0.1", port, timeout=2.0, cache_dir=tmp_path)
+            get_calibration_cached("127.0.0.1", port, timeout=2.0, cache_dir=tmp_path)
+
+        assert seen == [None, None]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_corrupt_cache_is_ignored(self, tmp_path: Path) -> None:
+        """An unreadable cache entry falls back to an unconditional fetch."""
+        with _calibration_server(etag='"v1"') as (port, seen):
+            (tmp_path / f"127.0.0.1_{port}.json").write_text("not json")
+            cal = get_calibration_cached("127.0.0.1", port, timeout=2.0, cache_dir=tmp_path)
+
+        assert seen == [None]
+        assert cal.counts_per_force == 1000000.0
+
+    @pytest.mark.parametrize(
+        "ip", ["../x", "..\\x", "/etc/passwd", "sensor.local", "fe80::1%../x"]
+    )
+    def test_cache_path_stays_in_cache_dir(self, tmp_path: Path, ip: str) -> None:
+        """Addresses that are not plain IPs never escape the cache directory."""
+        path = _calibration_cache_path(tmp_path, ip, 80)
+
+        assert path.parent == tmp_path
+        assert "/" not in path.name and "\\" not in path.name
+
+    def test_cache_path_uses_ip_address(self, tmp_path: Path) -> None:
+        """Plain IPv4 and IPv6 addresses keep a readable file name."""
+        assert _calibration_cache_path(tmp_path, "192.168.1.1", 80).name == "192.168.1.1_80.json"
+        assert _calibration_cache_path(tmp_path, "fe80::1", 80).name == "fe80__1_80.json"
@@ -24,6 +24,8 @@ from gsdv.protocols.rdt_udp import (
     parse_rdt_response,
 )
 
+from tests.helpers import recvfrom_into
+
 
 class TestRdtCommand:
     """Tests for RDT command enum values."""
@@ -281,6 +283,24 @@ class TestRdtClientWithMockedSocket:
         assert header == RDT_HEADER
         assert command == RdtCommand.START_REALTIME
 
+    @patch("socket.socket")
+    def test_receive_buffer_falls_back_to_rcvbuf(self, mock_socket_class: MagicMock) -> None:
+        mock_sock = MagicMock()
+        mock_socket_class.return_value = mock_sock
+        mock_sock.getsockopt.return_value = 425984
+
+        def setsockopt(level: int, option: int, value: int) -> None:
+            if option == getattr(socket, "SO_RCVBUFFORCE", None):
+                raise PermissionError("CAP_NET_ADMIN required")
+
+        mock_sock.setsockopt.side_effect = setsockopt
+
+        client = RdtClient("192.168.1.100", receive_buffer_size=1_000_000)
+        client.start_streaming()
+
+        mock_sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_RCVBUF, 1_000_000)
+        assert client.effective_receive_buffer_size == 425984
+
     @patch("socket.socket")
     def test_start_streaming_sets_streaming_flag(self, mock_socket_class: MagicMock) -> None:
         mock_sock = MagicMock()
@@ -336,7 +356,7 @@ class TestRdtClientWithMockedSocket:
         mock_socket_class.return_value = mock_sock
 
         response = self._build_response(rdt_seq=1, ft_seq=100, status=0, fx=10, fy=20, fz=30, tx=40, ty=50, tz=60)
-        mock_sock.recvfrom.side_effect = [(response, ("192.168.1.100", RDT_PORT)), socket.timeout()]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into([(response, ("192.168.1.100", RDT_PORT)), socket.timeout()])
 
         client = RdtClient("192.168.1.100")
         samples = list(client.receive_samples(timeout=0.1))
@@ -357,7 +377,7 @@ class TestRdtClientWithMockedSocket:
         responses = [
             (self._build_response(rdt_seq=i), ("192.168.1.100", RDT_PORT)) for i in range(10)
         ]
-        mock_sock.recvfrom.side_effect = responses
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(responses)
 
         client = RdtClient("192.168.1.100")
         samples = list(client.receive_samples(max_samples=3))
@@ -372,7 +392,7 @@ class TestRdtClientWithMockedSocket:
         responses = [
             (self._build_response(rdt_seq=i), ("192.168.1.100", RDT_PORT)) for i in range(5)
         ]
-        mock_sock.recvfrom.side_effect = responses + [socket.timeout()]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(responses + [socket.timeout()])
 
         client = RdtClient("192.168.1.100")
         list(client.receive_samples(timeout=0.1))
@@ -394,7 +414,7 @@ class TestSequenceGapDetection:
         responses = [
             (self._build_response(rdt_seq=i), ("192.168.1.100", RDT_PORT)) for i in range(5)
         ]
-        mock_sock.recvfrom.side_effect = responses + [socket.timeout()]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(responses + [socket.timeout()])
 
         client = RdtClient("192.168.1.100")
         list(client.receive_samples(timeout=0.1))
@@ -411,7 +431,7 @@ class TestSequenceGapDetection:
             (self._build_response(rdt_seq=0), ("192.168.1.100", RDT_PORT)),
             (self._build_response(rdt_seq=2), ("192.168.1.100", RDT_PORT)),
         ]
-        mock_sock.recvfrom.side_effect = responses + [socket.timeout()]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(responses + [socket.timeout()])
 
         client = RdtClient("192.168.1.100")
         list(client.receive_samples(timeout=0.1))
@@ -428,7 +448,7 @@ class TestSequenceGapDetection:
             (self._build_response(rdt_seq=0), ("192.168.1.100", RDT_PORT)),
             (self._build_response(rdt_seq=100), ("192.168.1.100", RDT_PORT)),
         ]
-        mock_sock.recvfrom.side_effect = responses + [socket.timeout()]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(responses + [socket.timeout()])
 
         client = RdtClient("192.168.1.100")
         list(client.receive_samples(timeout=0.1))
@@ -446,7 +466,7 @@ class TestSequenceGapDetection:
             (self._build_response(rdt_seq=0xFFFFFFFF), ("192.168.1.100", RDT_PORT)),
             (self._build_response(rdt_seq=1), ("192.168.1.100", RDT_PORT)),
         ]
-        mock_sock.recvfrom.side_effect = responses + [socket.timeout()]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(responses + [socket.timeout()])
 
         client = RdtClient("192.168.1.100")
         list(client.receive_samples(timeout=0.1))
@@ -464,7 +484,7 @@ class TestSequenceGapDetection:
             (self._build_response(rdt_seq=3), ("192.168.1.100", RDT_PORT)),
             (self._build_response(rdt_seq=10), ("192.168.1.100", RDT_PORT)),
         ]
-        mock_sock.recvfrom.side_effect = responses + [socket.timeout()]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(responses + [socket.timeout()])
 
         client = RdtClient("192.168.1.100")
         list(client.receive_samples(timeout=0.1))
@@ -480,7 +500,7 @@ class TestSequenceGapDetection:
         responses = [
             (self._build_response(rdt_seq=1000), ("192.168.1.100", RDT_PORT)),
         ]
-        mock_sock.recvfrom.side_effect = responses + [socket.timeout()]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(responses + [socket.timeout()])
 
         client = RdtClient("192.168.1.100")
         list(client.receive_samples(timeout=0.1))
@@ -533,7 +553,7 @@ class TestRdtClientCleanup:
             (struct.pack(RESPONSE_FORMAT, i, 0, 0, 0, 0, 0, 0, 0, 0), ("192.168.1.100", RDT_PORT))
             for i in [0, 5]  # Gap of 4
         ]
-        mock_sock.recvfrom.side_effect = responses + [socket.timeout()]
+        mock_sock.recvfrom_into.side_effect = recvfrom_into(responses + [socket.timeout()])
 
         client = RdtClient("192.168.1.100")
         list(client.receive_samples(timeout=0.1))
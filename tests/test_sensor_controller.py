@@ -0,0 +1,182 @@
+"""Tests for SensorController wiring to the acquisition engine."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gsdv.acquisition import AcquisitionState, AcquisitionStats, RingBufferStats
+from gsdv.controller import ConnectionState, SensorController
+from gsdv.models import CalibrationInfo, SampleRecord
+
+
+def _sample(seq: int) -> SampleRecord:
+    return SampleRecord(
+        t_monotonic_ns=seq * 1_000_000,
+        rdt_sequence=seq,
+        ft_sequence=seq,
+        status=0,
+        counts=(seq, 0, 0, 0, 0, 0),
+    )
+
+
+def _stats(
+    packets_received: int,
+    *,
+    state: AcquisitionState = AcquisitionState.RUNNING,
+    receive_errors: int = 0,
+) -> AcquisitionStats:
+    return AcquisitionStats(
+        state=state,
+        buffer_stats=RingBufferStats(capacity=100, size=0, total_written=0, overwrites=0),
+        packets_received=packets_received,
+        packets_lost=0,
+        receive_errors=receive_errors,
+        samples_per_second=0.0,
+    )
+
+
+@pytest.fixture
+def engine() -> Iterator[MagicMock]:
+    """Stubbed AcquisitionEngine handed to the controller on connect."""
+    stub = MagicMock()
+    cal = CalibrationInfo(counts_per_force=1000000.0, counts_per_torque=1000000.0)
+    with (
+        patch("gsdv.controller.sensor_controller.AcquisitionEngine", return_value=stub) as cls,
+        patch("gsdv.controller.sensor_controller.get_calibration_with_fallback", return_value=cal),
+        patch("gsdv.controller.sensor_controller.BiasService"),
+    ):
+        stub.constructor = cls
+        stub.stats.return_value = _stats(0)
+        yield stub
+
+
+@pytest.fixture
+def controller(qtbot, engine: MagicMock) -> Iterator[SensorController]:
+    ctrl = SensorController()
+    ctrl.connect_to_sensor("192.168.1.100")
+    yield ctrl
+    ctrl.disconnect_from_sensor()
+
+
+def _batch_callback(engine: MagicMock):
+    engine.set_sample_batch_callback.assert_called_once()
+    return engine.set_sample_batch_callback.call_args.args[0]
+
+
+class TestSensorControllerSamples:
+    """Samples flow from the engine's batch callback to drain_samples()."""
+
+    def test_connect_creates_engine_and_registers_batch_callback(
+        self, controller: SensorController, engine: MagicMock
+    ) -> None:
+        assert controller.state == ConnectionState.CONNECTED
+        engine.constructor.assert_called_once_with("192.168.1.100")
+        assert callable(_batch_callback(engine))
+        engine.start.assert_called_once()
+
+    def test_drain_returns_batches_in_order(
+        self, controller: SensorController, engine: MagicMock
+    ) -> None:
+        callback = _batch_callback(engine)
+        # The engine calls back from its own thread
+        worker = threading.Thread(
+            target=lambda: [callback([_sample(i), _sample(i + 1)]) for i in range(0, 10, 2)]
+        )
+        worker.start()
+        worker.join()
+
+        assert [s.rdt_sequence for s in controller.drain_samples()] == list(range(10))
+        assert controller.drain_samples() == []
+
+    def test_samples_available_reports_waiting_count(
+        self, qtbot, controller: SensorController, engine: MagicMock
+    ) -> None:
+        _batch_callback(engine)([_sample(i) for i in range(3)])
+
+        with qtbot.waitSignal(controller.samples_available, timeout=1000) as blocker:
+            pass
+
+        assert blocker.args == [3]
+
+
+class TestSensorControllerStatistics:
+    """statistics_updated is driven by polling engine.stats()."""
+
+    def test_statistics_emitted_at_most_10hz(
+        self, qtbot, controller: SensorController, engine: MagicMock
+    ) -> None:
+        # Engine counters change on every read, as they would at 1 kHz
+        counter = iter(range(0, 10**9, 100))
+        engine.stats.side_effect = lambda: _stats(next(counter))
+
+        emitted: list[tuple[int, int, float]] = []
+        controller.statistics_updated.connect(lambda *args: emitted.append(args))
+        qtbot.wait(550)
+
+        assert 3 <= len(emitted) <= 6
+        assert [received for received, _, _ in emitted] == sorted(
+            received for received, _, _ in emitted
+        )
+
+    def test_receive_errors_reported_once_each(
+        self, qtbot, controller: SensorController, engine: MagicMock
+    ) -> None:
+        engine.stats.return_value = _stats(10, receive_errors=2)
+
+        errors: list[tuple[str, str]] = []
+        controller.error_occurred.connect(lambda code, msg: errors.append((code, msg)))
+        qtbot.wait(350)
+
+        assert len(errors) == 1
+        assert errors[0][0] == "ACQ-001"
+        assert "2 receive error" in errors[0][1]
+
+    def test_engine_leaving_running_state_is_an_error(
+        self, qtbot, controller: SensorController, engine: MagicMock
+    ) -> None:
+        engine.stats.return_value = _stats(10, state=AcquisitionState.STOPPED)
+
+        qtbot.waitUntil(lambda: controller.state == ConnectionState.ERROR, timeout=1000)
+
+
+class TestSensorControllerRate:
+    """The displayed sample rate is an EMA over statistics polls."""
+
+    @staticmethod
+    def _poll(
+        controller: SensorController, engine: MagicMock, now_ns: int, packets: int
+    ) -> float:
+        engine.stats.return_value = _stats(packets)
+        emitted: list[float] = []
+        controller.statistics_updated.connect(lambda received, lost, rate: emitted.append(rate))
+        with patch("gsdv.controller.sensor_controller.time.monotonic_ns", return_value=now_ns):
+            controller._poll_stats()
+        controller.statistics_updated.disconnect()
+        return emitted[-1]
+
+    @pytest.fixture
+    def manual(self, controller: SensorController) -> SensorController:
+        # Drive polls by hand with a fake clock starting at 0
+        controller._stats_timer.stop()
+        controller._last_stats_time_ns = 0
+        return controller
+
+    def test_first_interval_seeds_rate(self, manual: SensorController, engine: MagicMock) -> None:
+        assert self._poll(manual, engine, 100_000_000, 100) == pytest.approx(1000.0)
+
+    def test_rate_decays_toward_zero_without_new_packets(
+        self, manual: SensorController, engine: MagicMock
+    ) -> None:
+        self._poll(manual, engine, 100_000_000, 100)
+
+        rates = [
+            self._poll(manual, engine, (tick + 2) * 100_000_000, 100) for tick in range(40)
+        ]
+
+        assert rates == sorted(rates, reverse=True)
+        assert rates[0] == pytest.approx(800.0)
+        assert rates[-1] < 1.0
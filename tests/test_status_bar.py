@@ -153,3 +153,31 @@ class TestStatusBarPoller:
 
         assert target.warning_message is None
         assert target.clear_warning_calls > 0
+
+    def test_applies_only_changed_values(self) -> None:
+        QCoreApplication.instance() or QCoreApplication([])
+
+        target = _FakeStatusBarTarget()
+        snapshots = [
+            StatusBarSnapshot(
+                sample_rate_hz=1000.0,
+                buffer_fill_percent=10.0,
+                packets_lost=0,
+                dropped_by_app=0,
+                warning_message=None,
+            )
+        ]
+
+        poller = StatusBarPoller(
+            target=target, snapshot_provider=lambda: snapshots[-1], interval_ms=10
+        )
+        poller.start()
+        _run_event_loop_ms(50)
+        target.sample_rate_hz = None
+        snapshots.append(replace(snapshots[-1], buffer_fill_percent=20.0))
+        _run_event_loop_ms(50)
+        poller.stop()
+
+        assert target.clear_warning_calls == 1
+        assert target.sample_rate_hz is None
+        assert target.buffer_fill_percent == 20.0